@@ -0,0 +1,99 @@
+"""add llm_grading_decisions cache table
+
+Why this change: the ``run_llm_grading`` activity calls the model for every
+grading request, even when identical evidence is graded against the same
+rubric again. Decisions are now cached by (task id, rubric hash, evidence
+item hashes, model deployment) so a repeat submission skips the model call.
+
+Schema effect:
+- Creates ``llm_grading_decisions`` keyed by the hashed ``cache_key`` with the
+  decision JSON, its provenance columns and an ``expires_at`` TTL.
+- Indexes ``expires_at`` for the reconciler's expired-row prune. The table is
+  new and empty, so the index is built in the same transaction.
+- Grants the verification Functions role SELECT/INSERT/UPDATE/DELETE on the
+  new table only.
+
+Rollback notes: downgrade drops the table (its grants and index go with it).
+Cached decisions are disposable; the next grading request recomputes them.
+
+Revision ID: 0056_add_llm_grading_decisions
+Revises: 0055_drop_legacy_curriculum_contract
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+revision: str = "0056_add_llm_grading_decisions"
+down_revision: str | None = "0055_drop_legacy_curriculum_contract"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _verification_functions_role() -> str | None:
+    role = os.environ.get("POSTGRES_VERIFICATION_FUNCTIONS_ROLE")
+    if not role:
+        return None
+    if not (role[0].isalpha() or role[0] == "_") or not all(
+        char.isalnum() or char == "_" for char in role
+    ):
+        raise RuntimeError(
+            f"POSTGRES_VERIFICATION_FUNCTIONS_ROLE is not a valid identifier: {role!r}"
+        )
+    return role
+
+
+def _grant_functions_role() -> None:
+    role = _verification_functions_role()
+    if not role:
+        return
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = '{role}') THEN
+                GRANT SELECT, INSERT, UPDATE, DELETE
+                ON llm_grading_decisions
+                TO "{role}";
+            END IF;
+        END $$;
+        """
+    )
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '1min'")
+
+    op.create_table(
+        "llm_grading_decisions",
+        sa.Column("cache_key", sa.Text(), nullable=False),
+        sa.Column("task_id", sa.Text(), nullable=False),
+        sa.Column("rubric_hash", sa.Text(), nullable=False),
+        sa.Column("model_deployment", sa.Text(), nullable=False),
+        sa.Column("decision", JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key", name="pk_llm_grading_decisions"),
+    )
+    op.create_index(
+        "ix_llm_grading_decisions_expires_at",
+        "llm_grading_decisions",
+        ["expires_at"],
+    )
+
+    _grant_functions_role()
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '1min'")
+
+    op.drop_table("llm_grading_decisions")
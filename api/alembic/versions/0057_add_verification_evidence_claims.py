@@ -0,0 +1,106 @@
+"""add verification_evidence_claims claim-check table
+
+Why this change: the verify activity's result carries evidence bundles and
+grading request prompts through every later orchestration hop, so Durable
+re-serializes them into history at each step and replays them on every
+orchestrator wake-up. With ``CLAIM_CHECK__ENABLED`` the activity writes them
+once to this table and the orchestration carries only references.
+
+Schema effect:
+- Creates ``verification_evidence_claims`` keyed by ``(attempt_id,
+  content_hash)`` with the item ``kind`` and its JSON ``payload``. The
+  attempt FK cascades so account deletion removes claims too.
+- Grants the verification Functions role SELECT/INSERT/DELETE on the new
+  table only.
+
+Rollback notes: downgrade drops the table (its grants go with it). Disable
+``CLAIM_CHECK__ENABLED`` first so in-flight orchestrations stop producing
+references; attempts already holding references fail grading and are
+terminalized as server errors.
+
+Revision ID: 0057_add_verification_evidence_claims
+Revises: 0056_add_llm_grading_decisions
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+revision: str = "0057_add_verification_evidence_claims"
+down_revision: str | None = "0056_add_llm_grading_decisions"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _verification_functions_role() -> str | None:
+    role = os.environ.get("POSTGRES_VERIFICATION_FUNCTIONS_ROLE")
+    if not role:
+        return None
+    if not (role[0].isalpha() or role[0] == "_") or not all(
+        char.isalnum() or char == "_" for char in role
+    ):
+        raise RuntimeError(
+            f"POSTGRES_VERIFICATION_FUNCTIONS_ROLE is not a valid identifier: {role!r}"
+        )
+    return role
+
+
+def _grant_functions_role() -> None:
+    role = _verification_functions_role()
+    if not role:
+        return
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = '{role}') THEN
+                GRANT SELECT, INSERT, DELETE
+                ON verification_evidence_claims
+                TO "{role}";
+            END IF;
+        END $$;
+        """
+    )
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '1min'")
+
+    op.create_table(
+        "verification_evidence_claims",
+        sa.Column("attempt_id", sa.Uuid(), nullable=False),
+        sa.Column("content_hash", sa.Text(), nullable=False),
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("payload", JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "kind IN ('evidence', 'grading_request')",
+            name="ck_verification_evidence_claims_kind",
+        ),
+        sa.ForeignKeyConstraint(
+            ["attempt_id"],
+            ["verification_attempts.id"],
+            name="fk_verification_evidence_claims_attempt_id",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "attempt_id", "content_hash", name="pk_verification_evidence_claims"
+        ),
+    )
+
+    _grant_functions_role()
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '1min'")
+
+    op.drop_table("verification_evidence_claims")
@@ -0,0 +1,247 @@
+"""move verification attempt JSONB payloads to a companion table (expand)
+
+Why this change: ``requirement_snapshot`` and ``feedback_json`` are the only
+large values on ``verification_attempts``, yet the gating, progress and
+reconciler reads that scan the table never use them. Moving them to
+``verification_attempt_payloads`` keeps attempt rows narrow; only prepare and
+card rendering join the payload table.
+
+This is an EXPAND step. The legacy columns stay, and releases before this one
+keep writing them, so a temporary trigger mirrors those writes into the new
+table. Releases from this one on write snapshots only to the payload table.
+Their finalize writes feedback to both the payload table and the legacy
+``feedback_json`` column, because the previous API release still renders
+cards from the inline column. A later contract revision drops the trigger,
+that dual write and the legacy columns.
+
+Schema effect:
+- Creates ``verification_attempt_payloads`` keyed by ``attempt_id``, with an
+  FK to the attempt that cascades on delete.
+- Drops ``ck_verification_attempts_submitted_snapshot_present``. New
+  submitted attempts keep their snapshot in the payload table.
+- Installs ``mirror_attempt_payloads``. On attempt INSERT it copies both
+  payloads. On an UPDATE of ``feedback_json`` it upserts only the feedback,
+  which is all the Functions role may write.
+- Backfills existing payloads in keyset batches of ``_BACKFILL_BATCH`` rows.
+  Each batch commits on its own, so the backfill takes no long-held locks.
+  Mirrored rows already present win via ``ON CONFLICT DO NOTHING``.
+  A failed backfill leaves the revision unstamped. Every step above is
+  idempotent, so rerunning the upgrade resumes the copy.
+- Grants the Functions role SELECT on the payload table, plus INSERT
+  (``attempt_id``, ``feedback_json``) and UPDATE (``feedback_json``) for the
+  finalize upsert. The role can never write a requirement snapshot.
+
+Deploy order: run this revision, then deploy Functions, then the API. New
+Functions releases read snapshots from the payload table, which the trigger
+fills for attempts created by the previous API release. Attempts they
+finalize before the API deploy keep their feedback in the legacy column as
+well, so the previous API release still shows it.
+
+Rollback notes: downgrade copies payloads back into the legacy columns,
+re-adds and validates the snapshot CHECK, then drops the trigger and the
+table.
+
+Revision ID: 0058_split_verification_attempt_payloads
+Revises: 0057_add_verification_evidence_claims
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import context, op
+
+revision: str = "0058_split_verification_attempt_payloads"
+down_revision: str | None = "0057_add_verification_evidence_claims"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_MIRROR_FUNCTION = "mirror_attempt_payloads"
+_MIRROR_TRIGGER = "trg_mirror_attempt_payloads"
+_SNAPSHOT_CHECK = "ck_verification_attempts_submitted_snapshot_present"
+_BACKFILL_BATCH = 5000
+
+_BACKFILL_SQL = """
+    WITH batch AS (
+        SELECT id, requirement_snapshot, feedback_json
+        FROM verification_attempts
+        WHERE id > :after
+          AND (requirement_snapshot IS NOT NULL OR feedback_json IS NOT NULL)
+        ORDER BY id
+        LIMIT :batch
+    ),
+    copied AS (
+        INSERT INTO verification_attempt_payloads
+            (attempt_id, requirement_snapshot, feedback_json)
+        SELECT id, requirement_snapshot, feedback_json FROM batch
+        ON CONFLICT (attempt_id) DO NOTHING
+    )
+    SELECT (SELECT id FROM batch ORDER BY id DESC LIMIT 1)
+"""
+
+
+def _verification_functions_role() -> str | None:
+    role = os.environ.get("POSTGRES_VERIFICATION_FUNCTIONS_ROLE")
+    if not role:
+        return None
+    if not (role[0].isalpha() or role[0] == "_") or not all(
+        char.isalnum() or char == "_" for char in role
+    ):
+        raise RuntimeError(
+            f"POSTGRES_VERIFICATION_FUNCTIONS_ROLE is not a valid identifier: {role!r}"
+        )
+    return role
+
+
+def _grant_functions_role() -> None:
+    role = _verification_functions_role()
+    if not role:
+        return
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = '{role}') THEN
+                GRANT SELECT ON verification_attempt_payloads TO "{role}";
+                GRANT INSERT (attempt_id, feedback_json)
+                    ON verification_attempt_payloads TO "{role}";
+                GRANT UPDATE (feedback_json)
+                    ON verification_attempt_payloads TO "{role}";
+            END IF;
+        END $$;
+        """
+    )
+
+
+def _install_mirror_trigger() -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {_MIRROR_FUNCTION}()
+        RETURNS trigger AS $$
+        BEGIN
+            IF (TG_OP = 'INSERT') THEN
+                INSERT INTO verification_attempt_payloads
+                    (attempt_id, requirement_snapshot, feedback_json)
+                VALUES (NEW.id, NEW.requirement_snapshot, NEW.feedback_json)
+                ON CONFLICT (attempt_id) DO NOTHING;
+            ELSIF (NEW.feedback_json IS DISTINCT FROM OLD.feedback_json) THEN
+                INSERT INTO verification_attempt_payloads
+                    (attempt_id, feedback_json)
+                VALUES (NEW.id, NEW.feedback_json)
+                ON CONFLICT (attempt_id)
+                DO UPDATE SET feedback_json = EXCLUDED.feedback_json;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(f"DROP TRIGGER IF EXISTS {_MIRROR_TRIGGER} ON verification_attempts")
+    op.execute(
+        f"""
+        CREATE TRIGGER {_MIRROR_TRIGGER}
+        AFTER INSERT OR UPDATE OF feedback_json ON verification_attempts
+        FOR EACH ROW
+        WHEN (NEW.requirement_snapshot IS NOT NULL OR NEW.feedback_json IS NOT NULL)
+        EXECUTE FUNCTION {_MIRROR_FUNCTION}();
+        """
+    )
+
+
+def _backfill_payloads() -> None:
+    """Copy legacy payloads in committed keyset batches."""
+    if context.is_offline_mode():
+        op.execute(
+            """
+            INSERT INTO verification_attempt_payloads
+                (attempt_id, requirement_snapshot, feedback_json)
+            SELECT id, requirement_snapshot, feedback_json
+            FROM verification_attempts
+            WHERE requirement_snapshot IS NOT NULL OR feedback_json IS NOT NULL
+            ON CONFLICT (attempt_id) DO NOTHING
+            """
+        )
+        return
+
+    bind = op.get_bind()
+    backfill = sa.text(_BACKFILL_SQL).bindparams(sa.bindparam("after", type_=sa.Uuid()))
+    with op.get_context().autocommit_block():
+        op.execute("SET statement_timeout = '1min'")
+        try:
+            after = UUID(int=0)
+            while after is not None:
+                after = bind.execute(
+                    backfill, {"after": after, "batch": _BACKFILL_BATCH}
+                ).scalar_one()
+        finally:
+            op.execute("RESET statement_timeout")
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '1min'")
+
+    op.create_table(
+        "verification_attempt_payloads",
+        sa.Column("attempt_id", sa.Uuid(), nullable=False),
+        sa.Column("requirement_snapshot", JSONB(), nullable=True),
+        sa.Column("feedback_json", JSONB(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["attempt_id"],
+            ["verification_attempts.id"],
+            name="fk_verification_attempt_payloads_attempt_id",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("attempt_id", name="pk_verification_attempt_payloads"),
+        if_not_exists=True,
+    )
+    op.drop_constraint(
+        _SNAPSHOT_CHECK, "verification_attempts", type_="check", if_exists=True
+    )
+    _install_mirror_trigger()
+    _grant_functions_role()
+
+    _backfill_payloads()
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '5min'")
+
+    op.execute(f"DROP TRIGGER IF EXISTS {_MIRROR_TRIGGER} ON verification_attempts")
+    op.execute(f"DROP FUNCTION IF EXISTS {_MIRROR_FUNCTION}()")
+    op.execute(
+        """
+        UPDATE verification_attempts AS a
+        SET requirement_snapshot = coalesce(
+                a.requirement_snapshot, p.requirement_snapshot
+            ),
+            feedback_json = coalesce(p.feedback_json, a.feedback_json)
+        FROM verification_attempt_payloads AS p
+        WHERE p.attempt_id = a.id
+        """
+    )
+    op.execute(
+        f"""
+        ALTER TABLE verification_attempts
+        ADD CONSTRAINT {_SNAPSHOT_CHECK}
+        CHECK (
+            snapshot_source = 'reconstructed'
+            OR (
+                requirement_snapshot IS NOT NULL
+                AND requirement_snapshot_hash IS NOT NULL
+            )
+        ) NOT VALID
+        """
+    )
+    op.execute(
+        f"ALTER TABLE verification_attempts VALIDATE CONSTRAINT {_SNAPSHOT_CHECK}"
+    )
+    op.drop_table("verification_attempt_payloads")
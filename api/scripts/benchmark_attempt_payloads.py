@@ -0,0 +1,315 @@
+"""Benchmark hot attempt reads with inline vs split JSONB payloads.
+
+Builds a throwaway ``payload_benchmark`` schema holding the same synthetic
+attempts twice: once with ``requirement_snapshot``/``feedback_json`` inline on
+the attempt row (the layout before revision 0058) and once split into an
+attempt table plus ``attempt_payloads``. Each hot read then runs under
+``EXPLAIN (ANALYZE, BUFFERS)`` against both layouts, and the script prints the
+median execution time and shared buffers touched. The schema is dropped
+afterwards unless ``--keep`` is given.
+
+Examples:
+    uv run python scripts/benchmark_attempt_payloads.py
+    uv run python scripts/benchmark_attempt_payloads.py --attempts 200000 \
+        --payload-chunks 8 --keep
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from urllib.parse import urlsplit
+
+from learn_to_cloud_shared.core.config import get_migration_settings
+from learn_to_cloud_shared.core.database import create_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+SCHEMA = "payload_benchmark"
+REQUIREMENTS_PER_USER = 20
+
+_ATTEMPT_COLUMNS = """
+    id uuid PRIMARY KEY,
+    user_id bigint NOT NULL,
+    requirement_uuid uuid NOT NULL,
+    snapshot_source text NOT NULL,
+    submission_value_kind text NOT NULL,
+    submitted_value text NOT NULL,
+    outcome text,
+    validation_message text,
+    completed_at timestamptz,
+    created_at timestamptz NOT NULL,
+    updated_at timestamptz NOT NULL
+"""
+
+_SETUP = (
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"""
+    CREATE TABLE {SCHEMA}.attempts_inline (
+        {_ATTEMPT_COLUMNS},
+        requirement_snapshot jsonb,
+        feedback_json jsonb
+    )
+    """,
+    f"CREATE TABLE {SCHEMA}.attempts_split ({_ATTEMPT_COLUMNS})",
+    f"""
+    CREATE TABLE {SCHEMA}.attempt_payloads (
+        attempt_id uuid PRIMARY KEY
+            REFERENCES {SCHEMA}.attempts_split (id) ON DELETE CASCADE,
+        requirement_snapshot jsonb,
+        feedback_json jsonb
+    )
+    """,
+)
+
+# One synthetic attempt per series row. md5 chunks keep the JSON roughly
+# incompressible, so pglz cannot hide the payload size from the heap.
+_POPULATE_INLINE = f"""
+    INSERT INTO {SCHEMA}.attempts_inline
+    SELECT
+        md5('attempt' || g)::uuid,
+        g % :users,
+        md5('requirement' || (g / :users) % {REQUIREMENTS_PER_USER})::uuid,
+        'submitted',
+        'github_url',
+        'https://github.com/learner/repo',
+        CASE g % 10
+            WHEN 0 THEN NULL
+            WHEN 1 THEN 'failed'
+            WHEN 2 THEN 'server_error'
+            ELSE 'succeeded'
+        END,
+        NULL,
+        CASE WHEN g % 10 = 0 THEN NULL ELSE now() END,
+        now() - make_interval(secs => g),
+        now(),
+        jsonb_build_object('tasks', chunks.body),
+        CASE WHEN g % 10 = 0 THEN NULL
+             ELSE jsonb_build_array(jsonb_build_object('message', chunks.body))
+        END
+    FROM generate_series(1, :attempts) AS g
+    CROSS JOIN LATERAL (
+        SELECT string_agg(md5(g::text || '-' || n), '') AS body
+        FROM generate_series(1, :chunks) AS n
+    ) AS chunks
+"""
+
+_POPULATE_SPLIT = (
+    f"""
+    INSERT INTO {SCHEMA}.attempts_split
+    SELECT id, user_id, requirement_uuid, snapshot_source,
+           submission_value_kind, submitted_value, outcome,
+           validation_message, completed_at, created_at, updated_at
+    FROM {SCHEMA}.attempts_inline
+    """,
+    f"""
+    INSERT INTO {SCHEMA}.attempt_payloads
+    SELECT id, requirement_snapshot, feedback_json
+    FROM {SCHEMA}.attempts_inline
+    """,
+)
+
+_INDEXES = tuple(
+    statement
+    for table in ("attempts_inline", "attempts_split")
+    for statement in (
+        f"CREATE INDEX ON {SCHEMA}.{table} "
+        "(user_id, requirement_uuid, created_at DESC)",
+        f"CREATE INDEX ON {SCHEMA}.{table} (user_id, requirement_uuid) "
+        "WHERE outcome = 'succeeded'",
+        f"CREATE UNIQUE INDEX ON {SCHEMA}.{table} (user_id, requirement_uuid, id) "
+        "WHERE outcome IS NULL",
+    )
+)
+
+# (name, inline SQL, split SQL). The split variants join payloads only where
+# the application does: card rendering.
+_QUERIES: tuple[tuple[str, str, str], ...] = (
+    (
+        "succeeded_uuids",
+        f"""
+        SELECT DISTINCT requirement_uuid FROM {SCHEMA}.attempts_inline
+        WHERE user_id = :user_id AND outcome = 'succeeded'
+        """,
+        f"""
+        SELECT DISTINCT requirement_uuid FROM {SCHEMA}.attempts_split
+        WHERE user_id = :user_id AND outcome = 'succeeded'
+        """,
+    ),
+    (
+        "latest_terminal_cards",
+        f"""
+        SELECT DISTINCT ON (requirement_uuid)
+            id, requirement_uuid, outcome, feedback_json, created_at
+        FROM {SCHEMA}.attempts_inline
+        WHERE user_id = :user_id AND outcome IS NOT NULL
+        ORDER BY requirement_uuid, created_at DESC
+        """,
+        f"""
+        SELECT latest.*, p.feedback_json
+        FROM (
+            SELECT DISTINCT ON (requirement_uuid)
+                id, requirement_uuid, outcome, created_at
+            FROM {SCHEMA}.attempts_split
+            WHERE user_id = :user_id AND outcome IS NOT NULL
+            ORDER BY requirement_uuid, created_at DESC
+        ) AS latest
+        LEFT JOIN {SCHEMA}.attempt_payloads AS p ON p.attempt_id = latest.id
+        """,
+    ),
+    (
+        "count_active",
+        f"SELECT count(*) FROM {SCHEMA}.attempts_inline WHERE outcome IS NULL",
+        f"SELECT count(*) FROM {SCHEMA}.attempts_split WHERE outcome IS NULL",
+    ),
+    (
+        "requirement_stats_scan",
+        f"""
+        SELECT requirement_uuid, count(*) FILTER (WHERE outcome = 'succeeded')
+        FROM {SCHEMA}.attempts_inline GROUP BY requirement_uuid
+        """,
+        f"""
+        SELECT requirement_uuid, count(*) FILTER (WHERE outcome = 'succeeded')
+        FROM {SCHEMA}.attempts_split GROUP BY requirement_uuid
+        """,
+    ),
+)
+
+
+async def _build(conn: AsyncConnection, args: argparse.Namespace) -> None:
+    params = {
+        "attempts": args.attempts,
+        "users": args.users,
+        "chunks": args.payload_chunks,
+    }
+    for statement in (*_SETUP, _POPULATE_INLINE, *_POPULATE_SPLIT, *_INDEXES):
+        await conn.execute(text(statement), params)
+    for table in ("attempts_inline", "attempts_split", "attempt_payloads"):
+        await conn.execute(text(f"VACUUM ANALYZE {SCHEMA}.{table}"))
+
+
+async def _print_sizes(conn: AsyncConnection) -> None:
+    rows = await conn.execute(
+        text(
+            """
+            SELECT c.relname,
+                   pg_size_pretty(pg_relation_size(c.oid)) AS heap,
+                   pg_size_pretty(pg_total_relation_size(c.oid)) AS total
+            FROM pg_class AS c
+            JOIN pg_namespace AS n ON n.oid = c.relnamespace
+            WHERE n.nspname = :schema AND c.relkind = 'r'
+            ORDER BY c.relname
+            """
+        ),
+        {"schema": SCHEMA},
+    )
+    for row in rows:
+        print(f"{row.relname:<18} heap={row.heap:>10} total={row.total:>10}")
+
+
+async def _explain(
+    conn: AsyncConnection, sql: str, user_id: int, iterations: int
+) -> tuple[float, int]:
+    timings: list[float] = []
+    buffers = 0
+    for _ in range(iterations):
+        raw = await conn.scalar(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"),
+            {"user_id": user_id},
+        )
+        [plan] = json.loads(raw) if isinstance(raw, str) else raw
+        timings.append(plan["Execution Time"])
+        top = plan["Plan"]
+        buffers = top.get("Shared Hit Blocks", 0) + top.get("Shared Read Blocks", 0)
+    return statistics.median(timings), buffers
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    engine = create_engine(get_migration_settings().database)
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("SET statement_timeout = 0"))
+            print(f"Building {args.attempts} attempts in schema {SCHEMA}...")
+            await _build(conn, args)
+            await _print_sizes(conn)
+            user_id = args.users // 2
+            for name, inline_sql, split_sql in _QUERIES:
+                for layout, sql in (("inline", inline_sql), ("split", split_sql)):
+                    elapsed, buffers = await _explain(
+                        conn, sql, user_id, args.iterations
+                    )
+                    print(
+                        f"{name:<24} {layout:<7} "
+                        f"median={elapsed:9.2f}ms buffers={buffers}"
+                    )
+            if not args.keep:
+                await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    finally:
+        await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare hot attempt reads with inline vs split payloads.",
+    )
+    parser.add_argument(
+        "--attempts",
+        type=int,
+        default=1_000_000,
+        help="Synthetic attempts to generate (default: 1000000).",
+    )
+    parser.add_argument(
+        "--users",
+        type=int,
+        default=50_000,
+        help="Distinct learners the attempts are spread over (default: 50000).",
+    )
+    parser.add_argument(
+        "--payload-chunks",
+        type=int,
+        default=24,
+        help="32-byte md5 chunks per JSON payload (default: 24, about 800B).",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=5,
+        help="EXPLAIN ANALYZE runs per query and layout (default: 5).",
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help=f"Keep the {SCHEMA} schema for manual inspection.",
+    )
+    return parser.parse_args()
+
+
+def _is_local_database(url: str) -> bool:
+    """True when the URL points at a development database host."""
+    host = urlsplit(url).hostname or ""
+    return host in {"localhost", "127.0.0.1", "::1", "db", "postgres"}
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_migration_settings()
+    if settings.database.use_azure_postgres or not _is_local_database(
+        settings.database.url
+    ):
+        print(
+            "Refusing to run: the configured database is not a local development "
+            "host. This script builds and drops a benchmark schema.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Benchmark JSONB-heavy attempt reads under each database JSON codec.
+
+Seeds one synthetic user with terminal attempts whose payload rows carry
+large ``feedback_json`` and ``requirement_snapshot`` values, then times
+``get_latest_terminal_for_requirements`` and ``get_prepare_state`` with every
+``DATABASE__JSON_CODEC`` option. The seeded rows are deleted afterwards.
+
+Examples:
+    uv run python scripts/benchmark_jsonb_reads.py
+    uv run python scripts/benchmark_jsonb_reads.py --requirements 40 \
+        --feedback-items 200 --iterations 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+from uuid import UUID, uuid4
+
+from learn_to_cloud_shared.core.config import (
+    DatabaseConfig,
+    JsonCodec,
+    get_migration_settings,
+)
+from learn_to_cloud_shared.core.database import create_engine
+from learn_to_cloud_shared.models import (
+    User,
+    VerificationAttempt,
+    VerificationAttemptPayload,
+    utcnow,
+)
+from learn_to_cloud_shared.repositories.verification_attempt_repository import (
+    VerificationAttemptRepository,
+)
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+BENCHMARK_USER_ID = 990_000_001
+
+
+def _feedback(items: int) -> list[dict]:
+    return [
+        {
+            "task_id": f"task-{index}",
+            "passed": index % 3 != 0,
+            "message": "Checked the workflow and deployment evidence. " * 8,
+            "details": {"files": [f"src/module_{n}.py" for n in range(10)]},
+        }
+        for index in range(items)
+    ]
+
+
+def _snapshot(requirement_uuid: UUID, items: int) -> dict:
+    return {
+        "uuid": str(requirement_uuid),
+        "slug": "benchmark-requirement",
+        "tasks": [
+            {"id": f"task-{index}", "criteria": ["criterion " * 12] * 4}
+            for index in range(items)
+        ],
+    }
+
+
+async def _seed(settings: DatabaseConfig, requirements: int, items: int) -> list[UUID]:
+    engine = create_engine(settings)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    requirement_uuids = [uuid4() for _ in range(requirements)]
+    try:
+        async with session_maker() as db:
+            db.add(User(id=BENCHMARK_USER_ID, github_username="jsonb-benchmark"))
+            attempt_ids = [uuid4() for _ in requirement_uuids]
+            for attempt_id, requirement_uuid in zip(
+                attempt_ids, requirement_uuids, strict=True
+            ):
+                db.add(
+                    VerificationAttempt(
+                        id=attempt_id,
+                        user_id=BENCHMARK_USER_ID,
+                        requirement_uuid=requirement_uuid,
+                        snapshot_source="submitted",
+                        requirement_snapshot_hash="benchmark",
+                        submission_value_kind="github_url",
+                        submitted_value="https://github.com/jsonb-benchmark/repo",
+                        outcome="failed",
+                        completed_at=utcnow(),
+                    )
+                )
+            await db.flush()
+            for attempt_id, requirement_uuid in zip(
+                attempt_ids, requirement_uuids, strict=True
+            ):
+                db.add(
+                    VerificationAttemptPayload(
+                        attempt_id=attempt_id,
+                        requirement_snapshot=_snapshot(requirement_uuid, items),
+                        feedback_json=_feedback(items),
+                    )
+                )
+            await db.commit()
+    finally:
+        await engine.dispose()
+    return requirement_uuids
+
+
+async def _cleanup(settings: DatabaseConfig) -> None:
+    engine = create_engine(settings)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(delete(User).where(User.id == BENCHMARK_USER_ID))
+    finally:
+        await engine.dispose()
+
+
+async def _time_codec(
+    settings: DatabaseConfig, requirement_uuids: list[UUID], iterations: int
+) -> dict[str, list[float]]:
+    engine = create_engine(settings)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    timings: dict[str, list[float]] = {"latest_terminal": [], "prepare_state": []}
+    try:
+        async with session_maker() as db:
+            repo = VerificationAttemptRepository(db)
+            cards = await repo.get_latest_terminal_for_requirements(
+                BENCHMARK_USER_ID, requirement_uuids
+            )
+            attempt_id = cards[0].id
+            for _ in range(iterations):
+                started = time.perf_counter()
+                await repo.get_latest_terminal_for_requirements(
+                    BENCHMARK_USER_ID, requirement_uuids
+                )
+                timings["latest_terminal"].append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                await repo.get_prepare_state(attempt_id)
+                timings["prepare_state"].append(time.perf_counter() - started)
+    finally:
+        await engine.dispose()
+    return timings
+
+
+async def run_benchmark(requirements: int, items: int, iterations: int) -> None:
+    base = get_migration_settings().database
+    await _cleanup(base)
+    requirement_uuids = await _seed(base, requirements, items)
+    try:
+        for codec in JsonCodec:
+            settings = base.model_copy(update={"json_codec": codec})
+            timings = await _time_codec(settings, requirement_uuids, iterations)
+            for query, samples in timings.items():
+                print(
+                    f"{codec.value:>14} {query:<16} "
+                    f"median={statistics.median(samples) * 1000:7.2f}ms "
+                    f"p95={statistics.quantiles(samples, n=20)[-1] * 1000:7.2f}ms"
+                )
+    finally:
+        await _cleanup(base)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time JSONB-heavy attempt reads under each JSON codec.",
+    )
+    parser.add_argument(
+        "--requirements",
+        type=int,
+        default=20,
+        help="Terminal attempts to seed, one per requirement (default: 20).",
+    )
+    parser.add_argument(
+        "--feedback-items",
+        type=int,
+        default=100,
+        help="Entries per feedback_json and snapshot task list (default: 100).",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=50,
+        help="Timed reads per query and codec (default: 50).",
+    )
+    return parser.parse_args()
+
+
+def _is_local_database(url: str) -> bool:
+    """True when the URL points at a development database host."""
+    host = urlsplit(url).hostname or ""
+    return host in {"localhost", "127.0.0.1", "::1", "db", "postgres"}
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_migration_settings()
+    if settings.database.use_azure_postgres or not _is_local_database(
+        settings.database.url
+    ):
+        print(
+            "Refusing to run: the configured database is not a local development "
+            "host. This script seeds and deletes benchmark rows.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+
+    asyncio.run(
+        run_benchmark(
+            requirements=args.requirements,
+            items=args.feedback_items,
+            iterations=args.iterations,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,17 +15,20 @@ from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from learn_to_cloud_shared.content_catalog import get_curriculum_catalog
 from learn_to_cloud_shared.core.azure_auth import close_credential
-from learn_to_cloud_shared.core.config import get_web_settings
+from learn_to_cloud_shared.core.config import DatabaseConfig, get_web_settings
 from learn_to_cloud_shared.core.database import (
     create_engine,
     create_session_maker,
     dispose_engine,
     init_db,
+    warm_pool,
 )
 from learn_to_cloud_shared.core.github_client import close_github_client
 from learn_to_cloud_shared.core.logger import configure_logging
 from learn_to_cloud_shared.core.observability import configure_observability
+from learn_to_cloud_shared.progress_reads import prepare_progress_reads
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.middleware.sessions import SessionMiddleware
 
 from learn_to_cloud.core.auth import init_oauth
@@ -110,6 +113,16 @@ async def validation_exception_handler(
     )
 
 
+async def _init_and_warm_db(engine: AsyncEngine, settings: DatabaseConfig) -> None:
+    await init_db(engine, settings)
+    if settings.pool_warmup:
+        await warm_pool(
+            engine,
+            settings,
+            prepare=prepare_progress_reads if settings.pool_warmup_prepare else None,
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: fastapi.FastAPI):
     """Create DB engine at startup, dispose on shutdown."""
@@ -140,7 +153,7 @@ async def lifespan(app: fastapi.FastAPI):
         settings = app.state.settings
         async with asyncio.timeout(settings.startup_timeout):
             oauth_task = asyncio.to_thread(init_oauth, settings.oauth)
-            db_task = init_db(app.state.engine, settings.database)
+            db_task = _init_and_warm_db(app.state.engine, settings.database)
             await asyncio.gather(oauth_task, db_task)
 
         app.state.init_done = True
@@ -32,6 +32,9 @@ from learn_to_cloud_shared.submission_derivation import (
     derive_submission_value,
     is_derivable,
 )
+from learn_to_cloud_shared.verification_attempt_executor import (
+    run_verification_attempt_inline,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -56,6 +59,7 @@ from learn_to_cloud.services.durable_verification_client import (
 from learn_to_cloud.services.steps_service import (
     StepValidationError,
     complete_step,
+    set_steps_completed,
     uncomplete_step,
 )
 from learn_to_cloud.services.submissions_service import (
@@ -69,7 +73,10 @@ from learn_to_cloud.services.submissions_service import (
 from learn_to_cloud.services.users_service import (
     UserNotFoundError,
     delete_user_account,
-    get_user_by_id,
+    get_user_profile,
+)
+from learn_to_cloud.services.verification_admission import (
+    VerificationQueueFullError,
 )
 from learn_to_cloud.services.verification_status_tokens import (
     VerificationStatusToken,
@@ -300,7 +307,7 @@ async def _render_step_toggle(
     db: DbSession,
 ) -> HTMLResponse:
     """Shared rendering for step complete/uncomplete HTMX responses."""
-    user = await get_user_by_id(db, user_id)
+    user = await get_user_profile(db, user_id)
 
     total_steps = len(topic.learning_steps)
     progress = build_progress_dict(len(completed_step_uuids), total_steps)
@@ -373,6 +380,57 @@ async def htmx_uncomplete_step(
     return await _render_step_toggle(request, user_id, topic, step, completed, db)
 
 
+@router.post("/steps/batch", response_class=HTMLResponse)
+async def htmx_set_steps_completed(
+    request: Request,
+    db: DbSession,
+    user_id: UserId,
+    step_uuids: Annotated[list[UUID], Form()],
+    completed: Annotated[bool, Form()],
+) -> HTMLResponse:
+    """Complete or uncomplete several steps and swap every affected partial.
+
+    Each step partial and the progress bar are returned as out-of-band swaps,
+    so the caller can use ``hx-swap="none"``.
+    """
+    try:
+        topic, steps, completed_uuids = await set_steps_completed(
+            db, user_id, step_uuids, completed=completed
+        )
+    except StepValidationError as e:
+        add_span_event(
+            "step_batch_invalid",
+            {
+                "user_id": user_id,
+                "step_count": len(step_uuids),
+                "error": str(e),
+            },
+        )
+        response = HTMLResponse("")
+        response.headers["HX-Refresh"] = "true"
+        return response
+
+    user = await get_user_profile(db, user_id)
+    progress = build_progress_dict(len(completed_uuids), len(topic.learning_steps))
+
+    step_template = templates.get_template("partials/topic_step.html")
+    steps_html = "".join(
+        step_template.render(
+            request=request,
+            step=step,
+            completed_steps=completed_uuids,
+            user=user,
+            oob=True,
+        )
+        for step in steps
+    )
+    progress_html = templates.get_template("partials/topic_progress.html").render(
+        progress=progress
+    )
+
+    return HTMLResponse(steps_html + progress_html)
+
+
 @router.post("/github/submit", response_class=HTMLResponse)
 @limiter.limit("10/minute")
 async def htmx_submit_verification(
@@ -385,10 +443,11 @@ async def htmx_submit_verification(
 ) -> HTMLResponse:
     """Submit a hands-on verification.
 
-    Every submission type runs through Durable Functions:
     :func:`create_verification_attempt` validates the request and creates a
-    ``VerificationAttempt``; we start the versioned attempt orchestration and
-    return a spinner card that polls for status.
+    ``VerificationAttempt``, or turns it away with a retry hint when too many
+    attempts are already in flight. Local token checks are then verified
+    in-request; every other type starts the versioned attempt orchestration
+    and returns a spinner card that polls for status.
     """
     user_id = current_user.user_id
     github_username = current_user.github_username
@@ -470,6 +529,18 @@ async def htmx_submit_verification(
         )
     except _USER_FACING_ERRORS as exc:
         return _render_card(error_banner=str(exc))
+    except VerificationQueueFullError as exc:
+        logger.warning(
+            "htmx.submit.queue_full",
+            extra={
+                "user_id": user_id,
+                "requirement_slug": requirement_slug,
+                "retry_after_seconds": exc.retry_after_seconds,
+            },
+        )
+        response = _render_card(error_banner=str(exc))
+        response.headers["Retry-After"] = str(exc.retry_after_seconds)
+        return response
     except Exception as exc:
         record_span_exception(exc)
         logger.exception(
@@ -498,6 +569,15 @@ async def htmx_submit_verification(
         },
     )
 
+    if attempt_submission.inline:
+        return await _run_inline_attempt_and_render(
+            session_maker=session_maker,
+            user_id=user_id,
+            requirement_slug=requirement_slug,
+            attempt_submission=attempt_submission,
+            render_card=_render_card,
+        )
+
     return await _start_async_attempt_and_render(
         session_maker=session_maker,
         user_id=user_id,
@@ -507,6 +587,63 @@ async def htmx_submit_verification(
     )
 
 
+async def _run_inline_attempt_and_render(
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+    user_id: int,
+    requirement_slug: str,
+    attempt_submission: VerificationAttemptSubmission,
+    render_card: Callable[..., HTMLResponse],
+) -> HTMLResponse:
+    """Verify a local-only attempt in the request and reload the card.
+
+    Inline profiles finish in microseconds, so there is no orchestration to
+    start or status to poll: the attempt is prepared, verified, and finalized
+    through the same compare-and-set path, then the page reloads to show the
+    result. A concurrent duplicate submit (``created=False``) just reloads
+    and shows whatever the first request recorded.
+    """
+    if attempt_submission.created:
+        try:
+            state = await run_verification_attempt_inline(
+                attempt_submission.attempt_id,
+                session_maker=session_maker,
+            )
+        except Exception as exc:
+            # The attempt stays active; the stale-attempt reconciler
+            # terminalizes it once Durable reports no matching instance.
+            record_span_exception(exc)
+            logger.exception(
+                "htmx.submit.inline_verification_failed",
+                extra={
+                    "user_id": user_id,
+                    "requirement_slug": requirement_slug,
+                    "attempt_id": str(attempt_submission.attempt_id),
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return render_card(
+                server_error=True,
+                server_error_message=_DURABLE_TERMINAL_ERROR_MESSAGE,
+            )
+
+        extra = {
+            "user_id": user_id,
+            "requirement_slug": requirement_slug,
+            "attempt_id": str(attempt_submission.attempt_id),
+            "runtime_status": "inline",
+            "outcome": state.outcome,
+            "error_code": state.error_code,
+            "terminal_source": state.terminal_source,
+        }
+        if state.outcome == "server_error":
+            logger.warning("verification.attempt.completed", extra=extra)
+        else:
+            logger.info("verification.attempt.completed", extra=extra)
+
+    return HTMLResponse(_reload_verification_html())
+
+
 async def _start_async_attempt_and_render(
     *,
     session_maker: async_sessionmaker[AsyncSession],
@@ -14,7 +14,6 @@ from learn_to_cloud_shared.content_service import (
     get_phase_by_slug,
 )
 from learn_to_cloud_shared.core.database import DbSession
-from learn_to_cloud_shared.models import User
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     VerificationAttemptRepository,
 )
@@ -39,7 +38,7 @@ from learn_to_cloud.services.dashboard_service import get_dashboard_data
 from learn_to_cloud.services.progress_service import fetch_phase_progress
 from learn_to_cloud.services.steps_service import get_valid_completed_steps
 from learn_to_cloud.services.submissions_service import get_phase_submission_context
-from learn_to_cloud.services.users_service import get_user_by_id
+from learn_to_cloud.services.users_service import UserProfile, get_user_profile
 from learn_to_cloud.services.verification_status_tokens import (
     create_verification_status_token,
 )
@@ -49,15 +48,15 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["pages"], include_in_schema=False)
 
 
-async def _get_user_or_none(db: DbSession, user_id: int | None) -> User | None:
-    """Get user from DB if authenticated, else None."""
+async def _get_user_or_none(db: DbSession, user_id: int | None) -> UserProfile | None:
+    """Get the cached user profile if authenticated, else None."""
     if user_id is None:
         return None
-    return await get_user_by_id(db, user_id)
+    return await get_user_profile(db, user_id)
 
 
 def _template_context(
-    request: Request, user: User | None = None, **kwargs: object
+    request: Request, user: UserProfile | None = None, **kwargs: object
 ) -> dict:
     """Build common template context."""
     return {
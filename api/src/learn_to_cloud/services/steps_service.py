@@ -1,5 +1,6 @@
 """Learning-step completion service."""
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -66,14 +67,16 @@ async def complete_step(
 
     Returns the (result, parent topic, set of completed step UUIDs in
     that topic) tuple so the HTMX caller can re-render the step partial
-    and the topic progress bar without re-loading the curriculum.
+    and the topic progress bar without re-loading the curriculum. The
+    insert and the completed-set read share one round trip.
     """
     topic, step = _find_step(step_uuid)
 
     completed_at = utcnow()
-    completion = await LearnerStepCompletionRepository(db).create_if_not_exists(
+    write = await LearnerStepCompletionRepository(db).create_many_returning_completed(
         user_id=user_id,
-        step_uuid=step.uuid,
+        step_uuids=[step.uuid],
+        candidate_step_uuids=(s.uuid for s in topic.learning_steps),
         completed_at=completed_at,
     )
 
@@ -82,31 +85,19 @@ async def complete_step(
     span.set_attribute("step.slug", step.slug)
     span.set_attribute("topic.slug", topic.slug)
     span.set_attribute("step.order", step.order)
-
-    completed = await get_valid_completed_steps(db, user_id, topic)
-
-    if completion is None:
-        span.set_attribute("step.action", "already_completed")
-        return (
-            StepCompletionResult(
-                topic_slug=topic.slug,
-                step_slug=step.slug,
-                completed_at=utcnow(),
-            ),
-            topic,
-            completed,
-        )
-
-    span.set_attribute("step.action", "completed")
+    span.set_attribute(
+        "step.action",
+        "completed" if step.uuid in write.changed else "already_completed",
+    )
 
     return (
         StepCompletionResult(
             topic_slug=topic.slug,
             step_slug=step.slug,
-            completed_at=completion.completed_at,
+            completed_at=completed_at,
         ),
         topic,
-        completed,
+        write.completed,
     )
 
 
@@ -117,15 +108,18 @@ async def uncomplete_step(
 ) -> tuple[int, "Topic", LearningStep, set[UUID]]:
     """Mark a single learning step as incomplete.
 
-    Only removes the specified step -- does not cascade.
+    Only removes the specified step -- does not cascade. The delete and the
+    completed-set read share one round trip.
 
     Raises:
         StepNotFoundError: If step_uuid doesn't exist in active content.
     """
     topic, step = _find_step(step_uuid)
 
-    deleted = await LearnerStepCompletionRepository(db).delete(
-        user_id=user_id, step_uuid=step.uuid
+    write = await LearnerStepCompletionRepository(db).delete_many_returning_completed(
+        user_id=user_id,
+        step_uuids=[step.uuid],
+        candidate_step_uuids=(s.uuid for s in topic.learning_steps),
     )
 
     span = trace.get_current_span()
@@ -135,6 +129,59 @@ async def uncomplete_step(
     span.set_attribute("step.order", step.order)
     span.set_attribute("step.action", "uncompleted")
 
-    completed = await get_valid_completed_steps(db, user_id, topic)
+    return len(write.changed), topic, step, write.completed
+
+
+async def set_steps_completed(
+    db: AsyncSession,
+    user_id: int,
+    step_uuids: Sequence[UUID],
+    *,
+    completed: bool,
+) -> tuple["Topic", list[LearningStep], set[UUID]]:
+    """Complete or uncomplete several steps of one topic in a single write.
+
+    Used by the topic page's bulk "check all" / "uncheck all" actions: one
+    bulk INSERT (or DELETE) that also returns the topic's completions,
+    however many steps.
+
+    Returns the parent topic, the affected steps in topic order, and the
+    completed step UUIDs in that topic.
+
+    Raises:
+        StepNotFoundError: If any step_uuid doesn't exist in active content.
+        StepValidationError: If no steps are given or they span topics.
+    """
+    if not step_uuids:
+        raise StepValidationError("No steps given")
+
+    resolved = [_find_step(step_uuid) for step_uuid in dict.fromkeys(step_uuids)]
+    topic = resolved[0][0]
+    if any(step_topic.uuid != topic.uuid for step_topic, _ in resolved):
+        raise StepValidationError("Steps must belong to a single topic")
+
+    requested = {step.uuid for _, step in resolved}
+    steps = [step for step in topic.learning_steps if step.uuid in requested]
+    candidates = [step.uuid for step in topic.learning_steps]
+
+    repo = LearnerStepCompletionRepository(db)
+    if completed:
+        write = await repo.create_many_returning_completed(
+            user_id=user_id,
+            step_uuids=requested,
+            candidate_step_uuids=candidates,
+            completed_at=utcnow(),
+        )
+    else:
+        write = await repo.delete_many_returning_completed(
+            user_id=user_id,
+            step_uuids=requested,
+            candidate_step_uuids=candidates,
+        )
+
+    span = trace.get_current_span()
+    span.set_attribute("topic.slug", topic.slug)
+    span.set_attribute("step.count", len(steps))
+    span.set_attribute("step.action", "completed" if completed else "uncompleted")
 
-    return deleted, topic, step, completed
+    return topic, steps, write.completed
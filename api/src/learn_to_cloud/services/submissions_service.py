@@ -14,14 +14,14 @@ from dataclasses import dataclass
 from uuid import UUID, uuid4
 
 from learn_to_cloud_shared.content_catalog import get_curriculum_catalog
-from learn_to_cloud_shared.progress_reads import are_all_requirements_succeeded
+from learn_to_cloud_shared.core.config import get_web_settings
+from learn_to_cloud_shared.progress_reads import read_submission_gate
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     AttemptAlreadyValidatedError,
     VerificationAttemptRepository,
 )
 from learn_to_cloud_shared.requirements import (
     RequirementIndex,
-    get_prerequisite_phase,
     load_requirement_index,
 )
 from learn_to_cloud_shared.schemas import (
@@ -31,6 +31,7 @@ from learn_to_cloud_shared.schemas import (
     SubmissionData,
 )
 from learn_to_cloud_shared.submission_values import SubmittedValue
+from learn_to_cloud_shared.verification.engine import runs_inline
 from learn_to_cloud_shared.verification.execution import (
     attempt_to_submission_data,
 )
@@ -42,6 +43,8 @@ from learn_to_cloud_shared.verification_attempt_snapshot import (
 from opentelemetry.propagate import inject
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from learn_to_cloud.services.verification_admission import check_admission
+
 
 async def get_phase_submission_context(
     db: AsyncSession,
@@ -137,14 +140,20 @@ class _PreValidationContext:
 
     requirement: HandsOnRequirement
     phase_order: int
+    active_attempt_id: UUID | None = None
 
 
 @dataclass(frozen=True, slots=True)
 class VerificationAttemptSubmission:
-    """Result of creating or reusing a verification attempt."""
+    """Result of creating or reusing a verification attempt.
+
+    ``inline`` is ``True`` when the attempt's profile runs in-request rather
+    than through a Durable orchestration.
+    """
 
     attempt_id: UUID
     created: bool
+    inline: bool = False
 
 
 def _current_traceparent() -> str | None:
@@ -164,11 +173,12 @@ async def _check_submission_preconditions(
 
     Validates requirement existence, already-validated status, and phase gating.
 
-    Opens a short-lived DB session for the learner-state reads (existing
-    attempt and prior-phase verification), then releases it before returning.
-    ``create_or_get_active`` still re-checks "already succeeded" under its
-    advisory lock, so this is a fast-fail before the heavier snapshot work,
-    not the only guard against a duplicate validated submission.
+    Opens a short-lived DB session for one learner-state read (existing
+    succeeded/active attempt and prior-phase verification), then releases it
+    before returning. ``create_or_get_active`` still re-checks "already
+    succeeded" in its insert, so this is a fast-fail before the heavier
+    snapshot work, not the only guard against a duplicate validated
+    submission.
     """
     index = load_requirement_index()
     requirement = index.by_slug.get(requirement_slug)
@@ -181,33 +191,32 @@ async def _check_submission_preconditions(
             f"Requirement not mapped to a phase: {requirement_slug}"
         )
 
+    gate = index.gate_for_phase(phase_order)
     async with session_maker() as read_session:
-        already_succeeded = await are_all_requirements_succeeded(
-            read_session, user_id, [requirement.uuid]
+        state = await read_submission_gate(
+            read_session,
+            user_id,
+            requirement.uuid,
+            gate.requirement_uuids if gate is not None else (),
         )
-        if already_succeeded:
-            raise AlreadyValidatedError("You have already completed this requirement.")
-
-        # Sequential phase gating
-        prereq_phase = get_prerequisite_phase(phase_order)
-        if prereq_phase is not None:
-            prereq_req_uuids = index.requirement_uuids_for_phase(prereq_phase)
-            if prereq_req_uuids:
-                all_done = await are_all_requirements_succeeded(
-                    read_session, user_id, prereq_req_uuids
-                )
-                if not all_done:
-                    raise PriorPhaseNotCompleteError(
-                        f"You must complete all Phase {prereq_phase} "
-                        f"verifications before submitting for Phase {phase_order}.",
-                        prerequisite_phase=prereq_phase,
-                    )
 
     # read_session is now closed — connection returned to pool
 
+    if state.already_succeeded:
+        raise AlreadyValidatedError("You have already completed this requirement.")
+
+    # Sequential phase gating
+    if gate is not None and not state.prerequisites_met:
+        raise PriorPhaseNotCompleteError(
+            f"You must complete all Phase {gate.prerequisite_phase} "
+            f"verifications before submitting for Phase {phase_order}.",
+            prerequisite_phase=gate.prerequisite_phase,
+        )
+
     return _PreValidationContext(
         requirement=requirement,
         phase_order=phase_order,
+        active_attempt_id=state.active_attempt_id,
     )
 
 
@@ -220,14 +229,16 @@ async def create_verification_attempt(
 ) -> VerificationAttemptSubmission:
     """Validate request preconditions and create the unified verification attempt.
 
-    Every submission type runs through Durable Functions. This validates the
-    request, then -- inside one transaction, guarded by a transaction-scoped
-    Postgres advisory lock on ``(user_id, requirement_uuid)`` -- creates or
-    reuses the authoritative ``VerificationAttempt`` row.
+    This validates the request, then creates or reuses the authoritative
+    ``VerificationAttempt`` row with a single conditional insert. The result
+    says whether the attempt runs inline (local token checks) or through
+    Durable Functions.
 
-    The advisory lock serializes concurrent submits for the same
-    requirement so two racing requests can never both pass the active/succeeded
-    checks and create two active attempts.
+    The active-attempt partial unique index on ``(user_id, requirement_uuid)``
+    makes two racing requests converge on one active attempt rather than
+    creating two. A new Durable attempt must also pass global admission
+    control, which raises :class:`VerificationQueueFullError` when too many
+    attempts are already in flight.
     """
     ctx = await _check_submission_preconditions(
         session_maker,
@@ -240,6 +251,20 @@ async def create_verification_attempt(
     except ValueError as exc:
         raise InvalidSubmittedValueError(str(exc)) from exc
 
+    inline = (
+        get_web_settings().verification_functions.inline_local_profiles
+        and runs_inline(ctx.requirement.submission_type)
+    )
+
+    # A resubmit while an attempt is in flight reuses it, exactly as
+    # ``create_or_get_active`` would, without opening a write transaction.
+    if ctx.active_attempt_id is not None:
+        return VerificationAttemptSubmission(
+            attempt_id=ctx.active_attempt_id, created=False, inline=inline
+        )
+    if not inline:
+        await check_admission(session_maker)
+
     catalog = get_curriculum_catalog()
     requirement_snapshot = build_requirement_snapshot(ctx.requirement)
     requirement_snapshot_hash = compute_snapshot_hash(requirement_snapshot)
@@ -271,7 +296,9 @@ async def create_verification_attempt(
 
         await write_session.commit()
 
-    return VerificationAttemptSubmission(attempt_id=attempt.id, created=created)
+    return VerificationAttemptSubmission(
+        attempt_id=attempt.id, created=created, inline=inline
+    )
 
 
 # Synthetic user id for the read-only smoke check. It is never a real
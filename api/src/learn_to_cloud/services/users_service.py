@@ -1,7 +1,9 @@
 """User service for user-related business logic."""
 
 import logging
+from dataclasses import dataclass
 
+from cachetools import TTLCache
 from learn_to_cloud_shared.models import User
 from learn_to_cloud_shared.repositories.user_repository import UserRepository
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +11,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class UserProfile:
+    """Display-only user projection rendered by the navbar and page headers."""
+
+    id: int
+    github_username: str
+    first_name: str | None
+    last_name: str | None
+    avatar_url: str | None
+
+
+# Nearly every authenticated page renders the navbar avatar and username, so
+# the projection is cached per process instead of re-read on each request.
+# Profile fields only change at login (OAuth upsert) or account deletion, both
+# of which evict locally; the TTL bounds staleness on the other replicas.
+_PROFILE_CACHE: TTLCache[int, UserProfile] = TTLCache(maxsize=4096, ttl=300)
+
+
 def normalize_github_username(username: str | None) -> str | None:
     """Normalize GitHub username to lowercase for consistency.
 
@@ -35,6 +55,40 @@ async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
     return await user_repo.get_by_id(user_id)
 
 
+async def get_user_profile(db: AsyncSession, user_id: int) -> UserProfile | None:
+    """Get the cached display projection for a user, or None if not found.
+
+    Missing users are not cached so a first login is visible immediately.
+    """
+    cached = _PROFILE_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+
+    user = await get_user_by_id(db, user_id)
+    if user is None:
+        return None
+
+    profile = UserProfile(
+        id=user.id,
+        github_username=user.github_username,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        avatar_url=user.avatar_url,
+    )
+    _PROFILE_CACHE[user_id] = profile
+    return profile
+
+
+def invalidate_user_profile(user_id: int) -> None:
+    """Drop a user's cached display projection."""
+    _PROFILE_CACHE.pop(user_id, None)
+
+
+def clear_user_profile_cache() -> None:
+    """Drop every cached display projection (tests and admin tooling)."""
+    _PROFILE_CACHE.clear()
+
+
 async def get_or_create_user_from_github(
     db: AsyncSession,
     *,
@@ -62,6 +116,7 @@ async def get_or_create_user_from_github(
         avatar_url=avatar_url,
         github_username=normalized_username,
     )
+    invalidate_user_profile(github_id)
 
     logger.info(
         "user.upserted",
@@ -94,6 +149,7 @@ async def delete_user_account(db: AsyncSession, user_id: int) -> None:
 
     github_username = user.github_username
     await user_repo.delete(user_id)
+    invalidate_user_profile(user_id)
 
     logger.info(
         "user.account_deleted",
@@ -0,0 +1,95 @@
+"""Global admission control for Durable verification submissions.
+
+``create_or_get_active`` bounds attempts per (user, requirement), but nothing
+else bounds how many run at once. During deadline spikes every new attempt
+starts another orchestration and spends more of the shared GitHub quota, so
+once ``ADMISSION__MAX_ACTIVE_ATTEMPTS`` attempts are active new submissions
+are turned away with a retry hint instead. The active count is cached per API
+instance for ``ADMISSION__COUNT_TTL_SECONDS`` so a burst of submits costs one
+count query, not one each. That makes the limit soft: each instance can admit
+one TTL's worth of submits past it before its cached count catches up.
+
+The count is read, and exported as the ``verification.attempts.active``
+gauge, even while the limit is disabled, so operators can see queue depth
+before choosing a threshold.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from learn_to_cloud_shared.core.config import get_web_settings
+from learn_to_cloud_shared.repositories.verification_attempt_repository import (
+    VerificationAttemptRepository,
+)
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class VerificationQueueFullError(Exception):
+    """Raised when too many attempts are in flight to start another."""
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            "Verification is busy right now, so this submission was not "
+            f"started. Please try again in {retry_after_seconds} seconds."
+        )
+
+
+@dataclass(slots=True)
+class _ActiveCount:
+    value: int | None = None
+    read_at: float = 0.0
+
+
+_active = _ActiveCount()
+
+
+def _observe_active(options: CallbackOptions) -> Iterable[Observation]:
+    if _active.value is None:
+        return []
+    return [Observation(_active.value)]
+
+
+_meter = metrics.get_meter("learn_to_cloud")
+_meter.create_observable_gauge(
+    name="verification.attempts.active",
+    callbacks=[_observe_active],
+    description="Active verification attempts at the last admission check",
+    unit="{attempt}",
+)
+_REJECTED_COUNTER = _meter.create_counter(
+    name="verification.admission.rejected",
+    description="Submissions turned away because too many attempts were active",
+    unit="{submission}",
+)
+
+
+async def active_attempt_count(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> int:
+    """Return the number of active attempts, re-reading it once the TTL lapses."""
+    ttl = get_web_settings().admission.count_ttl_seconds
+    now = time.monotonic()
+    if _active.value is None or now - _active.read_at >= ttl:
+        async with session_maker() as db:
+            _active.value = await VerificationAttemptRepository(db).count_active()
+        _active.read_at = now
+    return _active.value
+
+
+async def check_admission(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    """Raise :class:`VerificationQueueFullError` if the active limit is reached.
+
+    The cached count is refreshed whether or not a limit is set, which keeps
+    the depth gauge live.
+    """
+    config = get_web_settings().admission
+    active = await active_attempt_count(session_maker)
+    if config.max_active_attempts and active >= config.max_active_attempts:
+        _REJECTED_COUNTER.add(1)
+        raise VerificationQueueFullError(config.retry_after_seconds)
@@ -203,6 +203,16 @@ async def db_session(
         await connection.close()
 
 
+@pytest.fixture(autouse=True)
+def _clear_user_profile_cache():
+    """Keep cached user profiles from leaking between tests."""
+    from learn_to_cloud.services.users_service import clear_user_profile_cache
+
+    clear_user_profile_cache()
+    yield
+    clear_user_profile_cache()
+
+
 def _quote_table_name(name: str) -> str:
     return ".".join(f'"{part}"' for part in name.split("."))
 
@@ -400,6 +400,26 @@ def test_step_checkbox_keeps_keyboard_events_from_toggling_accordion():
     assert "@keydown.enter.stop" in source
 
 
+@pytest.mark.unit
+def test_step_partial_only_swaps_out_of_band_when_requested():
+    from uuid import uuid4
+
+    from learn_to_cloud_shared.schemas import LearningStep
+
+    step = LearningStep(uuid=uuid4(), slug="step-1", order=1, title="Step one")
+
+    inline = _render("partials/topic_step.html", step=step, completed_steps=set())
+    oob = _render(
+        "partials/topic_step.html",
+        step=step,
+        completed_steps={step.uuid},
+        oob=True,
+    )
+
+    assert "hx-swap-oob" not in inline
+    assert f'id="step-{step.uuid}" hx-swap-oob="true"' in oob
+
+
 @pytest.mark.unit
 def test_community_page_renders_public_progress_and_canonical_footer_link():
     community = SimpleNamespace(
@@ -3,6 +3,7 @@
 Tests cover:
 - POST /htmx/steps/complete — mark a step complete
 - DELETE /htmx/steps/{topic_id}/{step_id} — uncomplete a step
+- POST /htmx/steps/batch — bulk complete/uncomplete a topic's steps
 - POST /htmx/github/submit — submit verification
 - DELETE /htmx/account — delete user account
 
@@ -26,6 +27,7 @@ from learn_to_cloud.routes.htmx_routes import (
     _combine_reflection_answers,
     htmx_complete_step,
     htmx_delete_account,
+    htmx_set_steps_completed,
     htmx_submit_verification,
     htmx_uncomplete_step,
     htmx_verification_attempt_status,
@@ -40,11 +42,18 @@ from learn_to_cloud.services.submissions_service import (
     VerificationAttemptSubmission,
 )
 from learn_to_cloud.services.users_service import UserNotFoundError
+from learn_to_cloud.services.verification_admission import (
+    VerificationQueueFullError,
+)
 from learn_to_cloud.services.verification_status_tokens import VerificationStatusToken
 
 
-def _mock_attempt_submission(*, created: bool = True) -> VerificationAttemptSubmission:
-    return VerificationAttemptSubmission(attempt_id=uuid4(), created=created)
+def _mock_attempt_submission(
+    *, created: bool = True, inline: bool = False
+) -> VerificationAttemptSubmission:
+    return VerificationAttemptSubmission(
+        attempt_id=uuid4(), created=created, inline=inline
+    )
 
 
 def _mock_request(*, session: dict | None = None) -> MagicMock:
@@ -90,7 +99,7 @@ class TestHtmxCompleteStep:
                 return_value=(MagicMock(), mock_topic, {step_uuid}),
             ) as mock_complete,
             patch(
-                "learn_to_cloud.routes.htmx_routes.get_user_by_id",
+                "learn_to_cloud.routes.htmx_routes.get_user_profile",
                 autospec=True,
                 return_value=MagicMock(),
             ),
@@ -151,7 +160,7 @@ class TestHtmxUncompleteStep:
                 return_value=(1, mock_topic, mock_step, set()),
             ) as mock_uncomplete,
             patch(
-                "learn_to_cloud.routes.htmx_routes.get_user_by_id",
+                "learn_to_cloud.routes.htmx_routes.get_user_profile",
                 autospec=True,
                 return_value=MagicMock(),
             ),
@@ -190,6 +199,69 @@ class TestHtmxUncompleteStep:
         assert result.headers.get("HX-Refresh") == "true"
 
 
+@pytest.mark.unit
+class TestHtmxSetStepsCompleted:
+    """Tests for POST /htmx/steps/batch."""
+
+    async def test_renders_every_step_out_of_band(self, _patch_templates):
+        """Each affected step partial is rendered once as an OOB swap."""
+        request = _mock_request()
+        mock_db = AsyncMock()
+        steps = [MagicMock(uuid=uuid4()), MagicMock(uuid=uuid4())]
+        mock_topic = MagicMock()
+        mock_topic.learning_steps = steps
+        completed = {step.uuid for step in steps}
+
+        with (
+            patch(
+                "learn_to_cloud.routes.htmx_routes.set_steps_completed",
+                autospec=True,
+                return_value=(mock_topic, steps, completed),
+            ) as mock_set,
+            patch(
+                "learn_to_cloud.routes.htmx_routes.get_user_profile",
+                autospec=True,
+                return_value=MagicMock(),
+            ),
+            patch(
+                "learn_to_cloud.routes.htmx_routes.build_progress_dict", return_value={}
+            ),
+        ):
+            result = await htmx_set_steps_completed(
+                request,
+                mock_db,
+                user_id=1,
+                step_uuids=[step.uuid for step in steps],
+                completed=True,
+            )
+
+        mock_set.assert_awaited_once_with(
+            mock_db, 1, [step.uuid for step in steps], completed=True
+        )
+        assert isinstance(result, HTMLResponse)
+        render = _patch_templates.get_template.return_value.render
+        step_renders = [c for c in render.call_args_list if "step" in c.kwargs]
+        assert [c.kwargs["step"] for c in step_renders] == steps
+        assert all(c.kwargs["oob"] is True for c in step_renders)
+
+    async def test_returns_hx_refresh_on_validation_error(self):
+        """Stale or cross-topic step UUIDs force a page reload."""
+        with patch(
+            "learn_to_cloud.routes.htmx_routes.set_steps_completed",
+            autospec=True,
+            side_effect=StepValidationError("Steps must belong to a single topic"),
+        ):
+            result = await htmx_set_steps_completed(
+                _mock_request(),
+                AsyncMock(),
+                user_id=1,
+                step_uuids=[uuid4(), uuid4()],
+                completed=False,
+            )
+
+        assert result.headers.get("HX-Refresh") == "true"
+
+
 @pytest.mark.unit
 class TestHtmxSubmitVerification:
     """Tests for POST /htmx/github/submit.
@@ -664,6 +736,97 @@ class TestHtmxSubmitVerification:
         assert isinstance(result, HTMLResponse)
         mock_start.assert_not_awaited()
 
+    async def test_inline_submit_verifies_in_request_and_reloads(self):
+        """Token submissions finish in the request without starting Durable."""
+        request = _mock_request()
+        current_user = AuthenticatedUser(user_id=1, github_username="user")
+        attempt_submission = _mock_attempt_submission(created=True, inline=True)
+        state = SimpleNamespace(
+            outcome="succeeded", error_code=None, terminal_source="inline"
+        )
+
+        with (
+            patch(
+                "learn_to_cloud.routes.htmx_routes.get_requirement_by_slug",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "learn_to_cloud.routes.htmx_routes.derive_submission_value",
+                autospec=True,
+                return_value="ctf-token",
+            ),
+            patch(
+                "learn_to_cloud.routes.htmx_routes.create_verification_attempt",
+                new_callable=AsyncMock,
+                return_value=attempt_submission,
+            ),
+            patch(
+                "learn_to_cloud.routes.htmx_routes.run_verification_attempt_inline",
+                new_callable=AsyncMock,
+                return_value=state,
+            ) as mock_inline,
+            patch(
+                "learn_to_cloud.routes.htmx_routes."
+                "start_verification_attempt_orchestration",
+                new_callable=AsyncMock,
+            ) as mock_start,
+        ):
+            result = await htmx_submit_verification(
+                request,
+                current_user,
+                requirement_slug="req-1",
+                submitted_value="ctf-token",
+            )
+
+        assert isinstance(result, HTMLResponse)
+        assert b"location.reload" in result.body
+        mock_inline.assert_awaited_once_with(
+            attempt_submission.attempt_id,
+            session_maker=request.app.state.session_maker,
+        )
+        mock_start.assert_not_awaited()
+
+    async def test_full_queue_returns_retry_card(self, _patch_templates):
+        """Admission control turns the submit away before Durable starts."""
+        request = _mock_request()
+        current_user = AuthenticatedUser(user_id=1, github_username="user")
+
+        with (
+            patch(
+                "learn_to_cloud.routes.htmx_routes.get_requirement_by_slug",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "learn_to_cloud.routes.htmx_routes.derive_submission_value",
+                autospec=True,
+                return_value="https://github.com/user/repo",
+            ),
+            patch(
+                "learn_to_cloud.routes.htmx_routes.create_verification_attempt",
+                new_callable=AsyncMock,
+                side_effect=VerificationQueueFullError(45),
+            ),
+            patch(
+                "learn_to_cloud.routes.htmx_routes.build_requirement_card_context",
+                return_value={},
+            ) as mock_context,
+            patch(
+                "learn_to_cloud.routes.htmx_routes."
+                "start_verification_attempt_orchestration",
+                new_callable=AsyncMock,
+            ) as mock_start,
+        ):
+            result = await htmx_submit_verification(
+                request,
+                current_user,
+                requirement_slug="req-1",
+                submitted_value="https://github.com/user/repo",
+            )
+
+        assert result.headers["Retry-After"] == "45"
+        assert "45 seconds" in mock_context.call_args.kwargs["error_banner"]
+        mock_start.assert_not_awaited()
+
 
 @pytest.mark.unit
 class TestHtmxVerificationAttemptStatus:
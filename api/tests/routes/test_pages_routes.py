@@ -90,7 +90,7 @@ class TestHomePage:
                 return_value=phases,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=None,
             ),
@@ -117,7 +117,7 @@ class TestHomePage:
                 return_value=phases,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=mock_user,
             ),
@@ -144,7 +144,7 @@ class TestCurriculumPage:
                 return_value=phases,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=None,
             ),
@@ -171,7 +171,7 @@ class TestPhasePage:
                 return_value=None,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=None,
             ),
@@ -200,7 +200,7 @@ class TestPhasePage:
                 return_value=phase,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=mock_user,
             ),
@@ -254,7 +254,7 @@ class TestTopicPage:
                 return_value=None,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=None,
             ),
@@ -278,7 +278,7 @@ class TestTopicPage:
                 return_value=phase,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=None,
             ),
@@ -303,7 +303,7 @@ class TestTopicPage:
                 return_value=phase,
             ),
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=MagicMock(),
             ),
@@ -339,7 +339,7 @@ class TestDashboardPage:
 
         with (
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=mock_user,
             ),
@@ -362,7 +362,7 @@ class TestDashboardPage:
         mock_db = AsyncMock()
 
         with patch(
-            "learn_to_cloud.routes.pages_routes.get_user_by_id",
+            "learn_to_cloud.routes.pages_routes.get_user_profile",
             autospec=True,
             return_value=None,
         ):
@@ -384,7 +384,7 @@ class TestAccountPage:
         mock_user = MagicMock()
 
         with patch(
-            "learn_to_cloud.routes.pages_routes.get_user_by_id",
+            "learn_to_cloud.routes.pages_routes.get_user_profile",
             autospec=True,
             return_value=mock_user,
         ):
@@ -400,7 +400,7 @@ class TestAccountPage:
         mock_db = AsyncMock()
 
         with patch(
-            "learn_to_cloud.routes.pages_routes.get_user_by_id",
+            "learn_to_cloud.routes.pages_routes.get_user_profile",
             autospec=True,
             return_value=None,
         ):
@@ -427,7 +427,7 @@ class TestPublicPages:
         mock_db = AsyncMock()
 
         with patch(
-            "learn_to_cloud.routes.pages_routes.get_user_by_id",
+            "learn_to_cloud.routes.pages_routes.get_user_profile",
             autospec=True,
             return_value=None,
         ):
@@ -447,7 +447,7 @@ class TestCommunityPage:
 
         with (
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 autospec=True,
                 return_value=None,
             ),
@@ -242,7 +242,7 @@ class TestAuthPageSmoke:
         """GET /dashboard renders the dashboard template."""
         with (
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 return_value=_fake_user(),
             ),
             patch(
@@ -256,7 +256,7 @@ class TestAuthPageSmoke:
     async def test_account_renders(self, auth_client: AsyncClient):
         """GET /account renders the account settings template."""
         with patch(
-            "learn_to_cloud.routes.pages_routes.get_user_by_id",
+            "learn_to_cloud.routes.pages_routes.get_user_profile",
             return_value=_fake_user(),
         ):
             response = await auth_client.get("/account")
@@ -288,7 +288,7 @@ class TestAuthPageSmoke:
 
         with (
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 return_value=_fake_user(),
             ),
             patch(
@@ -366,7 +366,7 @@ class TestAuthPageSmoke:
 
         with (
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 return_value=_fake_user(),
             ),
             patch(
@@ -410,7 +410,7 @@ class TestAuthPageSmoke:
 
         with (
             patch(
-                "learn_to_cloud.routes.pages_routes.get_user_by_id",
+                "learn_to_cloud.routes.pages_routes.get_user_profile",
                 return_value=_fake_user(),
             ),
             patch(
@@ -1,9 +1,12 @@
 """Unit tests for steps_service after the step_uuid simplification."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
+from learn_to_cloud_shared.repositories.learner_step_completion_repository import (
+    StepCompletionWrite,
+)
 from learn_to_cloud_shared.schemas import (
     LearningStep,
     Topic,
@@ -11,8 +14,10 @@ from learn_to_cloud_shared.schemas import (
 
 from learn_to_cloud.services.steps_service import (
     StepNotFoundError,
+    StepValidationError,
     complete_step,
     get_valid_completed_steps,
+    set_steps_completed,
     uncomplete_step,
 )
 
@@ -38,9 +43,6 @@ class TestCompleteStep:
     async def test_first_completion_creates_record(self):
         step = _make_step()
         topic = _make_topic([step])
-        mock_progress = MagicMock(
-            user_id=1, step_uuid=step.uuid, completed_at=MagicMock()
-        )
 
         with (
             patch(
@@ -53,11 +55,15 @@ class TestCompleteStep:
             ) as MockCompletionRepo,
             patch(
                 "learn_to_cloud.services.steps_service.resolve_completed_step_uuids",
-                new=AsyncMock(return_value={step.uuid}),
-            ),
+                new=AsyncMock(),
+            ) as resolve,
         ):
             completion_repo = MockCompletionRepo.return_value
-            completion_repo.create_if_not_exists = AsyncMock(return_value=mock_progress)
+            completion_repo.create_many_returning_completed = AsyncMock(
+                return_value=StepCompletionWrite(
+                    changed={step.uuid}, completed={step.uuid}
+                )
+            )
 
             result, returned_topic, completed = await complete_step(
                 AsyncMock(), user_id=1, step_uuid=step.uuid
@@ -66,12 +72,17 @@ class TestCompleteStep:
         assert result.step_slug == step.slug
         assert returned_topic.uuid == topic.uuid
         assert step.uuid in completed
-        completion_repo.create_if_not_exists.assert_awaited_once()
-        completion_await_args = completion_repo.create_if_not_exists.await_args
+        completion_repo.create_many_returning_completed.assert_awaited_once()
+        completion_await_args = (
+            completion_repo.create_many_returning_completed.await_args
+        )
         assert completion_await_args is not None
         completion_kwargs = completion_await_args.kwargs
         assert completion_kwargs["user_id"] == 1
-        assert completion_kwargs["step_uuid"] == step.uuid
+        assert completion_kwargs["step_uuids"] == [step.uuid]
+        assert list(completion_kwargs["candidate_step_uuids"]) == [step.uuid]
+        # The completed set comes back with the insert; no second read.
+        resolve.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_unknown_step_raises(self):
@@ -101,11 +112,13 @@ class TestUncompleteStep:
             ) as MockCompletionRepo,
             patch(
                 "learn_to_cloud.services.steps_service.resolve_completed_step_uuids",
-                new=AsyncMock(return_value=set()),
-            ),
+                new=AsyncMock(),
+            ) as resolve,
         ):
             completion_repo = MockCompletionRepo.return_value
-            completion_repo.delete = AsyncMock(return_value=1)
+            completion_repo.delete_many_returning_completed = AsyncMock(
+                return_value=StepCompletionWrite(changed={step.uuid}, completed=set())
+            )
 
             deleted, returned_topic, returned_step, completed = await uncomplete_step(
                 AsyncMock(), user_id=1, step_uuid=step.uuid
@@ -114,7 +127,112 @@ class TestUncompleteStep:
         assert deleted == 1
         assert returned_step.uuid == step.uuid
         assert completed == set()
-        completion_repo.delete.assert_awaited_once_with(user_id=1, step_uuid=step.uuid)
+        completion_repo.delete_many_returning_completed.assert_awaited_once()
+        resolve.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestSetStepsCompleted:
+    @staticmethod
+    def _lookup(topic: Topic):
+        steps = {step.uuid: step for step in topic.learning_steps}
+        return lambda step_uuid: (
+            (topic, steps[step_uuid]) if step_uuid in steps else None
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_complete_writes_and_reads_in_one_call(self):
+        s1, s2, s3 = _make_step("s1"), _make_step("s2"), _make_step("s3")
+        topic = _make_topic([s1, s2, s3])
+
+        with (
+            patch(
+                "learn_to_cloud.services.steps_service.get_topic_containing_step",
+                side_effect=self._lookup(topic),
+            ),
+            patch(
+                "learn_to_cloud.services.steps_service.LearnerStepCompletionRepository",
+                autospec=True,
+            ) as MockCompletionRepo,
+        ):
+            completion_repo = MockCompletionRepo.return_value
+            completion_repo.create_many_returning_completed = AsyncMock(
+                return_value=StepCompletionWrite(
+                    changed={s1.uuid, s3.uuid}, completed={s1.uuid, s3.uuid}
+                )
+            )
+
+            returned_topic, steps, completed = await set_steps_completed(
+                AsyncMock(), 1, [s3.uuid, s1.uuid], completed=True
+            )
+
+        assert returned_topic.uuid == topic.uuid
+        assert [step.uuid for step in steps] == [s1.uuid, s3.uuid]
+        assert completed == {s1.uuid, s3.uuid}
+        completion_repo.create_many_returning_completed.assert_awaited_once()
+        await_args = completion_repo.create_many_returning_completed.await_args
+        assert await_args is not None
+        assert await_args.kwargs["step_uuids"] == {s1.uuid, s3.uuid}
+        assert await_args.kwargs["candidate_step_uuids"] == [
+            s1.uuid,
+            s2.uuid,
+            s3.uuid,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_uncomplete_deletes_once(self):
+        s1, s2 = _make_step("s1"), _make_step("s2")
+        topic = _make_topic([s1, s2])
+
+        with (
+            patch(
+                "learn_to_cloud.services.steps_service.get_topic_containing_step",
+                side_effect=self._lookup(topic),
+            ),
+            patch(
+                "learn_to_cloud.services.steps_service.LearnerStepCompletionRepository",
+                autospec=True,
+            ) as MockCompletionRepo,
+        ):
+            completion_repo = MockCompletionRepo.return_value
+            completion_repo.delete_many_returning_completed = AsyncMock(
+                return_value=StepCompletionWrite(
+                    changed={s1.uuid, s2.uuid}, completed=set()
+                )
+            )
+
+            _, steps, completed = await set_steps_completed(
+                AsyncMock(), 1, [s1.uuid, s2.uuid], completed=False
+            )
+
+        assert len(steps) == 2
+        assert completed == set()
+        completion_repo.delete_many_returning_completed.assert_awaited_once_with(
+            user_id=1,
+            step_uuids={s1.uuid, s2.uuid},
+            candidate_step_uuids=[s1.uuid, s2.uuid],
+        )
+
+    @pytest.mark.asyncio
+    async def test_steps_from_different_topics_raise(self):
+        first = _make_topic([_make_step("a")])
+        second = _make_topic([_make_step("b")])
+        lookup = {
+            first.learning_steps[0].uuid: (first, first.learning_steps[0]),
+            second.learning_steps[0].uuid: (second, second.learning_steps[0]),
+        }
+
+        with patch(
+            "learn_to_cloud.services.steps_service.get_topic_containing_step",
+            side_effect=lookup.get,
+        ):
+            with pytest.raises(StepValidationError):
+                await set_steps_completed(AsyncMock(), 1, list(lookup), completed=True)
+
+    @pytest.mark.asyncio
+    async def test_empty_input_raises(self):
+        with pytest.raises(StepValidationError):
+            await set_steps_completed(AsyncMock(), 1, [], completed=True)
 
 
 @pytest.mark.unit
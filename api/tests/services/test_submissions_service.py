@@ -10,6 +10,7 @@ from learn_to_cloud_shared.models import SubmissionType, SubmissionValueKind
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     AttemptAlreadyValidatedError,
     AttemptCardProjection,
+    SubmissionGateState,
 )
 from learn_to_cloud_shared.requirements import RequirementIndex
 from learn_to_cloud_shared.schemas import HandsOnRequirement, Phase
@@ -31,6 +32,16 @@ from learn_to_cloud.services.submissions_service import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _admit_every_submission():
+    """Admission control has its own tests; every submission here is admitted."""
+    with patch(
+        "learn_to_cloud.services.submissions_service.check_admission",
+        new=AsyncMock(),
+    ):
+        yield
+
+
 def _make_mock_requirement(
     submission_type: SubmissionType = SubmissionType.JOURNAL_API_VERIFIER,
 ) -> HandsOnRequirement:
@@ -140,27 +151,19 @@ def _build_index(
 
 
 def _gating_mock(
-    requirement_uuid,
     *,
     already_validated: bool = False,
     prereq_satisfied: bool = True,
+    active_attempt_id=None,
 ):
-    """Build an ``are_all_requirements_succeeded`` stand-in for gating tests.
-
-    The real ``_check_submission_preconditions`` calls the shared
-    ``are_all_requirements_succeeded`` helper twice with different UUID
-    lists (the single requirement being submitted, then any prerequisite
-    phase's requirements) -- this dispatches on the exact single-UUID list
-    so both call sites can be controlled independently in one mock.
-    """
-
-    async def _fn(_db, _user_id, uuids):
-        uuids = list(uuids)
-        if uuids == [requirement_uuid]:
-            return already_validated
-        return prereq_satisfied
-
-    return AsyncMock(side_effect=_fn)
+    """Build a ``read_submission_gate`` stand-in for gating tests."""
+    return AsyncMock(
+        return_value=SubmissionGateState(
+            already_succeeded=already_validated,
+            active_attempt_id=active_attempt_id,
+            prerequisites_met=prereq_satisfied,
+        )
+    )
 
 
 @pytest.mark.unit
@@ -201,8 +204,8 @@ class TestAlreadyValidatedShortCircuit:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=True),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=True),
             ),
             patch(
                 "learn_to_cloud.services.submissions_service.VerificationAttemptRepository",
@@ -222,7 +225,7 @@ class TestAlreadyValidatedShortCircuit:
 
     @pytest.mark.asyncio
     async def test_already_validated_attempt_raises_error(self):
-        """A succeeded attempt discovered under the advisory lock (a race
+        """A succeeded attempt discovered by the conditional insert (a race
         with a concurrent finalize) also raises AlreadyValidatedError, even
         though the earlier precondition check passed."""
         mock_session_maker = _mock_session_maker()
@@ -234,8 +237,8 @@ class TestAlreadyValidatedShortCircuit:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=False),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=False),
             ),
             patch(
                 "learn_to_cloud.services.submissions_service."
@@ -269,8 +272,8 @@ class TestAlreadyValidatedShortCircuit:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=False),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=False),
             ),
             patch(
                 "learn_to_cloud.services.submissions_service."
@@ -318,13 +321,12 @@ class TestSequentialPhaseGating:
                 ),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
                 new=_gating_mock(
-                    mock_requirement.uuid,
                     already_validated=False,
                     prereq_satisfied=False,
                 ),
-            ),
+            ) as mock_gate,
         ):
             with pytest.raises(PriorPhaseNotCompleteError) as exc_info:
                 await create_verification_attempt(
@@ -337,6 +339,8 @@ class TestSequentialPhaseGating:
 
             assert exc_info.value.prerequisite_phase == 3
             assert "Phase 3" in str(exc_info.value)
+            prereq_uuids = mock_gate.await_args.args[3]
+            assert len(prereq_uuids) == 2
 
     @pytest.mark.asyncio
     async def test_submission_allowed_when_prior_phase_complete(self):
@@ -356,9 +360,8 @@ class TestSequentialPhaseGating:
                 ),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
                 new=_gating_mock(
-                    mock_requirement.uuid,
                     already_validated=False,
                     prereq_satisfied=True,
                 ),
@@ -407,8 +410,8 @@ class TestCreateVerificationAttempt:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=False),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=False),
             ),
             patch(
                 "learn_to_cloud.services.submissions_service."
@@ -459,8 +462,8 @@ class TestCreateVerificationAttempt:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=False),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=False),
             ),
             patch(
                 "learn_to_cloud.services.submissions_service."
@@ -485,8 +488,49 @@ class TestCreateVerificationAttempt:
         assert isinstance(result, VerificationAttemptSubmission)
         assert result.attempt_id == mock_attempt.id
         assert result.created is True
+        assert result.inline is False
         mock_attempt_repo.create_or_get_active.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_token_submission_runs_inline(self):
+        mock_session_maker = _mock_session_maker()
+        mock_requirement = _make_mock_requirement(
+            submission_type=SubmissionType.CTF_TOKEN,
+        )
+        mock_attempt = _mock_attempt()
+
+        with (
+            patch(
+                "learn_to_cloud.services.submissions_service.load_requirement_index",
+                return_value=_build_index(mock_requirement),
+            ),
+            patch(
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=False),
+            ),
+            patch(
+                "learn_to_cloud.services.submissions_service."
+                "VerificationAttemptRepository",
+                autospec=True,
+            ) as mock_attempt_repo_class,
+        ):
+            mock_attempt_repo = MagicMock()
+            mock_attempt_repo.create_or_get_active = AsyncMock(
+                return_value=(mock_attempt, True)
+            )
+            mock_attempt_repo_class.return_value = mock_attempt_repo
+
+            result = await create_verification_attempt(
+                session_maker=mock_session_maker,
+                user_id=123,
+                requirement_slug="test-requirement",
+                submitted_value="ctf-token-value",
+                github_username="user",
+            )
+
+        assert result.created is True
+        assert result.inline is True
+
     @pytest.mark.asyncio
     async def test_concurrent_submit_reuses_active_attempt(self):
         mock_session_maker = _mock_session_maker()
@@ -501,8 +545,8 @@ class TestCreateVerificationAttempt:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=False),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=False),
             ),
             patch(
                 "learn_to_cloud.services.submissions_service."
@@ -527,6 +571,43 @@ class TestCreateVerificationAttempt:
         assert result.attempt_id == mock_attempt.id
         assert result.created is False
 
+    @pytest.mark.asyncio
+    async def test_active_attempt_from_gate_skips_write_session(self):
+        """An in-flight attempt seen by the gate read is reused without a write."""
+        mock_session_maker = _mock_session_maker()
+        mock_requirement = _make_mock_requirement(
+            submission_type=SubmissionType.JOURNAL_API_VERIFIER,
+        )
+        active_id = uuid4()
+
+        with (
+            patch(
+                "learn_to_cloud.services.submissions_service.load_requirement_index",
+                return_value=_build_index(mock_requirement),
+            ),
+            patch(
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(active_attempt_id=active_id),
+            ),
+            patch(
+                "learn_to_cloud.services.submissions_service."
+                "VerificationAttemptRepository",
+                autospec=True,
+            ) as mock_attempt_repo_class,
+        ):
+            result = await create_verification_attempt(
+                session_maker=mock_session_maker,
+                user_id=123,
+                requirement_slug="test-requirement",
+                submitted_value="https://github.com/user/repo",
+                github_username="user",
+            )
+
+        assert result == VerificationAttemptSubmission(
+            attempt_id=active_id, created=False
+        )
+        mock_attempt_repo_class.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_preconditions_still_enforced(self):
         mock_session_maker = _mock_session_maker()
@@ -540,8 +621,8 @@ class TestCreateVerificationAttempt:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=True),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=True),
             ),
             patch(
                 "learn_to_cloud.services.submissions_service."
@@ -786,15 +867,17 @@ class TestRunSubmitSmokeCheck:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
-                new=_gating_mock(mock_requirement.uuid, already_validated=False),
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
+                new=_gating_mock(already_validated=False),
             ) as mock_gate,
         ):
             result = await run_submit_smoke_check(mock_session_maker)
 
         assert result["requirement_slug"] == mock_requirement.slug
         # Reads use the synthetic, non-existent user id.
-        mock_gate.assert_awaited_once_with(ANY, SMOKE_USER_ID, [mock_requirement.uuid])
+        mock_gate.assert_awaited_once_with(
+            ANY, SMOKE_USER_ID, mock_requirement.uuid, ()
+        )
 
     @pytest.mark.asyncio
     async def test_smoke_check_propagates_read_errors(self):
@@ -808,7 +891,7 @@ class TestRunSubmitSmokeCheck:
                 return_value=_build_index(mock_requirement),
             ),
             patch(
-                "learn_to_cloud.services.submissions_service.are_all_requirements_succeeded",
+                "learn_to_cloud.services.submissions_service.read_submission_gate",
                 new=AsyncMock(
                     side_effect=RuntimeError("column submissions.foo does not exist")
                 ),
@@ -3,7 +3,8 @@
 Tests cover:
 - normalize_github_username lowercasing and edge cases
 - parse_display_name splitting logic
-- get_user_by_id cache hit/miss and not found
+- get_user_by_id lookup and not found
+- get_user_profile cache hit/miss, not found, and invalidation
 - get_or_create_user_from_github upsert and username conflict
 - delete_user_account success and not found
 """
@@ -17,6 +18,7 @@ from learn_to_cloud.services.users_service import (
     delete_user_account,
     get_or_create_user_from_github,
     get_user_by_id,
+    get_user_profile,
     normalize_github_username,
     parse_display_name,
 )
@@ -163,6 +165,91 @@ class TestGetUserById:
         assert result is None
 
 
+# ---------------------------------------------------------------------------
+# get_user_profile
+# ---------------------------------------------------------------------------
+
+
+def _fake_user(user_id: int = 1, github_username: str = "testuser") -> MagicMock:
+    user = MagicMock()
+    user.id = user_id
+    user.github_username = github_username
+    user.first_name = "Test"
+    user.last_name = "User"
+    user.avatar_url = "https://example.com/avatar.png"
+    return user
+
+
+@pytest.mark.unit
+class TestGetUserProfile:
+    @pytest.mark.asyncio
+    async def test_second_lookup_is_served_from_cache(self):
+        with patch(
+            "learn_to_cloud.services.users_service.UserRepository", autospec=True
+        ) as MockRepo:
+            MockRepo.return_value.get_by_id = AsyncMock(return_value=_fake_user())
+            first = await get_user_profile(AsyncMock(), user_id=1)
+            second = await get_user_profile(AsyncMock(), user_id=1)
+
+        assert first is second
+        assert first is not None
+        assert first.github_username == "testuser"
+        assert first.avatar_url == "https://example.com/avatar.png"
+        MockRepo.return_value.get_by_id.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(self):
+        with patch(
+            "learn_to_cloud.services.users_service.UserRepository", autospec=True
+        ) as MockRepo:
+            MockRepo.return_value.get_by_id = AsyncMock(return_value=None)
+            assert await get_user_profile(AsyncMock(), user_id=999) is None
+            assert await get_user_profile(AsyncMock(), user_id=999) is None
+
+        assert MockRepo.return_value.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_login_upsert_invalidates_cached_profile(self):
+        with patch(
+            "learn_to_cloud.services.users_service.UserRepository", autospec=True
+        ) as MockRepo:
+            repo = MockRepo.return_value
+            repo.get_by_id = AsyncMock(
+                side_effect=[
+                    _fake_user(github_username="oldname"),
+                    _fake_user(github_username="newname"),
+                ]
+            )
+            repo.upsert = AsyncMock(return_value=_fake_user())
+
+            before = await get_user_profile(AsyncMock(), user_id=1)
+            await get_or_create_user_from_github(
+                AsyncMock(),
+                github_id=1,
+                first_name="Test",
+                last_name="User",
+                avatar_url=None,
+                github_username="NewName",
+            )
+            after = await get_user_profile(AsyncMock(), user_id=1)
+
+        assert before is not None and before.github_username == "oldname"
+        assert after is not None and after.github_username == "newname"
+
+    @pytest.mark.asyncio
+    async def test_account_deletion_invalidates_cached_profile(self):
+        with patch(
+            "learn_to_cloud.services.users_service.UserRepository", autospec=True
+        ) as MockRepo:
+            repo = MockRepo.return_value
+            repo.get_by_id = AsyncMock(side_effect=[_fake_user(), _fake_user(), None])
+            repo.delete = AsyncMock()
+
+            assert await get_user_profile(AsyncMock(), user_id=1) is not None
+            await delete_user_account(AsyncMock(), user_id=1)
+            assert await get_user_profile(AsyncMock(), user_id=1) is None
+
+
 # ---------------------------------------------------------------------------
 # get_or_create_user_from_github
 # ---------------------------------------------------------------------------
@@ -0,0 +1,83 @@
+"""Unit tests for verification submission admission control."""
+
+from collections.abc import Iterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from learn_to_cloud_shared.core.config import AdmissionConfig
+
+from learn_to_cloud.services import verification_admission
+from learn_to_cloud.services.verification_admission import (
+    VerificationQueueFullError,
+    check_admission,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _reset_active_count() -> Iterator[None]:
+    verification_admission._active.value = None
+    yield
+    verification_admission._active.value = None
+
+
+def _session_maker() -> MagicMock:
+    @asynccontextmanager
+    async def _factory():
+        yield AsyncMock()
+
+    return MagicMock(side_effect=_factory)
+
+
+def _patched(active: int, **config: object):
+    repo = MagicMock()
+    repo.count_active = AsyncMock(return_value=active)
+    settings = SimpleNamespace(admission=AdmissionConfig.model_validate(config))
+    return (
+        patch.object(verification_admission, "get_web_settings", return_value=settings),
+        patch.object(
+            verification_admission, "VerificationAttemptRepository", return_value=repo
+        ),
+    )
+
+
+async def test_disabled_limit_admits_but_still_feeds_the_gauge():
+    settings_patch, repo_patch = _patched(10_000, max_active_attempts=0)
+
+    with settings_patch, repo_patch:
+        await check_admission(_session_maker())
+
+    [observation] = verification_admission._observe_active(MagicMock())
+    assert observation.value == 10_000
+
+
+async def test_full_queue_is_rejected_with_retry_hint():
+    settings_patch, repo_patch = _patched(
+        5, max_active_attempts=5, retry_after_seconds=45
+    )
+
+    with (
+        settings_patch,
+        repo_patch,
+        pytest.raises(VerificationQueueFullError, match="45 seconds") as exc_info,
+    ):
+        await check_admission(_session_maker())
+
+    assert exc_info.value.retry_after_seconds == 45
+
+
+async def test_count_is_reused_within_ttl():
+    session_maker = _session_maker()
+    settings_patch, repo_patch = _patched(
+        4, max_active_attempts=5, count_ttl_seconds=60
+    )
+
+    with settings_patch, repo_patch:
+        await check_admission(session_maker)
+        await check_admission(session_maker)
+
+    session_maker.assert_called_once()
+    assert verification_admission._active.value == 4
@@ -13,6 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi import FastAPI
 from learn_to_cloud_shared.content_catalog import CurriculumCatalogError
+from learn_to_cloud_shared.progress_reads import prepare_progress_reads
 
 from learn_to_cloud.main import lifespan
 
@@ -44,6 +45,7 @@ def _patch_startup_dependencies(test_settings):
         patch("learn_to_cloud.main.get_code_alembic_head", return_value="head123"),
         patch("learn_to_cloud.main.init_oauth"),
         patch("learn_to_cloud.main.init_db", new=AsyncMock()),
+        patch("learn_to_cloud.main.warm_pool", new=AsyncMock()),
         patch("learn_to_cloud.main.close_github_client", new=AsyncMock()),
         patch("learn_to_cloud.main.dispose_engine", new=AsyncMock()),
     ):
@@ -77,3 +79,62 @@ class TestLifespanCurriculumFailFast:
                 assert fake_app.state.curriculum_catalog is catalog
 
         assert "init.curriculum_loaded" in caplog.text
+
+
+@pytest.mark.asyncio
+class TestLifespanPoolWarmup:
+    async def test_pool_is_warmed_before_startup_completes(
+        self, fake_app: FastAPI, test_settings
+    ):
+        with (
+            patch("learn_to_cloud.main.get_curriculum_catalog"),
+            patch("learn_to_cloud.main.warm_pool", new=AsyncMock()) as mock_warm,
+        ):
+            async with lifespan(fake_app):
+                assert fake_app.state.init_done is True
+
+        mock_warm.assert_awaited_once_with(
+            fake_app.state.engine, test_settings.database, prepare=None
+        )
+
+    async def test_prepare_runs_the_progress_reads(
+        self, fake_app: FastAPI, test_settings
+    ):
+        settings = test_settings.model_copy(
+            update={
+                "database": test_settings.database.model_copy(
+                    update={"pool_warmup_prepare": True}
+                )
+            }
+        )
+        with (
+            patch("learn_to_cloud.main.get_web_settings", return_value=settings),
+            patch("learn_to_cloud.main.get_curriculum_catalog"),
+            patch("learn_to_cloud.main.warm_pool", new=AsyncMock()) as mock_warm,
+        ):
+            async with lifespan(fake_app):
+                pass
+
+        mock_warm.assert_awaited_once_with(
+            fake_app.state.engine, settings.database, prepare=prepare_progress_reads
+        )
+
+    async def test_disabled_warmup_skips_the_pool(
+        self, fake_app: FastAPI, test_settings
+    ):
+        settings = test_settings.model_copy(
+            update={
+                "database": test_settings.database.model_copy(
+                    update={"pool_warmup": False}
+                )
+            }
+        )
+        with (
+            patch("learn_to_cloud.main.get_web_settings", return_value=settings),
+            patch("learn_to_cloud.main.get_curriculum_catalog"),
+            patch("learn_to_cloud.main.warm_pool", new=AsyncMock()) as mock_warm,
+        ):
+            async with lifespan(fake_app):
+                pass
+
+        mock_warm.assert_not_awaited()
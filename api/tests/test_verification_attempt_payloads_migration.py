@@ -0,0 +1,146 @@
+"""Data test for the verification attempt payload split (0058).
+
+Seeds attempts with inline payloads before the revision, runs it, and asserts
+the backfill copied them. Then writes through the legacy columns the way the
+previous release does and asserts the mirror trigger keeps the payload table
+in step.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+MIGRATION_DB = "test_verification_attempt_payloads"
+_BEFORE = "0057_add_verification_evidence_claims"
+_HEAD = "0058_split_verification_attempt_payloads"
+_USER_ID = 86001
+
+
+def _sync_url() -> str:
+    raw = os.environ.get(
+        "DATABASE__URL",
+        "postgresql+asyncpg://postgres:postgres@db:5432/learntocloud",
+    )
+    return raw.replace("+asyncpg", "+psycopg2")
+
+
+def _admin_url() -> str:
+    return _sync_url().rsplit("/", 1)[0] + "/postgres"
+
+
+def _drop_database() -> None:
+    admin_eng = create_engine(_admin_url(), isolation_level="AUTOCOMMIT")
+    with admin_eng.connect() as conn:
+        conn.execute(
+            text(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                f"WHERE datname = '{MIGRATION_DB}' AND pid <> pg_backend_pid()"
+            )
+        )
+        conn.execute(text(f"DROP DATABASE IF EXISTS {MIGRATION_DB}"))
+    admin_eng.dispose()
+
+
+@pytest.fixture()
+def alembic_config():
+    from pytest_alembic.config import Config
+
+    return Config(
+        config_options={
+            "file": str(Path(__file__).parent.parent / "alembic.ini"),
+            "script_location": str(Path(__file__).parent.parent / "alembic"),
+        },
+    )
+
+
+@pytest.fixture()
+def alembic_engine():
+    _drop_database()
+    admin_eng = create_engine(_admin_url(), isolation_level="AUTOCOMMIT")
+    with admin_eng.connect() as conn:
+        conn.execute(text(f"CREATE DATABASE {MIGRATION_DB}"))
+    admin_eng.dispose()
+
+    engine = create_engine(_sync_url().rsplit("/", 1)[0] + f"/{MIGRATION_DB}")
+    yield engine
+    engine.dispose()
+    _drop_database()
+
+
+def _insert_attempt(conn, *, snapshot: str | None, feedback: str | None) -> uuid.UUID:
+    attempt_id = uuid.uuid4()
+    conn.execute(
+        text(
+            """
+            INSERT INTO verification_attempts (
+                id, user_id, requirement_uuid, requirement_snapshot,
+                requirement_snapshot_hash, snapshot_source,
+                submission_value_kind, submitted_value, feedback_json,
+                outcome, completed_at, created_at, updated_at
+            ) VALUES (
+                :id, :user_id, :requirement_uuid, CAST(:snapshot AS jsonb),
+                'hash', 'submitted', 'github_url', 'https://github.com/a/b',
+                CAST(:feedback AS jsonb),
+                CASE WHEN :feedback IS NULL THEN NULL ELSE 'failed' END,
+                CASE WHEN :feedback IS NULL THEN NULL ELSE now() END,
+                now(), now()
+            )
+            """
+        ),
+        {
+            "id": attempt_id,
+            "user_id": _USER_ID,
+            "requirement_uuid": uuid.uuid4(),
+            "snapshot": snapshot,
+            "feedback": feedback,
+        },
+    )
+    return attempt_id
+
+
+def _payload(conn, attempt_id: uuid.UUID):
+    return conn.execute(
+        text(
+            "SELECT requirement_snapshot, feedback_json "
+            "FROM verification_attempt_payloads WHERE attempt_id = :id"
+        ),
+        {"id": attempt_id},
+    ).one_or_none()
+
+
+def test_payloads_are_backfilled_and_mirrored(alembic_runner, alembic_engine):
+    alembic_runner.migrate_up_to(_BEFORE)
+    with alembic_engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO users (id, github_username, is_admin, created_at, "
+                "updated_at) VALUES (:id, 'payloads', false, now(), now())"
+            ),
+            {"id": _USER_ID},
+        )
+        finished = _insert_attempt(
+            conn, snapshot='{"slug": "old"}', feedback='[{"task": "a"}]'
+        )
+
+    alembic_runner.migrate_up_to(_HEAD)
+
+    with alembic_engine.begin() as conn:
+        backfilled = _payload(conn, finished)
+        active = _insert_attempt(conn, snapshot='{"slug": "new"}', feedback=None)
+        conn.execute(
+            text(
+                "UPDATE verification_attempts SET feedback_json = "
+                """'[{"task": "b"}]', outcome = 'failed', completed_at = now() """
+                "WHERE id = :id"
+            ),
+            {"id": active},
+        )
+        mirrored = _payload(conn, active)
+
+    assert backfilled == ({"slug": "old"}, [{"task": "a"}])
+    assert mirrored == ({"slug": "new"}, [{"task": "b"}])
@@ -7,10 +7,10 @@ import atexit
 import json
 import logging
 import os
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from uuid import UUID
 
@@ -21,10 +21,16 @@ from learn_to_cloud_shared.core.database import create_engine, create_session_ma
 from learn_to_cloud_shared.core.logger import APP_LOGGER_NAMESPACE, configure_logging
 from learn_to_cloud_shared.core.observability import configure_observability
 from learn_to_cloud_shared.models import utcnow
+from learn_to_cloud_shared.repositories.llm_grading_decision_repository import (
+    LLMGradingDecisionRepository,
+)
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     AttemptTerminalState,
     VerificationAttemptRepository,
 )
+from learn_to_cloud_shared.repositories.verification_evidence_claim_repository import (
+    VerificationEvidenceClaimRepository,
+)
 from learn_to_cloud_shared.verification_attempt_executor import (
     finalize_verification_attempt as finalize_attempt,
 )
@@ -38,9 +44,17 @@ from learn_to_cloud_shared.verification_attempt_reconciler import (
     reconcile_decision,
     stale_cutoff,
 )
+from learn_to_cloud_shared.verification.claim_check import (
+    GRADING_REQUEST_CLAIMS_KEY,
+    check_in_run_result,
+    load_grading_request,
+)
+from learn_to_cloud_shared.verification.grading_cache import (
+    get_cached_grading_decision,
+    store_grading_decision,
+)
 from learn_to_cloud_shared.verification.llm_grading import (
     LLMGradingDecisionPayload,
-    LLMGradingRequest,
     llm_grading_content_filtered_result,
     llm_grading_unavailable_result,
 )
@@ -54,11 +68,15 @@ from learn_to_cloud_shared.verification_workflow import (
     outcome_for_validation,
 )
 from opentelemetry import context as otel_context
+from opentelemetry import metrics
 from opentelemetry import trace as otel_trace
+from opentelemetry.metrics import CallbackOptions, Observation
 from opentelemetry.propagate import extract
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from verification_agents import (
     CONTENT_FILTER_MARKER,
+    GRADER_INSTRUCTIONS,
+    GradingConfig,
     grade_evidence,
     missing_grading_config,
 )
@@ -92,7 +110,7 @@ configure_observability()
 
 app = df.DFApp(http_auth_level=func.AuthLevel.ANONYMOUS)
 
-_ATTEMPT_ORCHESTRATOR_NAME = "verification_attempt_orchestrator_v1"
+_ATTEMPT_ORCHESTRATOR_NAME = "verification_attempt_orchestrator_v2"
 _VERIFY_RETRY_OPTIONS = df.RetryOptions(
     first_retry_interval_in_milliseconds=5000,
     max_number_of_attempts=3,
@@ -105,6 +123,10 @@ _LLM_RETRY_OPTIONS = df.RetryOptions(
     first_retry_interval_in_milliseconds=3000,
     max_number_of_attempts=4,
 )
+_LLM_LANE_FIRST_DEFERRAL = timedelta(seconds=5)
+_LLM_LANE_MAX_DEFERRAL = timedelta(minutes=1)
+_LLM_LANE_MAX_WAIT = timedelta(minutes=30)
+_LANE_DEFERRED_KEY = "lane_deferred"
 
 _engine: AsyncEngine | None = None
 _session_maker: async_sessionmaker[AsyncSession] | None = None
@@ -155,6 +177,76 @@ def _attached_invocation_context(context: func.Context | None) -> Iterator[None]
         otel_context.detach(token)
 
 
+_meter = metrics.get_meter("learn_to_cloud")
+# Deferred gradings wait in their orchestrators, not in a queue this host can
+# see, so the deferral rate is the lane's backlog signal.
+_LANE_DEFERRED_COUNTER = _meter.create_counter(
+    name="verification.lane.deferred",
+    description="Activities sent back to their orchestrator because the lane was full",
+    unit="{activity}",
+)
+
+
+class GradingLaneSaturatedError(RuntimeError):
+    """The LLM grading lane stayed full for the longest wait an attempt allows."""
+
+
+class _ActivityLane:
+    """In-process concurrency partition for one kind of activity work.
+
+    Durable hands every activity the same host slots
+    (``maxConcurrentActivityFunctions`` in ``host.json``), so a burst of
+    minute-long LLM gradings could occupy all of them. ``run_llm_grading``
+    admits itself to the ``llm`` lane before any other work and, when the
+    lane is full, returns a deferral instead of waiting; the orchestrator then
+    backs off on a durable timer, which holds no slot. The ``llm`` lane is
+    opt-in (``GRADING_LANE__CONCURRENCY``); unset, it only counts, like the
+    ``deterministic`` lane.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.in_flight = 0
+
+    @contextmanager
+    def occupy(self, limit: int | None = None) -> Iterator[bool]:
+        """Yield whether the activity was admitted, holding a slot if so."""
+        if limit is not None and self.in_flight >= limit:
+            _LANE_DEFERRED_COUNTER.add(1, {"lane": self.name})
+            yield False
+            return
+        self.in_flight += 1
+        try:
+            yield True
+        finally:
+            self.in_flight -= 1
+
+
+_DETERMINISTIC_LANE = _ActivityLane("deterministic")
+_LLM_LANE = _ActivityLane("llm")
+
+
+def _observe_lanes(options: CallbackOptions) -> Iterable[Observation]:
+    return [
+        Observation(lane.in_flight, {"lane": lane.name})
+        for lane in (_DETERMINISTIC_LANE, _LLM_LANE)
+    ]
+
+
+_meter.create_observable_gauge(
+    name="verification.lane.in_flight",
+    callbacks=[_observe_lanes],
+    description="Verification activities running in each lane on this host",
+    unit="{activity}",
+)
+
+
+def _is_lane_deferral(payload: object) -> bool:
+    if not isinstance(payload, Mapping):
+        return False
+    return _activity_payload(payload).get(_LANE_DEFERRED_KEY) is True
+
+
 def _json_response(
     payload: Mapping[str, object], status_code: int
 ) -> func.HttpResponse:
@@ -305,13 +397,18 @@ def _llm_grading_step(
     Every profile records its grading requests on the verify result
     (``grading_requests`` is a list, possibly empty); the orchestrator grades
     exactly those. Deterministic types record an empty list (or omit the key),
-    so grading is skipped and the run result passes through unchanged.
+    so grading is skipped and the run result passes through unchanged. A
+    claim-checked result carries ``grading_request_claims`` references
+    instead, which ``run_llm_grading`` resolves.
     """
     llm_requests: Sequence[object] = []
     if isinstance(run_result, Mapping):
-        value = _activity_payload(run_result).get("grading_requests")
-        if isinstance(value, list):
-            llm_requests = value
+        payload = _activity_payload(run_result)
+        for key in ("grading_requests", GRADING_REQUEST_CLAIMS_KEY):
+            value = payload.get(key)
+            if isinstance(value, list) and value:
+                llm_requests = value
+                break
     if not llm_requests:
         return run_result
 
@@ -337,11 +434,7 @@ def _llm_grading_step(
     try:
         decisions: list[dict[str, object]] = []
         for request_payload in llm_requests:
-            decision_payload = yield context.call_activity_with_retry(
-                "run_llm_grading",
-                _LLM_RETRY_OPTIONS,
-                request_payload,
-            )
+            decision_payload = yield from _grade_in_llm_lane(context, request_payload)
             decisions.append(_activity_payload(decision_payload))
 
         return (
@@ -363,6 +456,34 @@ def _llm_grading_step(
         )
 
 
+def _grade_in_llm_lane(
+    context: df.DurableOrchestrationContext, request_payload: object
+):
+    """Run ``run_llm_grading``, backing off on durable timers while its lane is full.
+
+    The delay doubles from ``_LLM_LANE_FIRST_DEFERRAL`` up to
+    ``_LLM_LANE_MAX_DEFERRAL``, so a long wait adds a few history events
+    rather than one pair every few seconds.
+    """
+    delay = _LLM_LANE_FIRST_DEFERRAL
+    waited = timedelta()
+    while True:
+        decision_payload = yield context.call_activity_with_retry(
+            "run_llm_grading",
+            _LLM_RETRY_OPTIONS,
+            request_payload,
+        )
+        if not _is_lane_deferral(decision_payload):
+            return decision_payload
+        if waited >= _LLM_LANE_MAX_WAIT:
+            raise GradingLaneSaturatedError(
+                f"LLM grading lane stayed full for {waited}"
+            )
+        yield context.create_timer(context.current_utc_datetime + delay)
+        waited += delay
+        delay = min(delay * 2, _LLM_LANE_MAX_DEFERRAL)
+
+
 @app.activity_trigger(input_name="job_payload")
 async def execute_requirement_verification(
     job_payload,
@@ -374,7 +495,8 @@ async def execute_requirement_verification(
             _activity_payload(job_payload)
         )
         _set_attempt_span_attributes(prepared_attempt)
-        run_result = await run_profile(prepared_attempt)
+        with _DETERMINISTIC_LANE.occupy():
+            run_result = await run_profile(prepared_attempt)
         span = otel_trace.get_current_span()
         if span.is_recording():
             span.set_attribute(
@@ -384,7 +506,9 @@ async def execute_requirement_verification(
                 "verification.completed",
                 run_result.validation_result.verification_completed,
             )
-        result_payload = run_result.to_payload()
+        result_payload = await check_in_run_result(
+            run_result, session_maker=_get_session_maker()
+        )
         _set_result_span_attributes(run_result)
         return result_payload
 
@@ -410,13 +534,50 @@ async def run_llm_grading(
     request_payload,
     context: func.Context,
 ) -> dict[str, object]:
-    """Call Foundry for one LLM grading request and return durable-safe JSON."""
+    """Call Foundry for one LLM grading request and return durable-safe JSON.
+
+    A decision already recorded for the same rubric, evidence, prompt and
+    model deployment is returned from the grading cache without calling the
+    model.
+    ``request_payload`` is either the request or its claim-check reference.
+    """
     with _attached_invocation_context(context):
-        request = LLMGradingRequest.model_validate(_activity_payload(request_payload))
+        return await _run_llm_grading(request_payload)
+
+
+async def _run_llm_grading(request_payload: object) -> dict[str, object]:
+    """Grade one request inside the LLM lane.
+
+    Admission is checked before the claim-checked request is loaded or the
+    grading cache is read, so a deferral costs no database round trip; the
+    orchestrator backs off and retries.
+    """
+    limit = get_worker_settings().grading_lane.concurrency or None
+    with _LLM_LANE.occupy(limit) as admitted:
+        if not admitted:
+            return {_LANE_DEFERRED_KEY: True}
+        request = await load_grading_request(
+            _activity_payload(request_payload), session_maker=_get_session_maker()
+        )
         span = otel_trace.get_current_span()
         if span.is_recording():
             span.set_attribute("verification.llm_thread_id", request.thread_id)
-        decision = await grade_evidence(request.message)
+        model_deployment = GradingConfig.from_env().model_deployment_name
+        decision = await get_cached_grading_decision(
+            request,
+            model_deployment=model_deployment,
+            system_prompt=GRADER_INSTRUCTIONS,
+            session_maker=_get_session_maker(),
+        )
+        if decision is None:
+            decision = await grade_evidence(request.message)
+            await store_grading_decision(
+                request,
+                decision,
+                model_deployment=model_deployment,
+                system_prompt=GRADER_INSTRUCTIONS,
+                session_maker=_get_session_maker(),
+            )
         return LLMGradingDecisionPayload(
             task=request.task,
             decision=decision,
@@ -620,16 +781,7 @@ def _run_attempt_orchestration(context: df.DurableOrchestrationContext):
             _TRANSIENT_RETRY_OPTIONS,
             {"attempt_id": attempt_id},
         )
-        prepared_attempt_payload = preparation["attempt"]
-        prepared_attempt = PreparedVerificationAttempt.from_payload(
-            _activity_payload(prepared_attempt_payload)
-        )
-        _set_attempt_span_attributes(prepared_attempt)
-        outcome = _PreparedOutcome(
-            attempt_id=attempt_id,
-            prepared_payload=prepared_attempt_payload,
-            prepared_attempt=prepared_attempt,
-        )
+        outcome = _prepared_outcome(attempt_id, preparation["attempt"])
         run_result = yield from _verify_step(context, outcome)
         run_result = yield from _llm_grading_step(context, outcome, run_result)
         return (yield from _finalize_attempt_step(context, outcome, run_result))
@@ -637,12 +789,65 @@ def _run_attempt_orchestration(context: df.DurableOrchestrationContext):
         return (yield from _terminalize_attempt_step(context, attempt_id))
 
 
+def _run_fused_attempt_orchestration(context: df.DurableOrchestrationContext):
+    """Versioned workflow v2: prepare+verify[+finalize] -> grade -> finalize.
+
+    One ``prepare_and_verify_attempt`` activity replaces the separate
+    prepare and verify hops, and finalizes in place when the run recorded no
+    grading requests (every deterministic profile, and rubric profiles whose
+    gate failed). Only runs that need LLM grading continue through the
+    grading and finalize activities, exactly as in v1.
+    """
+    attempt_id = _attempt_id_from_input(context)
+    _set_verification_span_attributes(attempt_id=attempt_id)
+    context.set_custom_status({"step": "verifying", "attempt_id": attempt_id})
+    try:
+        fused = yield context.call_activity_with_retry(
+            "prepare_and_verify_attempt",
+            _VERIFY_RETRY_OPTIONS,
+            {"attempt_id": attempt_id},
+        )
+        fused_payload = _activity_payload(fused)
+        finalized = fused_payload.get("finalized")
+        if finalized is not None:
+            context.set_custom_status(
+                _result_custom_status(
+                    "completed", attempt_id, _activity_payload(finalized)
+                )
+            )
+            return finalized
+        outcome = _prepared_outcome(attempt_id, fused_payload["attempt"])
+        run_result = yield from _llm_grading_step(
+            context, outcome, fused_payload["run_result"]
+        )
+        return (yield from _finalize_attempt_step(context, outcome, run_result))
+    except Exception:
+        return (yield from _terminalize_attempt_step(context, attempt_id))
+
+
+def _prepared_outcome(attempt_id: str, prepared_payload: object) -> _PreparedOutcome:
+    payload = _activity_payload(prepared_payload)
+    prepared_attempt = PreparedVerificationAttempt.from_payload(payload)
+    _set_attempt_span_attributes(prepared_attempt)
+    return _PreparedOutcome(
+        attempt_id=attempt_id,
+        prepared_payload=payload,
+        prepared_attempt=prepared_attempt,
+    )
+
+
 @app.orchestration_trigger(context_name="context")
 def verification_attempt_orchestrator_v1(context: df.DurableOrchestrationContext):
-    """Run the versioned unified verification-attempt workflow."""
+    """Run the v1 workflow; kept registered for instances started before v2."""
     return (yield from _run_attempt_orchestration(context))
 
 
+@app.orchestration_trigger(context_name="context")
+def verification_attempt_orchestrator_v2(context: df.DurableOrchestrationContext):
+    """Run the versioned unified verification-attempt workflow."""
+    return (yield from _run_fused_attempt_orchestration(context))
+
+
 def _terminal_state_payload(state: AttemptTerminalState) -> dict[str, object]:
     return {
         "attempt_id": str(state.id),
@@ -677,6 +882,47 @@ async def prepare_verification_attempt(
         return preparation.to_payload()
 
 
+@app.activity_trigger(input_name="input_payload")
+async def prepare_and_verify_attempt(
+    input_payload,
+    context: func.Context,
+) -> dict[str, object]:
+    """Prepare and verify an attempt, finalizing it if no grading is needed.
+
+    Returns ``{"finalized": <terminal state>}`` when the run recorded no
+    grading requests, otherwise the prepared ``attempt`` and its
+    ``run_result`` for the grading and finalize activities. A retry after a
+    committed finalize fails prepare (the attempt is terminal) and the
+    orchestrator's terminalize is then a compare-and-set no-op.
+    """
+    with _attached_invocation_context(context):
+        data = _activity_payload(input_payload)
+        raw_attempt_id = data.get("attempt_id")
+        if not isinstance(raw_attempt_id, str):
+            raise TypeError("prepare_and_verify_attempt: missing attempt_id")
+        attempt_id = UUID(raw_attempt_id)
+        _set_verification_span_attributes(attempt_id=str(attempt_id))
+        session_maker = _get_session_maker()
+        preparation = await prepare_attempt(attempt_id, session_maker=session_maker)
+        _set_attempt_span_attributes(preparation.attempt)
+        with _DETERMINISTIC_LANE.occupy():
+            run_result = await run_profile(preparation.attempt)
+        _set_result_span_attributes(run_result)
+        if run_result.grading_requests:
+            return {
+                "attempt": preparation.attempt.to_payload(),
+                "run_result": await check_in_run_result(
+                    run_result, session_maker=session_maker
+                ),
+            }
+        state = await finalize_attempt(run_result, session_maker=session_maker)
+        logger.info(
+            "verification.attempt.finalized",
+            extra={"attempt_id": str(state.id), "outcome": state.outcome},
+        )
+        return {"finalized": _terminal_state_payload(state)}
+
+
 @app.activity_trigger(input_name="run_payload")
 async def finalize_verification_attempt(
     run_payload,
@@ -1033,6 +1279,38 @@ async def _reconcile_stale_attempts(
     )
 
 
+async def _prune_terminal_evidence_claims(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> int:
+    """Delete claim-checked transport data of attempts that have finished."""
+    async with session_maker() as db:
+        deleted = await VerificationEvidenceClaimRepository(
+            db
+        ).delete_for_completed_attempts()
+        await db.commit()
+    if deleted:
+        logger.info(
+            "verification.claim_check.pruned",
+            extra={"deleted_count": deleted},
+        )
+    return deleted
+
+
+async def _prune_expired_grading_decisions(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> int:
+    """Delete LLM grading decisions past their cache TTL."""
+    async with session_maker() as db:
+        deleted = await LLMGradingDecisionRepository(db).delete_expired()
+        await db.commit()
+    if deleted:
+        logger.info(
+            "verification.grading_cache.pruned",
+            extra={"deleted_count": deleted},
+        )
+    return deleted
+
+
 @app.timer_trigger(
     arg_name="timer",
     schedule="0 */15 * * * *",
@@ -1045,7 +1323,11 @@ async def reconcile_stale_verification_attempts(
     client: df.DurableOrchestrationClient,
     context: func.Context,
 ) -> None:
-    """Scheduled reconciler for abandoned active verification attempts."""
+    """Scheduled reconciler for abandoned active verification attempts.
+
+    Also prunes expired LLM grading decisions from the grading cache and
+    claim-checked evidence of finished attempts.
+    """
     with _attached_invocation_context(context):
         cfg = get_worker_settings().reconciler
         await _reconcile_stale_attempts(
@@ -1054,3 +1336,5 @@ async def reconcile_stale_verification_attempts(
             stale_attempt_min_age_minutes=cfg.stale_attempt_min_age_minutes,
             batch_limit=cfg.batch_limit,
         )
+        await _prune_expired_grading_decisions(_get_session_maker())
+        await _prune_terminal_evidence_claims(_get_session_maker())
@@ -16,6 +16,7 @@ from uuid import uuid4
 
 import function_app
 import pytest
+from learn_to_cloud_shared.core.config import GradingLaneConfig
 from learn_to_cloud_shared.models import VerificationAttemptOutcome
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     AttemptStatusRow,
@@ -45,6 +46,8 @@ class _RecordedCall:
 
 
 class _FakeOrchestrationContext:
+    current_utc_datetime = datetime(2026, 1, 1, tzinfo=UTC)
+
     def __init__(self, job_input: object) -> None:
         self._input = job_input
         self.statuses: list[object] = []
@@ -63,6 +66,9 @@ class _FakeOrchestrationContext:
     ) -> _RecordedCall:
         return _RecordedCall("activity_with_retry", name, input_)
 
+    def create_timer(self, fire_at: datetime) -> _RecordedCall:
+        return _RecordedCall("timer", "timer", fire_at)
+
 
 class _Raise:
     def __init__(self, exc: BaseException) -> None:
@@ -111,24 +117,42 @@ def _make_responder(
     prepared_payload: dict[str, object],
     *,
     recorded_requests: list[object] | None = None,
+    verify_result: dict[str, object] | None = None,
+    fused_result: dict[str, object] | None = None,
     fail_activity: str | None = None,
+    grading_deferrals: int = 0,
 ) -> Responder:
+    deferrals = [grading_deferrals]
+
     def responder(call: _RecordedCall) -> object:
         name = call.name
+        if name == "timer":
+            return None
         if fail_activity is not None and name == fail_activity:
             return _Raise(RuntimeError("activity failed"))
         if name == "prepare_verification_attempt":
             return {"attempt": prepared_payload}
+        if name == "prepare_and_verify_attempt":
+            if fused_result is not None:
+                return fused_result
+            return {"finalized": {"attempt_id": "a-1", "outcome": "succeeded"}}
         if name == "execute_requirement_verification":
+            if verify_result is not None:
+                return verify_result
             if recorded_requests is not None:
                 return {"status": "verified", "grading_requests": recorded_requests}
             return {"status": "verified"}
         if name == "ensure_grading_config":
             return {"valid": True, "missing_vars": []}
         if name == "run_llm_grading":
+            if deferrals[0]:
+                deferrals[0] -= 1
+                return {"lane_deferred": True}
             return {"decision": "pass"}
         if name == "apply_llm_grading_results":
             return {"status": "graded"}
+        if name == "llm_grading_failed":
+            return {"status": "grading_failed"}
         if name == "finalize_verification_attempt":
             return {"attempt_id": "a-1", "outcome": "succeeded"}
         if name == "terminalize_verification_attempt":
@@ -172,6 +196,24 @@ class TestAttemptOrchestration:
         ]
         assert result == {"attempt_id": "a-1", "outcome": "succeeded"}
 
+    def test_claim_checked_requests_are_graded_by_reference(self) -> None:
+        payload = _prepared_payload(
+            journal_api_verifier_requirement(slug="journal"),
+            "https://github.com/alice/journal",
+        )
+        reference = {"attempt_id": "a-1", "content_hash": "abc"}
+        ctx = _FakeOrchestrationContext({"attempt_id": "a-1"})
+        responder = _make_responder(
+            payload,
+            verify_result={
+                "grading_requests": None,
+                "grading_request_claims": [reference],
+            },
+        )
+        calls, _ = _drive(function_app._run_attempt_orchestration(ctx), responder)
+        grading_calls = [call for call in calls if call.name == "run_llm_grading"]
+        assert [call.payload for call in grading_calls] == [reference]
+
     def test_prepare_failure_terminalizes(self) -> None:
         payload = _prepared_payload(
             repo_fork_requirement(slug="fork", required_repo="owner/repo"),
@@ -205,14 +247,171 @@ class TestAttemptOrchestration:
         ]
 
 
+class TestFusedAttemptOrchestration:
+    def test_deterministic_run_is_one_activity(self) -> None:
+        payload = _prepared_payload(
+            repo_fork_requirement(slug="fork", required_repo="owner/repo"),
+            "https://github.com/alice/repo",
+        )
+        ctx = _FakeOrchestrationContext({"attempt_id": "a-1"})
+        calls, result = _drive(
+            function_app._run_fused_attempt_orchestration(ctx),
+            _make_responder(payload),
+        )
+        assert _sequence(calls) == [
+            ("activity_with_retry", "prepare_and_verify_attempt"),
+        ]
+        assert calls[0].payload == {"attempt_id": "a-1"}
+        assert result == {"attempt_id": "a-1", "outcome": "succeeded"}
+        assert ctx.statuses[-1] == {"step": "completed", "attempt_id": "a-1"}
+
+    def test_graded_run_continues_to_grading_and_finalize(self) -> None:
+        payload = _prepared_payload(
+            journal_api_verifier_requirement(slug="journal"),
+            "https://github.com/alice/journal",
+        )
+        ctx = _FakeOrchestrationContext({"attempt_id": "a-1"})
+        responder = _make_responder(
+            payload,
+            fused_result={
+                "attempt": payload,
+                "run_result": {"grading_requests": [{"task": "a"}]},
+            },
+        )
+        calls, result = _drive(
+            function_app._run_fused_attempt_orchestration(ctx), responder
+        )
+        assert _sequence(calls) == [
+            ("activity_with_retry", "prepare_and_verify_attempt"),
+            ("activity", "ensure_grading_config"),
+            ("activity_with_retry", "run_llm_grading"),
+            ("activity", "apply_llm_grading_results"),
+            ("activity_with_retry", "finalize_verification_attempt"),
+        ]
+        assert result == {"attempt_id": "a-1", "outcome": "succeeded"}
+
+    def test_fused_failure_terminalizes(self) -> None:
+        payload = _prepared_payload(
+            repo_fork_requirement(slug="fork", required_repo="owner/repo"),
+            "https://github.com/alice/repo",
+        )
+        ctx = _FakeOrchestrationContext({"attempt_id": "a-1"})
+        responder = _make_responder(payload, fail_activity="prepare_and_verify_attempt")
+        calls, result = _drive(
+            function_app._run_fused_attempt_orchestration(ctx), responder
+        )
+        assert _sequence(calls) == [
+            ("activity_with_retry", "prepare_and_verify_attempt"),
+            ("activity_with_retry", "terminalize_verification_attempt"),
+        ]
+        assert result == {"attempt_id": "a-1", "outcome": "server_error"}
+
+
+class TestGradingLane:
+    def _graded_run(self, **kwargs: Any) -> tuple[list[_RecordedCall], object]:
+        payload = _prepared_payload(
+            journal_api_verifier_requirement(slug="journal"),
+            "https://github.com/alice/journal",
+        )
+        ctx = _FakeOrchestrationContext({"attempt_id": "a-1"})
+        responder = _make_responder(
+            payload, recorded_requests=[{"task": "a"}], **kwargs
+        )
+        return _drive(function_app._run_attempt_orchestration(ctx), responder)
+
+    def test_full_lane_backs_off_on_durable_timers(self) -> None:
+        calls, result = self._graded_run(grading_deferrals=2)
+        grading = [
+            call.as_tuple()
+            for call in calls
+            if call.name in ("run_llm_grading", "timer", "apply_llm_grading_results")
+        ]
+        assert grading == [
+            ("activity_with_retry", "run_llm_grading"),
+            ("timer", "timer"),
+            ("activity_with_retry", "run_llm_grading"),
+            ("timer", "timer"),
+            ("activity_with_retry", "run_llm_grading"),
+            ("activity", "apply_llm_grading_results"),
+        ]
+        now = _FakeOrchestrationContext.current_utc_datetime
+        first = function_app._LLM_LANE_FIRST_DEFERRAL
+        assert [call.payload for call in calls if call.kind == "timer"] == [
+            now + first,
+            now + first * 2,
+        ]
+        assert result == {"attempt_id": "a-1", "outcome": "succeeded"}
+
+    def test_backoff_is_capped(self) -> None:
+        calls, _ = self._graded_run(grading_deferrals=6)
+        delays = [
+            call.payload - _FakeOrchestrationContext.current_utc_datetime
+            for call in calls
+            if call.kind == "timer"
+        ]
+        assert delays[-1] == function_app._LLM_LANE_MAX_DEFERRAL
+        assert max(delays) == function_app._LLM_LANE_MAX_DEFERRAL
+
+    def test_saturated_lane_fails_grading(self) -> None:
+        with patch.object(
+            function_app, "_LLM_LANE_MAX_WAIT", function_app._LLM_LANE_FIRST_DEFERRAL
+        ):
+            calls, _ = self._graded_run(grading_deferrals=5)
+        [failed] = [call for call in calls if call.name == "llm_grading_failed"]
+        assert isinstance(failed.payload, dict)
+        assert failed.payload["error_type"] == "GradingLaneSaturatedError"
+        assert [call.name for call in calls].count("run_llm_grading") == 2
+
+    def test_lane_admits_up_to_its_limit(self) -> None:
+        lane = function_app._ActivityLane("test")
+        with lane.occupy(1) as first, lane.occupy(1) as second:
+            assert (first, second) == (True, False)
+            assert lane.in_flight == 1
+        with lane.occupy(1) as again:
+            assert again
+        assert lane.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_full_lane_defers_before_loading_the_request(self) -> None:
+        load = AsyncMock()
+        with (
+            patch.object(function_app, "get_worker_settings") as settings,
+            patch.object(function_app, "load_grading_request", new=load),
+            function_app._LLM_LANE.occupy(),
+        ):
+            settings.return_value.grading_lane.concurrency = 1
+            result = await function_app._run_llm_grading({"claim": "ref"})
+
+        assert result == {"lane_deferred": True}
+        load.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lane_is_open_by_default(self) -> None:
+        load = AsyncMock(side_effect=RuntimeError("loaded"))
+        with (
+            patch.object(function_app, "get_worker_settings") as settings,
+            patch.object(function_app, "_get_session_maker"),
+            patch.object(function_app, "load_grading_request", new=load),
+            function_app._LLM_LANE.occupy(),
+        ):
+            settings.return_value.grading_lane = GradingLaneConfig()
+            with pytest.raises(RuntimeError, match="loaded"):
+                await function_app._run_llm_grading({"claim": "ref"})
+
+        assert function_app._LLM_LANE.in_flight == 0
+
+
 class TestVersionedOrchestratorRegistered:
     def test_versioned_name_and_symbol(self) -> None:
         assert (
             function_app._ATTEMPT_ORCHESTRATOR_NAME
-            == "verification_attempt_orchestrator_v1"
+            == "verification_attempt_orchestrator_v2"
         )
         assert hasattr(function_app, function_app._ATTEMPT_ORCHESTRATOR_NAME)
 
+    def test_v1_stays_registered_for_in_flight_instances(self) -> None:
+        assert hasattr(function_app, "verification_attempt_orchestrator_v1")
+
 
 # --------------------------------------------------------------------------- #
 # Fake Durable client / status
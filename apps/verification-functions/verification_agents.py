@@ -56,7 +56,7 @@ _PROJECT_ENDPOINT_ENV = "FOUNDRY_PROJECT_ENDPOINT"
 _MODEL_DEPLOYMENT_ENV = "FOUNDRY_MODEL_DEPLOYMENT_NAME"
 _REQUIRED_GRADING_ENV = (_PROJECT_ENDPOINT_ENV, _MODEL_DEPLOYMENT_ENV)
 
-_GRADER_INSTRUCTIONS = """
+GRADER_INSTRUCTIONS = """
 You are the Learn to Cloud verification grader.
 
 Grade only the evidence provided in the request. Do not infer unstated files,
@@ -142,7 +142,7 @@ def get_verification_grader() -> Agent[Any]:
             model=config.model_deployment_name,
             credential=_credential(),
         ),
-        instructions=_GRADER_INSTRUCTIONS,
+        instructions=GRADER_INSTRUCTIONS,
         id="verification-grader",
         name=VERIFICATION_GRADER_AGENT_NAME,
         description="Grades verification evidence against a rubric.",
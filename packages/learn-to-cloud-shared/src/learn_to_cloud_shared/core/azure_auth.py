@@ -1,7 +1,11 @@
 """Azure AD token acquisition for PostgreSQL managed identity auth.
 
-Uses ManagedIdentityCredential (native async) for direct IMDS access.
-The SDK handles token caching, retries, and refresh internally.
+Uses ManagedIdentityCredential (native async) for direct IMDS access; the SDK
+handles retries. On top of it, :func:`get_token` keeps one token per scope and
+refreshes it in the background once it is within ``_REFRESH_AHEAD_SECONDS``
+of expiry, so opening a pooled connection only waits for a token on a cold
+start or after a failed refresh. Concurrent callers share one in-flight
+acquisition.
 
 Note: azure.identity.aio's default async transport requires the `aiohttp`
 package at runtime, even though azure-identity does not declare it as a
@@ -12,14 +16,47 @@ dependency. Keep `aiohttp` pinned in pyproject.toml or this raises
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
+import time
+from dataclasses import dataclass
 
 from azure.identity.aio import ManagedIdentityCredential
+from opentelemetry import metrics
 
 AZURE_PG_SCOPE = "https://ossrdbms-aad.database.windows.net/.default"
 
+# Refresh this long before expiry; Entra tokens live about an hour.
+_REFRESH_AHEAD_SECONDS = 5 * 60
+# Never hand out a token this close to expiry, even while a refresh runs.
+_EXPIRY_MARGIN_SECONDS = 30
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter("learn_to_cloud")
+_TOKEN_ACQUIRE_HISTOGRAM = _meter.create_histogram(
+    name="azure.token.acquire.duration",
+    description="Time to acquire an Entra ID token from the managed identity",
+    unit="ms",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedToken:
+    token: str
+    expires_on: float
+
+    def usable(self, now: float) -> bool:
+        return now < self.expires_on - _EXPIRY_MARGIN_SECONDS
+
+    def due_for_refresh(self, now: float) -> bool:
+        return now >= self.expires_on - _REFRESH_AHEAD_SECONDS
+
+
 _azure_credential: ManagedIdentityCredential | None = None
 _credential_lock = asyncio.Lock()
+_tokens: dict[str, _CachedToken] = {}
+_refreshes: dict[str, asyncio.Task[_CachedToken]] = {}
 
 
 async def get_credential() -> ManagedIdentityCredential:
@@ -39,16 +76,63 @@ async def get_credential() -> ManagedIdentityCredential:
         return _azure_credential
 
 
-async def get_token(scope: str = AZURE_PG_SCOPE) -> str:
-    """Get Azure AD token for the requested scope."""
+async def _acquire(scope: str) -> _CachedToken:
     credential = await get_credential()
-    token = await credential.get_token(scope)
-    return token.token
+    started = time.perf_counter()
+    try:
+        access_token = await credential.get_token(scope)
+    finally:
+        _TOKEN_ACQUIRE_HISTOGRAM.record(
+            (time.perf_counter() - started) * 1000, {"scope": scope}
+        )
+    cached = _CachedToken(access_token.token, float(access_token.expires_on))
+    _tokens[scope] = cached
+    return cached
+
+
+def _finish_refresh(scope: str, task: asyncio.Task[_CachedToken]) -> None:
+    if _refreshes.get(scope) is task:
+        del _refreshes[scope]
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "azure.token.refresh_failed",
+            extra={"scope": scope, "error_type": type(task.exception()).__name__},
+        )
+
+
+def _refresh(scope: str) -> asyncio.Task[_CachedToken]:
+    """Return the in-flight acquisition for ``scope``, starting one if idle."""
+    task = _refreshes.get(scope)
+    if task is None:
+        task = asyncio.ensure_future(_acquire(scope))
+        _refreshes[scope] = task
+        task.add_done_callback(lambda done: _finish_refresh(scope, done))
+    return task
+
+
+async def get_token(scope: str = AZURE_PG_SCOPE) -> str:
+    """Get Azure AD token for the requested scope.
+
+    Returns the cached token while it is usable, starting a background
+    refresh once it is due; otherwise waits for the shared acquisition.
+    """
+    now = time.time()
+    cached = _tokens.get(scope)
+    if cached is not None and cached.usable(now):
+        if cached.due_for_refresh(now):
+            _refresh(scope)
+        return cached.token
+    cached = await asyncio.shield(_refresh(scope))
+    return cached.token
 
 
 async def close_credential() -> None:
     """Close the credential's transport session. Call during app shutdown."""
     global _azure_credential
+    for task in list(_refreshes.values()):
+        task.cancel()
+    _refreshes.clear()
+    _tokens.clear()
     async with _credential_lock:
         if _azure_credential is not None:
             await _azure_credential.close()
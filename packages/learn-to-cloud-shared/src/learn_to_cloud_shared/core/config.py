@@ -19,6 +19,13 @@ class Environment(StrEnum):
     PRODUCTION = "production"
 
 
+class JsonCodec(StrEnum):
+    """JSON/JSONB codec for database connections."""
+
+    PYDANTIC_CORE = "pydantic_core"
+    JSON = "json"
+
+
 _DEV_SESSION_SECRET = "dev-secret-key-change-in-production"
 
 _SETTINGS_CONFIG = SettingsConfigDict(
@@ -45,7 +52,16 @@ class FrozenConfig(BaseModel):
 
 
 class DatabaseConfig(FrozenConfig):
-    """Database connection, pool, and timeout config."""
+    """Database connection, pool, and timeout config.
+
+    ``pool_warmup`` opens ``pool_size`` connections during API startup, before
+    readiness passes; ``pool_warmup_prepare`` also runs the dashboard's
+    progress reads on each so their prepared statements are cached.
+    ``prepared_statement_cache_size`` bounds the per-connection asyncpg
+    prepared-statement cache (``0`` disables it). ``json_codec`` picks the
+    JSON/JSONB encoder and decoder: ``pydantic_core`` (Rust) or stdlib
+    ``json``.
+    """
 
     url: str = ""
 
@@ -60,6 +76,10 @@ class DatabaseConfig(FrozenConfig):
     pool_max_overflow: int = 5
     pool_timeout: int = 30
     pool_recycle: int = 1800
+    pool_warmup: bool = True
+    pool_warmup_prepare: bool = False
+    prepared_statement_cache_size: int = Field(default=100, ge=0)
+    json_codec: JsonCodec = JsonCodec.PYDANTIC_CORE
     statement_timeout_ms: int = 10000
     echo: bool = False
 
@@ -80,9 +100,39 @@ class DatabaseConfig(FrozenConfig):
 
 
 class GitHubConfig(FrozenConfig):
-    """Server-to-server GitHub API access."""
+    """Server-to-server GitHub API access.
+
+    ``response_cache_size`` and ``response_cache_max_bytes`` bound the
+    in-process ETag cache behind ``github_api_get`` by entries and by stored
+    bytes; ``0`` for either disables conditional requests.
+    ``archive_evidence`` makes profiles that discover evidence by path
+    pattern read the repository from one tarball instead of per-file GETs.
+    ``graphql_metadata`` answers URL-existence, fork and branch-HEAD lookups
+    with batched GraphQL queries; it needs ``token`` (GraphQL is auth-only).
+    Below ``rate_limit_low_watermark`` of the ``X-RateLimit-Limit`` budget,
+    calls are spaced out, each waiting at most ``rate_limit_max_wait_seconds``;
+    a call fails fast only when the budget is spent and resets later than that.
+    ``tokens`` is a comma-separated list of extra credentials (PATs or
+    installation tokens) pooled with ``token``; each has its own budget.
+    """
 
     token: str = ""
+    tokens: str = ""
+    response_cache_size: int = Field(default=1024, ge=0)
+    response_cache_max_bytes: int = Field(default=32 * 1024 * 1024, ge=0)
+    archive_evidence: bool = False
+    graphql_metadata: bool = False
+    rate_limit_low_watermark: float = Field(default=0.1, ge=0, le=1)
+    rate_limit_max_wait_seconds: float = Field(default=5.0, ge=0)
+
+    def token_list(self) -> list[str]:
+        """``token`` followed by the distinct pooled ``tokens``."""
+        pooled = [self.token] if self.token else []
+        for token in self.tokens.split(","):
+            token = token.strip()
+            if token and token not in pooled:
+                pooled.append(token)
+        return pooled
 
 
 class LabsConfig(FrozenConfig):
@@ -111,6 +161,59 @@ class ReconcilerConfig(FrozenConfig):
     batch_limit: int = Field(default=200, ge=1)
 
 
+class ResultCacheConfig(FrozenConfig):
+    """Verification result memoization config.
+
+    A memoizable profile's run is reused for an identical resubmission
+    (same requirement snapshot, value, username and repository HEAD) for
+    ``success_ttl_seconds`` when it passed and ``failure_ttl_seconds`` when it
+    failed. Incomplete runs are never reused; ``maxsize`` ``0`` disables it.
+    """
+
+    maxsize: int = Field(default=2048, ge=0)
+    success_ttl_seconds: int = Field(default=24 * 60 * 60, ge=0)
+    failure_ttl_seconds: int = Field(default=5 * 60, ge=0)
+
+
+class GradingCacheConfig(FrozenConfig):
+    """LLM grading decision cache config.
+
+    A decision is reused for ``ttl_seconds`` when the same rubric task,
+    evidence hashes and model deployment are graded again; ``0`` disables the
+    cache. ``bypass`` skips lookups but still records fresh decisions, e.g.
+    to re-grade after a grader prompt change.
+    """
+
+    ttl_seconds: int = Field(default=7 * 24 * 60 * 60, ge=0)
+    bypass: bool = False
+
+
+class ClaimCheckConfig(FrozenConfig):
+    """Orchestration payload claim-check config.
+
+    When ``enabled``, the verify activity writes evidence bundles and grading
+    requests to Postgres and the orchestration history carries only their
+    references. Transport data smaller than ``min_bytes`` stays inline.
+    """
+
+    enabled: bool = False
+    min_bytes: int = Field(default=16 * 1024, ge=0)
+
+
+class GradingLaneConfig(FrozenConfig):
+    """LLM grading activity lane config.
+
+    When ``concurrency`` is set, at most that many ``run_llm_grading``
+    activities run at once on a Functions host; the rest are deferred back to
+    their orchestrator, so the activity slots left over in ``host.json`` stay
+    free for deterministic checks. Keep it below
+    ``maxConcurrentActivityFunctions``. ``0`` (the default) disables the lane,
+    leaving ``host.json`` as the only bound.
+    """
+
+    concurrency: int = Field(default=0, ge=0)
+
+
 class ContentConfig(FrozenConfig):
     """Authored curriculum content config."""
 
@@ -196,10 +299,32 @@ class FrontendTelemetryConfig(FrozenConfig):
 
 
 class VerificationFunctionsConfig(FrozenConfig):
-    """Durable verification Functions starter config."""
+    """Durable verification Functions starter config.
+
+    ``inline_local_profiles`` lets the API verify submission types whose
+    profile is marked ``inline`` (local token checks) in the submit request
+    instead of starting an orchestration.
+    """
 
     base_url: str = ""
     token_scope: str = ""
+    inline_local_profiles: bool = True
+
+
+class AdmissionConfig(FrozenConfig):
+    """Global admission control for verification submissions.
+
+    Once ``max_active_attempts`` attempts are active (``outcome IS NULL``),
+    new Durable submissions are turned away with a retry hint of
+    ``retry_after_seconds`` instead of starting more orchestrations; ``0``
+    disables the limit. The active count is re-read at most every
+    ``count_ttl_seconds`` per API instance, so the limit is soft: each
+    instance can overshoot it by one TTL's worth of submits.
+    """
+
+    max_active_attempts: int = Field(default=0, ge=0)
+    retry_after_seconds: int = Field(default=30, ge=1)
+    count_ttl_seconds: float = Field(default=2.0, ge=0.0)
 
 
 class RateLimitConfig(FrozenConfig):
@@ -236,6 +361,10 @@ class WorkerSettings(BaseSettings):
     http: HttpConfig = HttpConfig()
     content: ContentConfig = ContentConfig()
     reconciler: ReconcilerConfig = ReconcilerConfig()
+    result_cache: ResultCacheConfig = ResultCacheConfig()
+    grading_cache: GradingCacheConfig = GradingCacheConfig()
+    claim_check: ClaimCheckConfig = ClaimCheckConfig()
+    grading_lane: GradingLaneConfig = GradingLaneConfig()
 
 
 class WebSettings(BaseSettings):
@@ -255,6 +384,7 @@ class WebSettings(BaseSettings):
     cors: CorsConfig = CorsConfig()
     frontend_telemetry: FrontendTelemetryConfig = FrontendTelemetryConfig()
     verification_functions: VerificationFunctionsConfig = VerificationFunctionsConfig()
+    admission: AdmissionConfig = AdmissionConfig()
     rate_limit: RateLimitConfig = RateLimitConfig()
     web_security: WebSecurityConfig = WebSecurityConfig()
     startup_timeout: int = 60
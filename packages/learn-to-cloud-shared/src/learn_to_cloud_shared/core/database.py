@@ -8,14 +8,17 @@ Authentication modes:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Annotated
 
 import asyncpg
 from fastapi import Depends, Request
+from pydantic_core import from_json, to_json
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -24,7 +27,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from learn_to_cloud_shared.core.azure_auth import get_token as _get_azure_token
-from learn_to_cloud_shared.core.config import DatabaseConfig
+from learn_to_cloud_shared.core.config import DatabaseConfig, JsonCodec
 from learn_to_cloud_shared.core.observability import instrument_database
 
 logger = logging.getLogger(__name__)
@@ -43,10 +46,10 @@ def _build_azure_database_url(settings: DatabaseConfig) -> str:
 
 
 async def _azure_asyncpg_creator(settings: DatabaseConfig):
-    """Create an asyncpg connection using a fresh Entra ID token.
+    """Create an asyncpg connection using a cached Entra ID token.
 
-    Tokens expire (~1 hour), so each new connection fetches a fresh one
-    via managed identity.
+    Tokens expire (~1 hour); ``core.azure_auth`` refreshes the cached one in
+    the background before then, so a new connection rarely waits on IMDS.
     """
     token = await _get_azure_token()
 
@@ -71,6 +74,18 @@ async def _azure_asyncpg_creator(settings: DatabaseConfig):
         raise
 
 
+def _to_json_text(value: object) -> str:
+    return to_json(value).decode()
+
+
+# (serializer, deserializer) for JSON/JSONB binds and results. SQLAlchemy's
+# asyncpg dialect registers the deserializer as the connection's type codec.
+_JSON_CODECS = {
+    JsonCodec.PYDANTIC_CORE: (_to_json_text, from_json),
+    JsonCodec.JSON: (json.dumps, json.loads),
+}
+
+
 def create_engine(settings: DatabaseConfig) -> AsyncEngine:
     if settings.use_azure_postgres:
         database_url = _build_azure_database_url(settings)
@@ -82,6 +97,8 @@ def create_engine(settings: DatabaseConfig) -> AsyncEngine:
         database_url = settings.url
         async_creator = None
 
+    json_serializer, json_deserializer = _JSON_CODECS[settings.json_codec]
+
     # Note: pool_pre_ping is intentionally NOT enabled. It interacts badly
     # with the asyncpg dialect's transaction state tracking and required a
     # brittle private-state workaround. pool_recycle keeps connections fresh
@@ -93,14 +110,27 @@ def create_engine(settings: DatabaseConfig) -> AsyncEngine:
         "max_overflow": settings.pool_max_overflow,
         "pool_timeout": settings.pool_timeout,
         "pool_recycle": settings.pool_recycle,
+        "json_serializer": json_serializer,
+        "json_deserializer": json_deserializer,
     }
 
     if async_creator is None:
         engine_kwargs["connect_args"] = {
-            "server_settings": {"statement_timeout": str(settings.statement_timeout_ms)}
+            "server_settings": {
+                "statement_timeout": str(settings.statement_timeout_ms)
+            },
+            "prepared_statement_cache_size": settings.prepared_statement_cache_size,
         }
     else:
-        engine_kwargs["async_creator"] = async_creator
+        # ``async_creator`` cannot carry DBAPI arguments such as the statement
+        # cache size, so emulate it with ``creator`` as SQLAlchemy suggests.
+        def creator():
+            return engine.sync_engine.dialect.loaded_dbapi.connect(
+                async_creator_fn=async_creator,
+                prepared_statement_cache_size=settings.prepared_statement_cache_size,
+            )
+
+        engine_kwargs["creator"] = creator
 
     engine = create_async_engine(database_url, **engine_kwargs)
 
@@ -173,6 +203,72 @@ async def init_db(engine: AsyncEngine, settings: DatabaseConfig) -> None:
     logger.info("db.connectivity.verified")
 
 
+async def warm_pool(
+    engine: AsyncEngine,
+    settings: DatabaseConfig,
+    *,
+    prepare: Callable[[AsyncSession], Awaitable[object]] | None = None,
+) -> int:
+    """Open ``pool_size`` connections at once and leave them idle in the pool.
+
+    Each connection pays its TCP/TLS handshake (and, on Azure, its token
+    lookup) here instead of on an early request. With ``prepare``, each
+    connection also runs it in a throwaway session, which fills asyncpg's
+    per-connection prepared-statement cache for those queries.
+
+    Returns how many connections were warmed. Failures are logged, not
+    raised: ``init_db`` has already proved the database is reachable.
+    """
+
+    async def _open() -> AsyncConnection:
+        conn = await engine.connect().start()
+        try:
+            if prepare is not None:
+                async with AsyncSession(bind=conn) as session:
+                    await prepare(session)
+            await conn.rollback()
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    tasks = [asyncio.ensure_future(_open()) for _ in range(settings.pool_size)]
+    if not tasks:
+        return 0
+    warmed = 0
+    errors: list[BaseException] = []
+    try:
+        async with asyncio.timeout(settings.timeout):
+            await asyncio.wait(tasks)
+    except TimeoutError:
+        pass
+    finally:
+        # Also runs when the caller cancels warm-up (the lifespan's startup
+        # timeout): an abandoned task, or a finished one whose connection is
+        # never closed, would keep that connection checked out for good.
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+        for task in tasks:
+            if task.cancelled():
+                errors.append(TimeoutError())
+            elif (exc := task.exception()) is not None:
+                errors.append(exc)
+            else:
+                await task.result().close()
+                warmed += 1
+
+    extra = {"warmed": warmed, "pool_size": settings.pool_size}
+    if errors:
+        logger.warning(
+            "db.pool.warmup_incomplete",
+            extra={**extra, "error_type": type(errors[0]).__name__},
+        )
+    else:
+        logger.info("db.pool.warmed", extra=extra)
+    return warmed
+
+
 async def dispose_engine(engine: AsyncEngine) -> None:
     await engine.dispose()
     logger.info("db.engine.disposed")
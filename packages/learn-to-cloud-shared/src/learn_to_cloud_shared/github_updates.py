@@ -10,6 +10,7 @@ renders.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 
@@ -92,19 +93,25 @@ async def _fetch_latest_commit(owner: str, repo: str) -> RepoUpdate:
 async def get_latest_curriculum_commits() -> list[RepoUpdate]:
     """Latest commit per curriculum repo, cached for ~10 minutes.
 
+    Cache misses are fetched concurrently; concurrent misses for the same
+    repo share one request through ``github_api_get``'s single flight.
     Never raises: repos whose lookup fails come back as ``unavailable``.
     """
-    updates: list[RepoUpdate] = []
-    for owner, repo in CURRICULUM_REPOS:
-        key = f"{owner}/{repo}"
-        cached = _CACHE.get(key)
-        if cached is not None:
-            updates.append(cached)
-            continue
-        update = await _fetch_latest_commit(owner, repo)
-        # Only cache successful lookups so a transient failure doesn't
-        # pin an "unavailable" card for the full TTL.
-        if update.available:
-            _CACHE[key] = update
-        updates.append(update)
-    return updates
+    return list(
+        await asyncio.gather(
+            *(_cached_latest_commit(owner, repo) for owner, repo in CURRICULUM_REPOS)
+        )
+    )
+
+
+async def _cached_latest_commit(owner: str, repo: str) -> RepoUpdate:
+    key = f"{owner}/{repo}"
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+    update = await _fetch_latest_commit(owner, repo)
+    # Only cache successful lookups so a transient failure doesn't
+    # pin an "unavailable" card for the full TTL.
+    if update.available:
+        _CACHE[key] = update
+    return update
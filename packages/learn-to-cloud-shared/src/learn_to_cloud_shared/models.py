@@ -136,12 +136,6 @@ class VerificationAttempt(TimestampMixin, Base):
             "snapshot_source IN ('submitted', 'reconstructed')",
             name="ck_verification_attempts_snapshot_source",
         ),
-        CheckConstraint(
-            "snapshot_source = 'reconstructed' OR ("
-            "requirement_snapshot IS NOT NULL "
-            "AND requirement_snapshot_hash IS NOT NULL)",
-            name="ck_verification_attempts_submitted_snapshot_present",
-        ),
         Index(
             "uq_verification_attempts_active_user_req",
             "user_id",
@@ -161,6 +155,14 @@ class VerificationAttempt(TimestampMixin, Base):
             "requirement_uuid",
             text("created_at DESC"),
         ),
+        Index(
+            "ix_verification_attempts_terminal_latest",
+            "user_id",
+            "requirement_uuid",
+            text("created_at DESC"),
+            postgresql_include=["id", "outcome", "completed_at"],
+            postgresql_where=text("outcome IS NOT NULL"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -180,7 +182,6 @@ class VerificationAttempt(TimestampMixin, Base):
     )
     curriculum_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     content_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
-    requirement_snapshot: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     requirement_snapshot_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
     snapshot_source: Mapped[str] = mapped_column(Text, nullable=False)
     payload_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
@@ -198,7 +199,78 @@ class VerificationAttempt(TimestampMixin, Base):
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
-    feedback_json: Mapped[list[dict] | None] = mapped_column(JSONB, nullable=True)
     validation_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     error_code: Mapped[str | None] = mapped_column(Text, nullable=True)
     terminal_source: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Legacy inline payloads, superseded by VerificationAttemptPayload.
+    # Revision 0058 mirrors writes from older releases into the payload
+    # table, and finalize still writes feedback_json for API releases that
+    # read it inline. Nothing here reads them; a contract revision drops them.
+    legacy_requirement_snapshot: Mapped[dict | None] = mapped_column(
+        "requirement_snapshot", JSONB, nullable=True, deferred=True
+    )
+    legacy_feedback_json: Mapped[list[dict] | None] = mapped_column(
+        "feedback_json", JSONB, nullable=True, deferred=True
+    )
+
+
+class VerificationAttemptPayload(Base):
+    """Large JSONB payloads of one verification attempt.
+
+    Kept off ``verification_attempts`` so the lifecycle, gating and progress
+    reads scan narrow rows; only prepare and card rendering join it.
+    """
+
+    __tablename__ = "verification_attempt_payloads"
+
+    attempt_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("verification_attempts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    requirement_snapshot: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    feedback_json: Mapped[list[dict] | None] = mapped_column(JSONB, nullable=True)
+
+
+class LLMGradingDecisionCacheEntry(Base):
+    """A reusable LLM grading decision for one rubric, evidence and model."""
+
+    __tablename__ = "llm_grading_decisions"
+    __table_args__ = (Index("ix_llm_grading_decisions_expires_at", "expires_at"),)
+
+    cache_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    task_id: Mapped[str] = mapped_column(Text, nullable=False)
+    rubric_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    model_deployment: Mapped[str] = mapped_column(Text, nullable=False)
+    decision: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=utcnow
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
+class VerificationEvidenceClaim(Base):
+    """Evidence or a grading request held out of an orchestration payload."""
+
+    __tablename__ = "verification_evidence_claims"
+    __table_args__ = (
+        CheckConstraint(
+            "kind IN ('evidence', 'grading_request')",
+            name="ck_verification_evidence_claims_kind",
+        ),
+    )
+
+    attempt_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("verification_attempts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    content_hash: Mapped[str] = mapped_column(Text, primary_key=True)
+    kind: Mapped[str] = mapped_column(Text, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=utcnow
+    )
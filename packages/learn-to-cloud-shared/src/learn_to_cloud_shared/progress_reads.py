@@ -7,10 +7,12 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from learn_to_cloud_shared.content_catalog import get_curriculum_catalog
 from learn_to_cloud_shared.repositories.learner_step_completion_repository import (
     LearnerStepCompletionRepository,
 )
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
+    SubmissionGateState,
     VerificationAttemptRepository,
 )
 
@@ -53,11 +55,44 @@ async def are_all_requirements_succeeded(
 ) -> bool:
     """Check if the user has succeeded at ALL of the given requirements.
 
-    Used for sequential phase gating and the "already validated" submission
-    precondition check.
+    Used for sequential phase gating. Counts only the candidate UUIDs in
+    SQL rather than loading the learner's whole succeeded set.
     """
-    uuids = list(requirement_uuids)
+    uuids = set(requirement_uuids)
     if not uuids:
         return True
-    succeeded = await resolve_succeeded_requirement_uuids(db, user_id, uuids)
-    return len(succeeded) >= len(uuids)
+    return await VerificationAttemptRepository(db).are_all_requirements_succeeded(
+        user_id, uuids
+    )
+
+
+async def read_submission_gate(
+    db: AsyncSession,
+    user_id: int,
+    requirement_uuid: UUID,
+    prerequisite_requirement_uuids: Iterable[UUID] = (),
+) -> SubmissionGateState:
+    """Read the already-validated, active-attempt, and prerequisite state at once.
+
+    Used by the submission precondition check.
+    """
+    return await VerificationAttemptRepository(db).get_submission_gate(
+        user_id, requirement_uuid, prerequisite_requirement_uuids
+    )
+
+
+# GitHub user ids are positive, so reads for this id match no rows.
+_WARMUP_USER_ID = 0
+
+
+async def prepare_progress_reads(db: AsyncSession) -> None:
+    """Run the dashboard's progress reads once for a user with no rows.
+
+    A pool warm-up hook: each statement is prepared on the session's
+    connection with the same catalog-sized candidate lists real requests use.
+    """
+    catalog = get_curriculum_catalog()
+    await resolve_completed_step_uuids(db, _WARMUP_USER_ID, catalog.active_step_uuids)
+    await resolve_succeeded_requirement_uuids(
+        db, _WARMUP_USER_ID, catalog.active_requirement_uuids
+    )
@@ -11,13 +11,21 @@ on HTTP handling. This separation provides:
 from learn_to_cloud_shared.repositories.learner_step_completion_repository import (
     LearnerStepCompletionRepository,
 )
+from learn_to_cloud_shared.repositories.llm_grading_decision_repository import (
+    LLMGradingDecisionRepository,
+)
 from learn_to_cloud_shared.repositories.user_repository import UserRepository
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     VerificationAttemptRepository,
 )
+from learn_to_cloud_shared.repositories.verification_evidence_claim_repository import (
+    VerificationEvidenceClaimRepository,
+)
 
 __all__ = [
+    "LLMGradingDecisionRepository",
     "LearnerStepCompletionRepository",
     "UserRepository",
     "VerificationAttemptRepository",
+    "VerificationEvidenceClaimRepository",
 ]
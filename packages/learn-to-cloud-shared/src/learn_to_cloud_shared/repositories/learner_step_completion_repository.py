@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    ARRAY,
+    CompoundSelect,
+    Uuid,
+    cast,
+    delete,
+    false,
+    func,
+    literal,
+    select,
+    true,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from learn_to_cloud_shared.models import LearnerStepCompletion
+from learn_to_cloud_shared.models import LearnerStepCompletion, utcnow
+
+
+@dataclass(frozen=True, slots=True)
+class StepCompletionWrite:
+    """Steps a bulk write changed plus the candidates completed afterwards."""
+
+    changed: set[UUID]
+    completed: set[UUID]
 
 
 class LearnerStepCompletionRepository:
@@ -64,6 +84,110 @@ class LearnerStepCompletionRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def create_many_returning_completed(
+        self,
+        *,
+        user_id: int,
+        step_uuids: Iterable[UUID],
+        candidate_step_uuids: Iterable[UUID],
+        completed_at: datetime | None = None,
+    ) -> StepCompletionWrite:
+        """Insert completions and read back the completed candidates at once.
+
+        One round trip: a data-modifying CTE runs ``INSERT ... SELECT
+        unnest(...) ON CONFLICT DO NOTHING`` and the outer query unions its
+        ``RETURNING`` rows with the pre-existing completions among
+        ``candidate_step_uuids`` (the outer snapshot cannot see the CTE's
+        inserts, so the two halves never overlap).
+        """
+        uuids = list(dict.fromkeys(step_uuids))
+        candidates = list(dict.fromkeys(candidate_step_uuids))
+        if not uuids:
+            return StepCompletionWrite(
+                changed=set(),
+                completed=await self.get_completed_step_uuids(user_id, candidates),
+            )
+
+        rows = select(
+            literal(user_id),
+            func.unnest(cast(uuids, ARRAY(Uuid(as_uuid=True)))),
+            literal(completed_at or utcnow()),
+        )
+        inserted = (
+            pg_insert(LearnerStepCompletion)
+            .from_select(["user_id", "step_uuid", "completed_at"], rows)
+            .on_conflict_do_nothing(index_elements=["user_id", "step_uuid"])
+            .returning(LearnerStepCompletion.step_uuid)
+            .cte("inserted")
+        )
+        stmt = select(inserted.c.step_uuid, true().label("changed")).union_all(
+            select(LearnerStepCompletion.step_uuid, false()).where(
+                LearnerStepCompletion.user_id == user_id,
+                LearnerStepCompletion.step_uuid.in_(candidates),
+            )
+        )
+        return await self._collect_write(stmt, candidates, removed=False)
+
+    async def delete_many_returning_completed(
+        self,
+        *,
+        user_id: int,
+        step_uuids: Iterable[UUID],
+        candidate_step_uuids: Iterable[UUID],
+    ) -> StepCompletionWrite:
+        """Delete completions and read back the completed candidates at once.
+
+        One round trip: a data-modifying CTE deletes the rows and the outer
+        query excludes them from the completions it still sees in its
+        snapshot.
+        """
+        uuids = list(dict.fromkeys(step_uuids))
+        candidates = list(dict.fromkeys(candidate_step_uuids))
+        if not uuids:
+            return StepCompletionWrite(
+                changed=set(),
+                completed=await self.get_completed_step_uuids(user_id, candidates),
+            )
+
+        deleted = (
+            delete(LearnerStepCompletion)
+            .where(
+                LearnerStepCompletion.user_id == user_id,
+                LearnerStepCompletion.step_uuid.in_(uuids),
+            )
+            .returning(LearnerStepCompletion.step_uuid)
+            .cte("deleted")
+        )
+        stmt = select(deleted.c.step_uuid, true().label("changed")).union_all(
+            select(LearnerStepCompletion.step_uuid, false()).where(
+                LearnerStepCompletion.user_id == user_id,
+                LearnerStepCompletion.step_uuid.in_(candidates),
+                LearnerStepCompletion.step_uuid.not_in(select(deleted.c.step_uuid)),
+            )
+        )
+        return await self._collect_write(stmt, candidates, removed=True)
+
+    async def _collect_write(
+        self,
+        stmt: CompoundSelect,
+        candidates: list[UUID],
+        *,
+        removed: bool,
+    ) -> StepCompletionWrite:
+        """Split ``(step_uuid, changed)`` rows into a StepCompletionWrite."""
+        result = await self.db.execute(stmt)
+        changed: set[UUID] = set()
+        completed: set[UUID] = set()
+        candidate_set = set(candidates)
+        for step_uuid, was_changed in result.all():
+            if was_changed:
+                changed.add(step_uuid)
+                if not removed and step_uuid in candidate_set:
+                    completed.add(step_uuid)
+            else:
+                completed.add(step_uuid)
+        return StepCompletionWrite(changed=changed, completed=completed)
+
     async def delete(self, *, user_id: int, step_uuid: UUID) -> int:
         """Delete a single completion record, if present."""
         result = await self.db.execute(
@@ -0,0 +1,74 @@
+"""Repository for cached LLM grading decisions."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from learn_to_cloud_shared.models import LLMGradingDecisionCacheEntry, utcnow
+
+
+class LLMGradingDecisionRepository:
+    """Data access for ``llm_grading_decisions``.
+
+    Runs under the Functions role, which holds SELECT/INSERT/UPDATE/DELETE on
+    this table only (see migration 0056).
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_unexpired(
+        self, cache_key: str, *, now: datetime | None = None
+    ) -> dict | None:
+        """Return the stored decision JSON, or ``None`` if missing or expired."""
+        result = await self.db.execute(
+            select(LLMGradingDecisionCacheEntry.decision).where(
+                LLMGradingDecisionCacheEntry.cache_key == cache_key,
+                LLMGradingDecisionCacheEntry.expires_at > (now or utcnow()),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def upsert(
+        self,
+        *,
+        cache_key: str,
+        task_id: str,
+        rubric_hash: str,
+        model_deployment: str,
+        decision: dict,
+        expires_at: datetime,
+    ) -> None:
+        """Store ``decision``, replacing any earlier one for ``cache_key``."""
+        stmt = pg_insert(LLMGradingDecisionCacheEntry).values(
+            cache_key=cache_key,
+            task_id=task_id,
+            rubric_hash=rubric_hash,
+            model_deployment=model_deployment,
+            decision=decision,
+            created_at=utcnow(),
+            expires_at=expires_at,
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[LLMGradingDecisionCacheEntry.cache_key],
+                set_={
+                    "decision": stmt.excluded.decision,
+                    "created_at": stmt.excluded.created_at,
+                    "expires_at": stmt.excluded.expires_at,
+                },
+            )
+        )
+
+    async def delete_expired(self, *, now: datetime | None = None) -> int:
+        """Delete expired decisions and return how many were removed."""
+        result = await self.db.execute(
+            delete(LLMGradingDecisionCacheEntry).where(
+                LLMGradingDecisionCacheEntry.expires_at <= (now or utcnow())
+            )
+        )
+        return getattr(result, "rowcount", 0) or 0
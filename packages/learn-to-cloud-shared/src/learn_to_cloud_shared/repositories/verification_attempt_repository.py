@@ -9,26 +9,35 @@ from uuid import UUID
 
 from sqlalchemy import (
     Integer,
+    Select,
     Uuid,
-    and_,
     column,
     delete,
+    exists,
     func,
+    literal,
+    or_,
     select,
-    text,
+    true,
     update,
     values,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from learn_to_cloud_shared.models import (
     VerificationAttempt,
     VerificationAttemptOutcome,
+    VerificationAttemptPayload,
     VerificationSnapshotSource,
     utcnow,
 )
 from learn_to_cloud_shared.submission_values import SubmittedValue
 
+# Inline JSONB columns superseded by ``verification_attempt_payloads``.
+_LEGACY_PAYLOAD_COLUMNS = frozenset({"requirement_snapshot", "feedback_json"})
+
 
 @dataclass(frozen=True, slots=True)
 class AttemptPrepareState:
@@ -82,6 +91,20 @@ class ActiveAttemptRow:
     requirement_uuid: UUID
 
 
+@dataclass(frozen=True, slots=True)
+class SubmissionGateState:
+    """Learner state that gates a new submission for one requirement.
+
+    ``prerequisites_met`` is ``True`` when every prerequisite requirement
+    passed to :meth:`VerificationAttemptRepository.get_submission_gate` has
+    a succeeded attempt (vacuously ``True`` for none).
+    """
+
+    already_succeeded: bool
+    active_attempt_id: UUID | None
+    prerequisites_met: bool
+
+
 @dataclass(frozen=True, slots=True)
 class AttemptCardProjection:
     """Latest terminal attempt for one requirement, for card rendering."""
@@ -121,6 +144,54 @@ class AttemptAlreadyValidatedError(Exception):
     """A succeeded attempt already exists for this (user, requirement)."""
 
 
+def _latest_terminal_cards_query(user_id: int, requirement_uuids: list[UUID]) -> Select:
+    """Build the card read for ``get_latest_terminal_for_requirements``.
+
+    Each requirement gets a ``LATERAL ... LIMIT 1`` probe of
+    ``ix_verification_attempts_terminal_latest``, so the cost grows with the
+    number of requirements, not with how often a learner retried.
+    """
+    requested = values(
+        column("requirement_uuid", Uuid(as_uuid=True)),
+        name="requested",
+    ).data([(uuid,) for uuid in requirement_uuids])
+    latest = (
+        select(VerificationAttempt.id)
+        .where(
+            VerificationAttempt.user_id == user_id,
+            VerificationAttempt.requirement_uuid == requested.c.requirement_uuid,
+            VerificationAttempt.outcome.is_not(None),
+        )
+        .order_by(VerificationAttempt.created_at.desc())
+        .limit(1)
+        .correlate(requested)
+        .lateral("latest")
+    )
+    return (
+        select(
+            VerificationAttempt.id,
+            VerificationAttempt.requirement_uuid,
+            VerificationAttempt.submission_value_kind,
+            VerificationAttempt.submitted_value,
+            VerificationAttempt.github_username_snapshot,
+            VerificationAttempt.cloud_provider,
+            VerificationAttempt.outcome,
+            VerificationAttemptPayload.feedback_json,
+            VerificationAttempt.validation_message,
+            VerificationAttempt.completed_at,
+            VerificationAttempt.created_at,
+            VerificationAttempt.updated_at,
+        )
+        .select_from(requested)
+        .join(latest, true())
+        .join(VerificationAttempt, VerificationAttempt.id == latest.c.id)
+        .outerjoin(
+            VerificationAttemptPayload,
+            VerificationAttemptPayload.attempt_id == VerificationAttempt.id,
+        )
+    )
+
+
 class VerificationAttemptRepository:
     """Data access for verification attempts.
 
@@ -128,6 +199,11 @@ class VerificationAttemptRepository:
     grants (see migration 0051). :meth:`create_or_get_active` and
     :meth:`delete_active` are the API-side submission-creation path and run
     under the API's normal (unrestricted) role instead.
+
+    The requirement snapshot and feedback live in
+    ``verification_attempt_payloads`` (see migration 0058); only
+    :meth:`get_prepare_state` and
+    :meth:`get_latest_terminal_for_requirements` join it.
     """
 
     def __init__(self, db: AsyncSession) -> None:
@@ -150,69 +226,115 @@ class VerificationAttemptRepository:
         cloud_provider: str | None,
         traceparent: str | None,
     ) -> tuple[VerificationAttempt, bool]:
-        """Create a new attempt, or return the active one, under an advisory lock.
-
-        Takes a transaction-scoped advisory lock keyed on ``(user_id,
-        requirement_uuid)`` before checking anything, so two concurrent
-        submits for the same requirement can never interleave their reads
-        and writes. With the lock held, this rechecks both an existing
-        *succeeded* attempt (closing the race between a concurrent
-        successful finalization and a new submit) and an existing *active*
-        attempt (the one-active-attempt invariant) before inserting a
-        brand-new row. The lock releases automatically when the caller
-        commits or rolls back the transaction.
+        """Create a new attempt, or return the active one, in one statement.
+
+        A single ``INSERT ... SELECT ... WHERE NOT EXISTS (succeeded) ON
+        CONFLICT DO NOTHING`` CTE, unioned with a read of the active row,
+        replaces the old lock-check-check-insert sequence. The
+        ``uq_verification_attempts_active_user_req`` partial unique index is
+        what guarantees one active attempt per ``(user_id, requirement_uuid)``:
+        a racing insert waits on the conflicting row and then does nothing.
+
+        The active and succeeded rows are read ``FOR SHARE`` in a CTE that
+        both the ``NOT EXISTS`` guard and the unioned read use. An active row
+        being finalized is waited on and re-read at its committed version, so
+        an attempt that just succeeded blocks the insert instead of freeing
+        the unique slot behind a guard that never saw the success.
+
+        A conflicting row committed after this statement's snapshot is not
+        visible to the read, so an empty result re-runs the statement once
+        under a fresh snapshot. The returned attempt was created here iff its
+        id is ``id``. The requirement snapshot is written to the payload
+        table by a second CTE fed from the inserted row, so it lands in the
+        same statement.
+
+        Raises:
+            AttemptAlreadyValidatedError: A succeeded attempt already exists.
         """
-        await self._acquire_submission_lock(user_id, requirement_uuid)
-
-        succeeded = await self.db.execute(
-            select(VerificationAttempt.id)
+        now = utcnow()
+        row: dict[str, object] = {
+            "id": id,
+            "user_id": user_id,
+            "requirement_uuid": requirement_uuid,
+            "artifact_schema_version": artifact_schema_version,
+            "curriculum_version": curriculum_version,
+            "content_hash": content_hash,
+            "requirement_snapshot_hash": requirement_snapshot_hash,
+            "snapshot_source": VerificationSnapshotSource.SUBMITTED.value,
+            "payload_version": payload_version,
+            "github_username_snapshot": github_username_snapshot,
+            "cloud_provider": cloud_provider,
+            "traceparent": traceparent,
+            "submission_value_kind": submitted_value.kind.value,
+            "submitted_value": submitted_value.as_text,
+            "created_at": now,
+            "updated_at": now,
+        }
+        columns = VerificationAttempt.__table__.c
+        returned = [
+            column for column in columns if column.name not in _LEGACY_PAYLOAD_COLUMNS
+        ]
+        succeeded_value = VerificationAttemptOutcome.SUCCEEDED.value
+        blocking = (
+            select(*returned)
             .where(
                 VerificationAttempt.user_id == user_id,
                 VerificationAttempt.requirement_uuid == requirement_uuid,
-                VerificationAttempt.outcome
-                == VerificationAttemptOutcome.SUCCEEDED.value,
+                or_(
+                    VerificationAttempt.outcome.is_(None),
+                    VerificationAttempt.outcome == succeeded_value,
+                ),
             )
-            .limit(1)
+            .with_for_update(read=True)
+            .cte("blocking")
         )
-        if succeeded.scalar_one_or_none() is not None:
-            raise AttemptAlreadyValidatedError(
-                f"user {user_id} already has a succeeded attempt for "
-                f"requirement {requirement_uuid}"
+        succeeded = exists().where(blocking.c.outcome == succeeded_value)
+        inserted = (
+            pg_insert(VerificationAttempt)
+            .from_select(
+                list(row),
+                select(
+                    *(
+                        literal(value, columns[name].type).label(name)
+                        for name, value in row.items()
+                    )
+                ).where(~succeeded),
             )
-
-        active = await self.db.execute(
-            select(VerificationAttempt)
-            .where(
-                VerificationAttempt.user_id == user_id,
-                VerificationAttempt.requirement_uuid == requirement_uuid,
-                VerificationAttempt.outcome.is_(None),
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "requirement_uuid"],
+                index_where=VerificationAttempt.outcome.is_(None),
             )
-            .limit(1)
+            .returning(*returned)
+            .cte("inserted")
+        )
+        inserted_payload = (
+            pg_insert(VerificationAttemptPayload)
+            .from_select(
+                ["attempt_id", "requirement_snapshot"],
+                select(
+                    inserted.c.id,
+                    literal(dict(requirement_snapshot), JSONB),
+                ),
+            )
+            .cte("inserted_payload")
         )
-        existing = active.scalar_one_or_none()
-        if existing is not None:
-            return existing, False
-
-        attempt = VerificationAttempt(
-            id=id,
-            user_id=user_id,
-            requirement_uuid=requirement_uuid,
-            artifact_schema_version=artifact_schema_version,
-            curriculum_version=curriculum_version,
-            content_hash=content_hash,
-            requirement_snapshot=dict(requirement_snapshot),
-            requirement_snapshot_hash=requirement_snapshot_hash,
-            snapshot_source=VerificationSnapshotSource.SUBMITTED.value,
-            payload_version=payload_version,
-            github_username_snapshot=github_username_snapshot,
-            cloud_provider=cloud_provider,
-            traceparent=traceparent,
-            submission_value_kind=submitted_value.kind.value,
-            submitted_value=submitted_value.as_text,
+        stmt = select(VerificationAttempt).from_statement(
+            select(inserted).add_cte(inserted_payload).union_all(select(blocking))
+        )
+
+        for _ in range(2):
+            attempts = (await self.db.execute(stmt)).scalars().all()
+            if any(attempt.outcome == succeeded_value for attempt in attempts):
+                raise AttemptAlreadyValidatedError(
+                    f"user {user_id} already has a succeeded attempt for "
+                    f"requirement {requirement_uuid}"
+                )
+            if attempts:
+                return attempts[0], attempts[0].id == id
+        raise RuntimeError(
+            f"active attempt for user {user_id} requirement {requirement_uuid} "
+            "vanished twice during creation"
         )
-        self.db.add(attempt)
-        await self.db.flush()
-        return attempt, True
 
     async def delete_active(self, attempt_id: UUID) -> bool:
         """Delete an attempt that never started, freeing its active slot.
@@ -231,23 +353,6 @@ class VerificationAttemptRepository:
         result = await self.db.execute(stmt)
         return (getattr(result, "rowcount", 0) or 0) > 0
 
-    async def _acquire_submission_lock(
-        self, user_id: int, requirement_uuid: UUID
-    ) -> None:
-        """Take a transaction-scoped advisory lock for one (user, requirement).
-
-        ``hashtextextended`` folds the composite key into the single
-        64-bit value ``pg_advisory_xact_lock`` takes, so the lock target is
-        deterministic and collision-resistant without a second, session-level
-        unlock call to remember -- Postgres releases a ``_xact_lock``
-        automatically at commit or rollback.
-        """
-        lock_key = f"verification_attempt:{user_id}:{requirement_uuid}"
-        await self.db.execute(
-            text("SELECT pg_advisory_xact_lock(hashtextextended(:lock_key, 0))"),
-            {"lock_key": lock_key},
-        )
-
     async def get_prepare_state(self, attempt_id: UUID) -> AttemptPrepareState | None:
         """Load the identity + submitted snapshot for one attempt."""
         result = await self.db.execute(
@@ -257,7 +362,7 @@ class VerificationAttemptRepository:
                 VerificationAttempt.requirement_uuid,
                 VerificationAttempt.snapshot_source,
                 VerificationAttempt.payload_version,
-                VerificationAttempt.requirement_snapshot,
+                VerificationAttemptPayload.requirement_snapshot,
                 VerificationAttempt.requirement_snapshot_hash,
                 VerificationAttempt.submission_value_kind,
                 VerificationAttempt.submitted_value,
@@ -266,7 +371,12 @@ class VerificationAttemptRepository:
                 VerificationAttempt.traceparent,
                 VerificationAttempt.outcome,
                 VerificationAttempt.started_at,
-            ).where(VerificationAttempt.id == attempt_id)
+            )
+            .outerjoin(
+                VerificationAttemptPayload,
+                VerificationAttemptPayload.attempt_id == VerificationAttempt.id,
+            )
+            .where(VerificationAttempt.id == attempt_id)
         )
         row = result.one_or_none()
         if row is None:
@@ -353,6 +463,19 @@ class VerificationAttemptRepository:
             completed_at=row.completed_at,
         )
 
+    async def count_active(self) -> int:
+        """Count active (``outcome IS NULL``) attempts across all users.
+
+        The predicate matches the active-attempt partial unique index, so the
+        count scans only in-flight rows.
+        """
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(VerificationAttempt)
+            .where(VerificationAttempt.outcome.is_(None))
+        )
+        return result.scalar_one()
+
     async def list_active_older_than(
         self, cutoff: datetime, *, limit: int
     ) -> list[AttemptStatusRow]:
@@ -414,6 +537,10 @@ class VerificationAttemptRepository:
         Only writes when ``outcome IS NULL``. On a lost CAS (already terminal),
         reloads and returns the authoritative terminal state without mutating
         it, so replays and competing finalizers never clobber a result.
+        ``feedback_json`` is upserted into the payload table only when this
+        call wins the CAS, in the same statement as the terminal update. Until
+        the contract revision drops it, the legacy inline column is written
+        too, so API releases from before revision 0058 still render the card.
         """
         normalized_outcome = (
             outcome.value
@@ -421,21 +548,23 @@ class VerificationAttemptRepository:
             else VerificationAttemptOutcome(outcome).value
         )
         now = completed_at or utcnow()
-        stmt = (
+        values: dict[str, object] = {
+            "outcome": normalized_outcome,
+            "error_code": error_code,
+            "validation_message": validation_message,
+            "terminal_source": terminal_source,
+            "completed_at": now,
+            "updated_at": now,
+        }
+        if feedback_json is not None:
+            values["legacy_feedback_json"] = feedback_json
+        finalized = (
             update(VerificationAttempt)
             .where(
                 VerificationAttempt.id == attempt_id,
                 VerificationAttempt.outcome.is_(None),
             )
-            .values(
-                outcome=normalized_outcome,
-                error_code=error_code,
-                validation_message=validation_message,
-                terminal_source=terminal_source,
-                feedback_json=feedback_json,
-                completed_at=now,
-                updated_at=now,
-            )
+            .values(values)
             .returning(
                 VerificationAttempt.id,
                 VerificationAttempt.outcome,
@@ -444,7 +573,20 @@ class VerificationAttemptRepository:
                 VerificationAttempt.terminal_source,
                 VerificationAttempt.completed_at,
             )
+            .cte("finalized")
         )
+        stmt = select(finalized)
+        if feedback_json is not None:
+            upsert = pg_insert(VerificationAttemptPayload).from_select(
+                ["attempt_id", "feedback_json"],
+                select(finalized.c.id, literal(feedback_json, JSONB)),
+            )
+            stmt = stmt.add_cte(
+                upsert.on_conflict_do_update(
+                    index_elements=["attempt_id"],
+                    set_={"feedback_json": upsert.excluded.feedback_json},
+                ).cte("finalized_payload")
+            )
         result = await self.db.execute(stmt)
         row = result.one_or_none()
         if row is not None:
@@ -518,6 +660,63 @@ class VerificationAttemptRepository:
         succeeded = await self.count_succeeded_for_requirements(user_id, uuids)
         return succeeded >= len(uuids)
 
+    async def get_submission_gate(
+        self,
+        user_id: int,
+        requirement_uuid: UUID,
+        prerequisite_requirement_uuids: Iterable[UUID] = (),
+    ) -> SubmissionGateState:
+        """Answer "already validated? active attempt? prerequisites met?" at once.
+
+        One round trip of scalar subqueries, each served by the
+        ``(user_id, requirement_uuid)`` indexes, so the submit path no longer
+        reads the learner's whole succeeded set per check.
+        """
+        prereq_uuids = list(prerequisite_requirement_uuids)
+        succeeded = (
+            VerificationAttempt.outcome == VerificationAttemptOutcome.SUCCEEDED.value
+        )
+        already_succeeded = exists().where(
+            VerificationAttempt.user_id == user_id,
+            VerificationAttempt.requirement_uuid == requirement_uuid,
+            succeeded,
+        )
+        active_attempt_id = (
+            select(VerificationAttempt.id)
+            .where(
+                VerificationAttempt.user_id == user_id,
+                VerificationAttempt.requirement_uuid == requirement_uuid,
+                VerificationAttempt.outcome.is_(None),
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+        prerequisites_succeeded = (
+            select(func.count(func.distinct(VerificationAttempt.requirement_uuid)))
+            .where(
+                VerificationAttempt.user_id == user_id,
+                VerificationAttempt.requirement_uuid.in_(prereq_uuids),
+                succeeded,
+            )
+            .scalar_subquery()
+            if prereq_uuids
+            else literal(0)
+        )
+        row = (
+            await self.db.execute(
+                select(
+                    already_succeeded.label("already_succeeded"),
+                    active_attempt_id.label("active_attempt_id"),
+                    prerequisites_succeeded.label("prerequisites_succeeded"),
+                )
+            )
+        ).one()
+        return SubmissionGateState(
+            already_succeeded=bool(row.already_succeeded),
+            active_attempt_id=row.active_attempt_id,
+            prerequisites_met=row.prerequisites_succeeded >= len(set(prereq_uuids)),
+        )
+
     async def get_active_for_requirements(
         self, user_id: int, requirement_uuids: Iterable[UUID]
     ) -> list[ActiveAttemptRow]:
@@ -552,48 +751,11 @@ class VerificationAttemptRepository:
         card's persisted result (succeeded/failed/server_error/cancelled)
         shown alongside or instead of that spinner.
         """
-        uuids = list(requirement_uuids)
+        uuids = list(dict.fromkeys(requirement_uuids))
         if not uuids:
             return []
 
-        latest_sq = (
-            select(
-                VerificationAttempt.requirement_uuid,
-                func.max(VerificationAttempt.created_at).label("max_created_at"),
-            )
-            .where(
-                VerificationAttempt.user_id == user_id,
-                VerificationAttempt.requirement_uuid.in_(uuids),
-                VerificationAttempt.outcome.is_not(None),
-            )
-            .group_by(VerificationAttempt.requirement_uuid)
-            .subquery()
-        )
-        result = await self.db.execute(
-            select(
-                VerificationAttempt.id,
-                VerificationAttempt.requirement_uuid,
-                VerificationAttempt.submission_value_kind,
-                VerificationAttempt.submitted_value,
-                VerificationAttempt.github_username_snapshot,
-                VerificationAttempt.cloud_provider,
-                VerificationAttempt.outcome,
-                VerificationAttempt.feedback_json,
-                VerificationAttempt.validation_message,
-                VerificationAttempt.completed_at,
-                VerificationAttempt.created_at,
-                VerificationAttempt.updated_at,
-            )
-            .join(
-                latest_sq,
-                and_(
-                    VerificationAttempt.requirement_uuid
-                    == latest_sq.c.requirement_uuid,
-                    VerificationAttempt.created_at == latest_sq.c.max_created_at,
-                ),
-            )
-            .where(VerificationAttempt.user_id == user_id)
-        )
+        result = await self.db.execute(_latest_terminal_cards_query(user_id, uuids))
         return [
             AttemptCardProjection(
                 id=row.id,
@@ -0,0 +1,76 @@
+"""Repository for claim-checked verification transport data."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from learn_to_cloud_shared.models import (
+    VerificationAttempt,
+    VerificationEvidenceClaim,
+    utcnow,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceClaim:
+    """One item to check in: its content hash, kind and JSON payload."""
+
+    content_hash: str
+    kind: str
+    payload: dict
+
+
+class VerificationEvidenceClaimRepository:
+    """Data access for ``verification_evidence_claims``.
+
+    Runs under the Functions role, which holds SELECT/INSERT/DELETE on this
+    table only (see migration 0057).
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def put_many(self, attempt_id: UUID, claims: Sequence[EvidenceClaim]) -> None:
+        """Store ``claims`` for ``attempt_id``; an already stored hash is kept."""
+        if not claims:
+            return
+        now = utcnow()
+        stmt = pg_insert(VerificationEvidenceClaim).values(
+            [
+                {
+                    "attempt_id": attempt_id,
+                    "content_hash": claim.content_hash,
+                    "kind": claim.kind,
+                    "payload": claim.payload,
+                    "created_at": now,
+                }
+                for claim in claims
+            ]
+        )
+        await self.db.execute(stmt.on_conflict_do_nothing())
+
+    async def get(self, attempt_id: UUID, content_hash: str) -> dict | None:
+        """Return a claimed payload, or ``None`` if it was never stored."""
+        result = await self.db.execute(
+            select(VerificationEvidenceClaim.payload).where(
+                VerificationEvidenceClaim.attempt_id == attempt_id,
+                VerificationEvidenceClaim.content_hash == content_hash,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_for_completed_attempts(self) -> int:
+        """Delete claims of terminal attempts and return how many were removed."""
+        result = await self.db.execute(
+            delete(VerificationEvidenceClaim).where(
+                VerificationEvidenceClaim.attempt_id == VerificationAttempt.id,
+                VerificationAttempt.completed_at.is_not(None),
+            )
+        )
+        return getattr(result, "rowcount", 0) or 0
@@ -1,10 +1,10 @@
 """Phase hands-on requirements lookup helpers.
 
 Backed by the packaged curriculum catalog (see ``content_service``).
-Each convenience helper loads the requirement index (requirements
-grouped by phase order) and builds a ``RequirementIndex``; this is a
-synchronous, in-memory lookup, so hot paths can call it as often as
-needed without worrying about redundant queries.
+Each convenience helper reads the process-wide ``RequirementIndex``
+(requirements grouped by phase order, plus the resolved phase gates).
+The catalog is immutable per process, so the index is built once and
+hot paths can call it as often as needed.
 
 Phases here are keyed by ``phase.order`` (the int 0..7), matching the
 URL contract and the numeric phase id. Slugs (``"phase0"`` etc.) are
@@ -15,6 +15,7 @@ aggregation) think in terms of ordinals.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -26,17 +27,41 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
+@dataclass(frozen=True, slots=True)
+class PhaseGate:
+    """Prerequisite phase and its requirement UUIDs for one gated phase."""
+
+    prerequisite_phase: int
+    requirement_uuids: tuple[UUID, ...]
+
+
 @dataclass(frozen=True)
 class RequirementIndex:
     """Precomputed lookups over the loaded requirements.
 
-    Build once per request via ``load_requirement_index`` and reuse for
-    all requirement-shaped lookups in that request.
+    Built once per process by ``load_requirement_index``; treat it and
+    the lists it returns as read-only.
     """
 
     by_phase_order: dict[int, list[HandsOnRequirement]] = field(default_factory=dict)
     by_slug: dict[str, HandsOnRequirement] = field(default_factory=dict)
     phase_order_by_req_slug: dict[str, int] = field(default_factory=dict)
+    gates_by_phase_order: dict[int, PhaseGate] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Resolve the prerequisite closure once per index so gating checks
+        # are a dict lookup rather than a walk over the catalog.
+        gates = {
+            phase_order: PhaseGate(
+                prerequisite_phase=prereq,
+                requirement_uuids=tuple(self.requirement_uuids_for_phase(prereq)),
+            )
+            for phase_order, prereq in _PHASE_PREREQUISITES.items()
+            if self.by_phase_order.get(prereq)
+        }
+        object.__setattr__(self, "gates_by_phase_order", gates)
 
     @classmethod
     def from_requirements_by_phase_order(
@@ -63,9 +88,17 @@ class RequirementIndex:
     def requirement_uuids_for_phase(self, phase_order: int) -> list[UUID]:
         return [req.uuid for req in self.requirements_for_phase(phase_order)]
 
+    def gate_for_phase(self, phase_order: int) -> PhaseGate | None:
+        """Return the prerequisite gate for a phase, or None if it is ungated.
+
+        A prerequisite phase with no requirements does not gate anything.
+        """
+        return self.gates_by_phase_order.get(phase_order)
+
 
+@cache
 def load_requirement_index() -> RequirementIndex:
-    """Load the requirement index (requirements grouped by phase order)."""
+    """Return the process-wide requirement index, building it on first use."""
     return RequirementIndex.from_requirements_by_phase_order(
         get_requirements_by_phase_order()
     )
@@ -109,16 +142,15 @@ async def is_phase_verification_locked(
         is the phase order that must be completed first; otherwise
         (False, None).
     """
-    prereq = get_prerequisite_phase(phase_order)
-    if prereq is None:
+    if get_prerequisite_phase(phase_order) is None:
         return False, None
 
-    prereq_req_uuids = load_requirement_index().requirement_uuids_for_phase(prereq)
-    if not prereq_req_uuids:
+    gate = load_requirement_index().gate_for_phase(phase_order)
+    if gate is None:
         return False, None
 
-    all_done = await are_all_requirements_succeeded(db, user_id, prereq_req_uuids)
+    all_done = await are_all_requirements_succeeded(db, user_id, gate.requirement_uuids)
     if all_done:
         return False, None
 
-    return True, prereq
+    return True, gate.prerequisite_phase
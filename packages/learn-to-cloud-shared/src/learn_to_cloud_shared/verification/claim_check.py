@@ -0,0 +1,121 @@
+"""Claim-check storage for verification transport data.
+
+The verify activity's result carries evidence bundles (file contents) and
+grading request prompts through every later orchestration hop, so Durable
+writes them into history again at each step and reads them back on every
+replay. With ``CLAIM_CHECK__ENABLED`` the activity stores them once in
+``verification_evidence_claims``, keyed by attempt and content hash, and
+returns references instead:
+
+- ``evidence_claims`` replaces ``evidence``;
+- ``grading_request_claims`` replaces ``grading_requests``. The orchestrator
+  hands each reference to ``run_llm_grading``, which loads the request with
+  :func:`load_grading_request`.
+
+Nothing after grading reads evidence (grading results and finalize drop it),
+so the later activities need no lookup. The reconciler deletes an attempt's
+claims once the attempt is terminal.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from learn_to_cloud_shared.core.config import get_worker_settings
+from learn_to_cloud_shared.repositories.verification_evidence_claim_repository import (
+    EvidenceClaim,
+    VerificationEvidenceClaimRepository,
+)
+from learn_to_cloud_shared.verification.grading_requests import LLMGradingRequest
+from learn_to_cloud_shared.verification_workflow import VerificationRunResult
+
+EVIDENCE_CLAIMS_KEY = "evidence_claims"
+GRADING_REQUEST_CLAIMS_KEY = "grading_request_claims"
+
+_EVIDENCE_KIND = "evidence"
+_GRADING_REQUEST_KIND = "grading_request"
+_REFERENCE_KEYS = frozenset({"attempt_id", "content_hash"})
+
+
+class ClaimNotFoundError(LookupError):
+    """A claim reference points at a payload that is not stored."""
+
+
+def claim_hash(payload: Mapping[str, object]) -> str:
+    """Return the content hash a payload is stored under."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_claim_reference(payload: Mapping[str, object]) -> bool:
+    """Whether ``payload`` is a claim reference rather than inline data."""
+    return payload.keys() == _REFERENCE_KEYS
+
+
+async def check_in_run_result(
+    run_result: VerificationRunResult,
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> dict[str, object]:
+    """Serialize ``run_result``, claim-checking its transport data if enabled."""
+    payload = run_result.to_payload()
+    config = get_worker_settings().claim_check
+    evidence = [bundle.model_dump(mode="json") for bundle in run_result.evidence or []]
+    requests = [
+        request.model_dump(mode="json") for request in run_result.grading_requests or []
+    ]
+    if not config.enabled or not (evidence or requests):
+        return payload
+    if len(json.dumps([evidence, requests])) < config.min_bytes:
+        return payload
+
+    claims = [
+        EvidenceClaim(claim_hash(item), _EVIDENCE_KIND, item) for item in evidence
+    ] + [
+        EvidenceClaim(claim_hash(item), _GRADING_REQUEST_KIND, item)
+        for item in requests
+    ]
+    async with session_maker() as db:
+        await VerificationEvidenceClaimRepository(db).put_many(
+            run_result.attempt.id, claims
+        )
+        await db.commit()
+
+    attempt_id = str(run_result.attempt.id)
+    references = [
+        {"attempt_id": attempt_id, "content_hash": claim.content_hash}
+        for claim in claims
+    ]
+    if evidence:
+        payload["evidence"] = None
+        payload[EVIDENCE_CLAIMS_KEY] = references[: len(evidence)]
+    if requests:
+        payload["grading_requests"] = None
+        payload[GRADING_REQUEST_CLAIMS_KEY] = references[len(evidence) :]
+    return payload
+
+
+async def load_grading_request(
+    payload: Mapping[str, object],
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> LLMGradingRequest:
+    """Return the grading request ``payload`` carries or references."""
+    if not is_claim_reference(payload):
+        return LLMGradingRequest.model_validate(payload)
+    attempt_id = UUID(str(payload["attempt_id"]))
+    content_hash = str(payload["content_hash"])
+    async with session_maker() as db:
+        stored = await VerificationEvidenceClaimRepository(db).get(
+            attempt_id, content_hash
+        )
+    if stored is None:
+        raise ClaimNotFoundError(
+            f"No grading request claim {content_hash} for attempt {attempt_id}"
+        )
+    return LLMGradingRequest.model_validate(stored)
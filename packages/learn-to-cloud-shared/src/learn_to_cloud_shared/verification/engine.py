@@ -18,6 +18,7 @@ registry-exhaustiveness test guarantees no type is left unmapped.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, replace
 from typing import ClassVar
@@ -26,6 +27,7 @@ import httpx
 from opentelemetry import trace
 from pydantic import Field, model_validator
 
+from learn_to_cloud_shared.core.config import get_worker_settings
 from learn_to_cloud_shared.github_target import GitHubTarget
 from learn_to_cloud_shared.models import SubmissionType
 from learn_to_cloud_shared.schemas import FrozenModel, TaskResult, ValidationResult
@@ -59,7 +61,17 @@ from learn_to_cloud_shared.verification.grading_requests import (
     build_repo_rubric_message,
     build_text_rubric_message,
 )
-from learn_to_cloud_shared.verification.repo_files import RepoFiles, default_repo_files
+from learn_to_cloud_shared.verification.repo_archive import GitHubArchiveRepoFiles
+from learn_to_cloud_shared.verification.repo_files import (
+    CachingRepoFiles,
+    RepoFiles,
+    default_repo_files,
+)
+from learn_to_cloud_shared.verification.result_cache import (
+    get_verification_result_cache,
+    rebind_result,
+    result_cache_key,
+)
 from learn_to_cloud_shared.verification.security_scanning import (
     collect_security_scanning_evidence,
 )
@@ -265,10 +277,20 @@ class NetworkingTokenCheckParams(CheckParams):
 
 @dataclass(frozen=True, slots=True)
 class Step:
-    """One ordered profile step selected by its typed params."""
+    """One ordered profile step selected by its typed params.
+
+    ``needs`` names the earlier steps (by ``task_id``) this step waits for and
+    whose evidence it sees. ``None`` waits for every earlier step, so a
+    profile that declares nothing runs strictly in order; ``()`` lets the
+    step start alongside the steps before it. Independent gates, and an
+    evidence fetch whose gate only decides whether grading is recorded, can
+    use ``()``; a step that spends large GitHub or LLM budget should name
+    the gates that can make it moot.
+    """
 
     params: CheckParams
     task_id: str
+    needs: tuple[str, ...] | None = None
 
 
 class StepResult(FrozenModel):
@@ -310,12 +332,26 @@ class VerificationProfile:
     optional persona. ``requires_username`` guards types whose steps need the
     learner's GitHub username; :func:`run_profile` short-circuits when it is
     missing.
+
+    ``memoize`` lets an identical resubmission of an unchanged repository (or
+    text) reuse the previous run; bump ``version`` when a change to the
+    steps should invalidate those results. Only set it on profiles whose
+    outcome is a function of the commit and submitted text: a gate reading
+    external state (CI runs, package visibility, code-scanning alerts) can
+    flip without a new commit, which the memo key cannot see.
+
+    ``inline`` marks a profile whose steps are all local (no network calls,
+    no LLM grading), so the API may run it in the submit request instead of
+    through the Durable orchestration; see :func:`runs_inline`.
     """
 
     requires_username: bool
     steps: tuple[Step, ...] = ()
     system_prompt: str | None = None
     rubric: LLMRubricGraderConfig | None = None
+    memoize: bool = False
+    version: int = 1
+    inline: bool = False
 
 
 CheckFn = Callable[[StepContext, CheckParams], Awaitable[StepResult]]
@@ -742,6 +778,14 @@ def register_profile(
     submission_type: SubmissionType, profile: VerificationProfile
 ) -> None:
     """Register a profile for a submission type (raises on dupes)."""
+    for index, step in enumerate(profile.steps):
+        earlier = {prior.task_id for prior in profile.steps[:index]}
+        unknown = set(step.needs or ()) - earlier
+        if unknown:
+            raise ValueError(
+                f"{submission_type}: step {step.task_id!r} needs "
+                f"{sorted(unknown)}, which are not earlier steps"
+            )
     if submission_type in _PROFILE_REGISTRY:
         raise ValueError(f"Profile already registered: {submission_type}")
     _PROFILE_REGISTRY[submission_type] = profile
@@ -752,6 +796,12 @@ def profile_for(submission_type: SubmissionType) -> VerificationProfile | None:
     return _PROFILE_REGISTRY.get(submission_type)
 
 
+def runs_inline(submission_type: SubmissionType) -> bool:
+    """Whether a submission type's profile can run in-request."""
+    profile = profile_for(submission_type)
+    return profile is not None and profile.inline
+
+
 _JOURNAL_API_RUBRIC = JOURNAL_API_FINAL_RUBRIC_TASK.grader
 assert isinstance(_JOURNAL_API_RUBRIC, LLMRubricGraderConfig)
 
@@ -768,6 +818,7 @@ _JOURNAL_API_PROFILE = VerificationProfile(
                 evidence_paths=JOURNAL_API_IMPORTANT_PATHS,
             ),
             task_id=JOURNAL_API_FINAL_RUBRIC_TASK.id,
+            needs=("journal-api-implementation-ci",),
         ),
     ),
     rubric=_JOURNAL_API_RUBRIC,
@@ -794,6 +845,7 @@ _DEPLOYMENT_ARCHITECTURE_PROFILE = VerificationProfile(
         ),
     ),
     rubric=_DEPLOYMENT_ARCHITECTURE_RUBRIC,
+    memoize=True,
 )
 
 register_profile(
@@ -827,6 +879,7 @@ _DEVOPS_ANALYSIS_PROFILE = VerificationProfile(
         Step(
             params=PublicGhcrImageParams(),
             task_id="public-ghcr-image",
+            needs=(),
         ),
         Step(
             params=LLMRubricReviewParams(
@@ -834,6 +887,7 @@ _DEVOPS_ANALYSIS_PROFILE = VerificationProfile(
                 discover_paths=True,
             ),
             task_id=DEVOPS_IMPLEMENTATION_RUBRIC_TASK.id,
+            needs=("devops-required-files", "public-ghcr-image"),
         ),
     ),
     rubric=_DEVOPS_IMPLEMENTATION_RUBRIC,
@@ -855,6 +909,7 @@ _SECURITY_SCANNING_PROFILE = VerificationProfile(
         Step(
             params=SecurityScanningReviewParams(task=SECURITY_SCANNING_RUBRIC_TASK),
             task_id=SECURITY_SCANNING_RUBRIC_TASK.id,
+            needs=(),
         ),
     ),
     rubric=_SECURITY_SCANNING_RUBRIC,
@@ -879,6 +934,7 @@ _CAREER_REFLECTION_PROFILE = VerificationProfile(
         ),
     ),
     rubric=_CAREER_REFLECTION_RUBRIC,
+    memoize=True,
 )
 
 register_profile(SubmissionType.CAREER_REFLECTION, _CAREER_REFLECTION_PROFILE)
@@ -918,6 +974,7 @@ _CTF_TOKEN_PROFILE = VerificationProfile(
             task_id="ctf-token-check",
         ),
     ),
+    inline=True,
 )
 
 register_profile(SubmissionType.CTF_TOKEN, _CTF_TOKEN_PROFILE)
@@ -931,6 +988,7 @@ _NETWORKING_TOKEN_PROFILE = VerificationProfile(
             task_id="networking-token-check",
         ),
     ),
+    inline=True,
 )
 
 register_profile(SubmissionType.NETWORKING_TOKEN, _NETWORKING_TOKEN_PROFILE)
@@ -946,6 +1004,89 @@ def _steps_for(profile: VerificationProfile) -> tuple[Step, ...]:
     return profile.steps
 
 
+def _stops(result: StepResult) -> bool:
+    return not result.passed and result.stop_on_fail
+
+
+async def _run_steps(steps: tuple[Step, ...], context: StepContext) -> list[StepResult]:
+    """Run steps concurrently where their ``needs`` allow.
+
+    Each step starts once the steps it needs have finished and none of them
+    stopped the run. A failed ``stop_on_fail`` gate cancels every later step
+    still pending. The returned results are exactly those a strictly ordered
+    run would produce: each step up to and including the first stopping
+    gate, in declaration order. An error from a step inside that prefix is
+    re-raised; one from a step the sequential run would have skipped is not.
+    """
+    tasks: list[asyncio.Task[StepResult | None]] = []
+
+    async def run(index: int, step: Step) -> StepResult | None:
+        needed = (
+            range(index)
+            if step.needs is None
+            else [
+                i
+                for i, prior in enumerate(steps[:index])
+                if prior.task_id in step.needs
+            ]
+        )
+        # Shielded: cancelling this step must not cancel the steps it waits on.
+        prior_results = [await asyncio.shield(tasks[i]) for i in needed]
+        if any(prior is None or _stops(prior) for prior in prior_results):
+            return None
+        step_context = replace(
+            context,
+            evidence_so_far=tuple(
+                bundle for prior in prior_results if prior for bundle in prior.evidence
+            ),
+        )
+        result = await check_for(step.params)(step_context, step.params)
+        if _stops(result):
+            for later in tasks[index + 1 :]:
+                later.cancel()
+        return result
+
+    for index, step in enumerate(steps):
+        tasks.append(asyncio.create_task(run(index, step)))
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results: list[StepResult] = []
+    for outcome in outcomes:
+        if outcome is None or isinstance(outcome, asyncio.CancelledError):
+            break
+        if isinstance(outcome, BaseException):
+            raise outcome
+        results.append(outcome)
+        if _stops(outcome):
+            break
+    return results
+
+
+def _production_repo_files(profile: VerificationProfile) -> RepoFiles:
+    """Pick the live adapter for a run that was not given one.
+
+    With ``github.archive_evidence`` on, a profile that discovers evidence by
+    path pattern reads from one tarball that retains just those patterns
+    within the tasks' byte caps; everything else uses the API adapter.
+    """
+    base = default_repo_files()
+    if not get_worker_settings().github.archive_evidence:
+        return base
+    policies = [
+        step.params.task.evidence
+        for step in profile.steps
+        if isinstance(step.params, LLMRubricReviewParams) and step.params.discover_paths
+    ]
+    if not policies:
+        return base
+    return GitHubArchiveRepoFiles(
+        [pattern for policy in policies for pattern in policy.path_patterns],
+        max_file_size_bytes=max(policy.max_file_size_bytes for policy in policies),
+        max_total_bytes=sum(policy.max_total_bytes for policy in policies),
+        fallback=base,
+    )
+
+
 def _aggregate(step_results: list[StepResult]) -> ValidationResult:
     """Fold step results into one ``ValidationResult``.
 
@@ -1023,7 +1164,8 @@ def _grading_requests_for(
         task = result.grading_task
         if task is None:
             continue
-        evidence = result.evidence[0].model_dump(mode="json") if result.evidence else {}
+        bundle = result.evidence[0] if result.evidence else None
+        evidence = bundle.model_dump(mode="json") if bundle is not None else {}
         if task.evidence.source == "submitted_text":
             message = build_text_rubric_message(
                 requirement_slug=job.requirement.slug,
@@ -1051,11 +1193,21 @@ def _grading_requests_for(
                 task=task,
                 message=message,
                 thread_id=f"{job.id}-{task.id}",
+                evidence_hashes=_evidence_hashes(bundle),
             )
         )
     return requests
 
 
+def _evidence_hashes(bundle: EvidenceBundle | None) -> list[tuple[str, str]]:
+    """``(path, sha256)`` per item; empty unless every item is hashed."""
+    if bundle is None or not bundle.items:
+        return []
+    if any(item.sha256 is None for item in bundle.items):
+        return []
+    return [(item.path, item.sha256) for item in bundle.items if item.sha256]
+
+
 def _grading_disposition_for(
     profile: VerificationProfile,
     step_results: list[StepResult],
@@ -1073,6 +1225,25 @@ def _grading_disposition_for(
     raise ValueError("Rubric profile completed without a grading request")
 
 
+async def _memo_key(
+    job: PreparedVerificationAttempt,
+    profile: VerificationProfile,
+    repo_files: CachingRepoFiles,
+) -> str | None:
+    """Return the result-cache key, or ``None`` when HEAD cannot be pinned.
+
+    Resolving through the run's ``repo_files`` pins the same sha the steps
+    will read, so a miss costs no extra lookup later in the run.
+    """
+    target = job.target
+    head_sha: str | None = None
+    if target is not None and target.repo:
+        head_sha = await repo_files.resolve_ref(target.owner, target.repo, "main")
+        if head_sha == "main":
+            return None
+    return result_cache_key(job, head_sha=head_sha, profile_version=profile.version)
+
+
 async def run_profile(
     job: PreparedVerificationAttempt,
     *,
@@ -1080,14 +1251,23 @@ async def run_profile(
 ) -> VerificationRunResult:
     """Run a submission type's profile and return the aggregate result.
 
-    Steps run in order; a failed gate with ``stop_on_fail`` short-circuits the
-    rest. Evidence bundles accumulate across steps, are visible to later steps
-    via ``evidence_so_far``, and are carried on the returned run result.
+    Steps run as their declared ``needs`` allow (see :func:`_run_steps`); a
+    failed gate with ``stop_on_fail`` short-circuits every later step.
+    Evidence bundles are visible to dependent steps via ``evidence_so_far``
+    and are carried, in declaration order, on the returned run result.
 
     Every result records both its LLM grading requests and a
     ``grading_disposition`` explaining why grading was requested or skipped.
     An unregistered type (which the exhaustiveness test forbids) returns a
     clean error result.
+
+    Steps share one :class:`CachingRepoFiles` for the run, so a tree or file
+    read by a gate is not fetched again by the review step; its hit/miss
+    counts are recorded on the current span.
+
+    A ``memoize`` profile first looks the run up in the verification result
+    cache (see :mod:`.result_cache`) and returns the stored result, re-homed
+    onto this attempt, when the repository HEAD is unchanged.
     """
     profile = _resolve_profile(job)
     if profile is None:
@@ -1118,26 +1298,34 @@ async def run_profile(
         )
 
     steps = _steps_for(profile)
+    run_repo_files = CachingRepoFiles(repo_files or _production_repo_files(profile))
+    cache = get_verification_result_cache() if profile.memoize else None
+    cache_key = (
+        await _memo_key(job, profile, run_repo_files) if cache is not None else None
+    )
+    if cache is not None and cache_key is not None:
+        cached = await cache.get(cache_key)
+        trace.get_current_span().set_attribute(
+            "verification.result_cache_hit", cached is not None
+        )
+        if cached is not None:
+            return rebind_result(cached, job)
     context = StepContext(
         job=job,
         repository=job.target,
         submitted_value=job.submitted_value.as_text,
-        repo_files=repo_files,
+        repo_files=run_repo_files,
     )
 
-    step_results: list[StepResult] = []
-    bundles: list[EvidenceBundle] = []
-    for step in steps:
-        result = await check_for(step.params)(context, step.params)
-        step_results.append(result)
-        if result.evidence:
-            bundles.extend(result.evidence)
-            context = replace(
-                context,
-                evidence_so_far=(*context.evidence_so_far, *result.evidence),
-            )
-        if not result.passed and result.stop_on_fail:
-            break
+    step_results = await _run_steps(steps, context)
+    bundles = [bundle for result in step_results for bundle in result.evidence]
+
+    trace.get_current_span().set_attributes(
+        {
+            "verification.repo_files.cache_hits": run_repo_files.hits,
+            "verification.repo_files.cache_misses": run_repo_files.misses,
+        }
+    )
 
     deterministic_result = _aggregate(step_results)
     grading_requests = _grading_requests_for(job, deterministic_result, step_results)
@@ -1145,10 +1333,17 @@ async def run_profile(
         profile, step_results, grading_requests
     )
 
-    return VerificationRunResult(
+    run_result = VerificationRunResult(
         attempt=job,
         validation_result=deterministic_result,
         evidence=bundles or None,
         grading_requests=grading_requests,
         grading_disposition=grading_disposition,
     )
+    if (
+        cache is not None
+        and cache_key is not None
+        and deterministic_result.verification_completed
+    ):
+        await cache.set(cache_key, run_result)
+    return run_result
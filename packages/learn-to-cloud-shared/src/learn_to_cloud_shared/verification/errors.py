@@ -73,6 +73,15 @@ class GitHubServerError(ServerError):
     """Raised when GitHub API returns a 5xx or 429 (retriable)."""
 
 
+class GitHubRateLimitExhaustedError(GitHubServerError):
+    """Raised when the GitHub rate-limit budget is spent beyond the pacing window.
+
+    Still a :class:`GitHubServerError`, so callers report an incomplete result,
+    but the in-process retry loop does not sleep on it: the budget will not
+    recover until ``retry_after`` seconds from now.
+    """
+
+
 class DeployedApiServerError(ServerError):
     """Raised when deployed API returns a 5xx error (retriable)."""
 
@@ -0,0 +1,238 @@
+"""GraphQL-backed ``GitHubMetadata`` and ``RepoRef`` adapter with coalescing.
+
+The REST adapters spend one request per question: a HEAD for URL existence,
+``/repos/{o}/{r}`` for fork parentage, ``/branches/{b}`` for a branch HEAD.
+One GraphQL ``repository`` selection answers all three, and many
+repositories fit in a single query under aliases.
+
+:class:`GitHubGraphQLMetadata` implements both seams on top of a
+:class:`GraphQLCoalescer`: lookups issued within ``window`` seconds of each
+other (including from concurrent verifications in the same worker) are
+merged into one aliased query, and identical lookups share one alias.
+GraphQL requires authentication, so the default factories only select this
+adapter when a token is configured.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from functools import lru_cache
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+import httpx
+from opentelemetry import trace
+
+from learn_to_cloud_shared.verification.errors import GitHubServerError
+from learn_to_cloud_shared.verification.github_http import (
+    GITHUB_GRAPHQL_URL,
+    github_graphql,
+    github_head_status,
+)
+
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+
+Node = dict[str, Any]
+
+
+def _literal(value: str) -> str:
+    """Quote ``value`` as a GraphQL string (JSON escapes are valid GraphQL)."""
+    return json.dumps(value)
+
+
+def _repository_selection(owner: str, repo: str, branch: str = "main") -> str:
+    # One shape for every repository question, so a URL check, a fork check
+    # and a HEAD lookup on the same repository collapse to one alias.
+    return (
+        f"repository(owner: {_literal(owner)}, name: {_literal(repo)}) {{"
+        " nameWithOwner isFork parent { nameWithOwner }"
+        " defaultBranchRef { name target { oid } }"
+        f" ref(qualifiedName: {_literal('refs/heads/' + branch)})"
+        " { target { oid } } }"
+    )
+
+
+def _url_selection(url: str) -> str | None:
+    """Map a ``github.com`` account, repository or blob/tree URL to a selection.
+
+    Returns ``None`` for anything else, which is checked with a HEAD instead.
+    Segments are percent-decoded. A blob/tree ref is taken to be the first
+    segment after ``blob``/``tree``; a ref containing ``/`` is therefore
+    misread, which :meth:`GitHubGraphQLMetadata.url_exists` recovers from.
+    """
+    parts = urlsplit(url)
+    if (
+        parts.scheme != "https"
+        or parts.hostname not in _GITHUB_HOSTS
+        or parts.query
+        or parts.fragment
+    ):
+        return None
+    segments = [unquote(segment) for segment in parts.path.split("/") if segment]
+    if len(segments) == 1:
+        return f"repositoryOwner(login: {_literal(segments[0])}) {{ login }}"
+    if len(segments) == 2:
+        return _repository_selection(segments[0], segments[1])
+    if len(segments) >= 4 and segments[2] in ("blob", "tree"):
+        owner, repo, _, ref, *path = segments
+        expression = f"{ref}:{'/'.join(path)}"
+        return (
+            f"repository(owner: {_literal(owner)}, name: {_literal(repo)}) {{"
+            f" object(expression: {_literal(expression)}) {{ oid }} }}"
+        )
+    return None
+
+
+def _not_found(message: str) -> httpx.HTTPStatusError:
+    """Build the 404 the REST adapter would have raised."""
+    request = httpx.Request("POST", GITHUB_GRAPHQL_URL)
+    return httpx.HTTPStatusError(
+        message, request=request, response=httpx.Response(404, request=request)
+    )
+
+
+class GraphQLCoalescer:
+    """Merge selections requested within a short window into one query.
+
+    ``fetch`` returns the selection's node, or ``None`` when GitHub reports
+    it ``NOT_FOUND``. Other per-field errors raise :class:`GitHubServerError`
+    so callers report an incomplete result rather than a learner failure;
+    transport and HTTP errors propagate to every waiter of the batch. A batch
+    is sent early once it reaches ``max_batch`` selections.
+    """
+
+    def __init__(self, *, window: float = 0.01, max_batch: int = 50) -> None:
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[str, asyncio.Future[Node | None]] = {}
+        self._timer: asyncio.Task[None] | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def fetch(self, selection: str) -> Node | None:
+        future = self._pending.get(selection)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[selection] = future
+            if len(self._pending) >= self._max_batch:
+                self._send(self._take())
+            elif self._timer is None:
+                self._timer = asyncio.create_task(self._send_after_window())
+        # Shielded: one caller giving up must not cancel the shared lookup.
+        return await asyncio.shield(future)
+
+    def _take(self) -> dict[str, asyncio.Future[Node | None]]:
+        batch, self._pending = self._pending, {}
+        return batch
+
+    def _send(self, batch: dict[str, asyncio.Future[Node | None]]) -> None:
+        task = asyncio.create_task(self._run(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send_after_window(self) -> None:
+        try:
+            await asyncio.sleep(self._window)
+        finally:
+            self._timer = None
+        batch = self._take()
+        if batch:
+            await self._run(batch)
+
+    async def _run(self, batch: dict[str, asyncio.Future[Node | None]]) -> None:
+        aliased = {f"q{i}": item for i, item in enumerate(batch.items())}
+        fields = "\n".join(
+            f"  {alias}: {selection}" for alias, (selection, _) in aliased.items()
+        )
+        query = f"query {{\n{fields}\n}}"
+        trace.get_current_span().add_event(
+            "github_graphql_batch", {"batch.size": len(aliased)}
+        )
+        try:
+            payload = await github_graphql(query)
+        except BaseException as e:
+            for _, future in aliased.values():
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        data: Node = payload.get("data") or {}
+        errors: dict[str | None, Node] = {}
+        for error in payload.get("errors") or []:
+            path = error.get("path") or [None]
+            errors.setdefault(path[0], error)
+        for alias, (_, future) in aliased.items():
+            if future.done():
+                continue
+            node = data.get(alias)
+            error = errors.get(alias) or errors.get(None)
+            if node is not None or error is None or error.get("type") == "NOT_FOUND":
+                future.set_result(node)
+            else:
+                future.set_exception(
+                    GitHubServerError(
+                        f"GitHub GraphQL error: {error.get('message', 'unknown')}"
+                    )
+                )
+
+
+class GitHubGraphQLMetadata:
+    """Production adapter answering ``GitHubMetadata`` and ``RepoRef`` lookups.
+
+    Account, repository and ``blob``/``tree`` URLs on ``github.com`` are
+    resolved through GraphQL; any other URL, and a blob/tree URL whose
+    object GraphQL cannot find, falls back to a HEAD request.
+    ``repo_metadata`` returns the REST-shaped subset the validators read
+    (``full_name``, ``fork``, ``parent.full_name``, ``default_branch``).
+    """
+
+    def __init__(self, coalescer: GraphQLCoalescer | None = None) -> None:
+        self._coalescer = coalescer or GraphQLCoalescer()
+
+    async def url_exists(self, url: str) -> bool:
+        selection = _url_selection(url)
+        if selection is None:
+            return await github_head_status(url) == 200
+        node = await self._coalescer.fetch(selection)
+        if node is None:
+            return False
+        if "object" in node and node["object"] is None:
+            # Either the path is missing or the ref contains "/" and was
+            # split in the wrong place; only the web URL can tell which.
+            return await github_head_status(url) == 200
+        return True
+
+    async def repo_metadata(self, owner: str, repo: str) -> dict[str, Any] | None:
+        node = await self._coalescer.fetch(_repository_selection(owner, repo))
+        if node is None:
+            return None
+        metadata: dict[str, Any] = {
+            "full_name": node["nameWithOwner"],
+            "fork": node["isFork"],
+            "default_branch": (node.get("defaultBranchRef") or {}).get("name"),
+        }
+        if node.get("parent"):
+            metadata["parent"] = {"full_name": node["parent"]["nameWithOwner"]}
+        return metadata
+
+    async def head_sha(self, owner: str, repo: str, branch: str = "main") -> str | None:
+        node = await self._coalescer.fetch(_repository_selection(owner, repo, branch))
+        if node is None:
+            raise _not_found(f"Repository {owner}/{repo} not found")
+        ref = node.get("ref")
+        if ref is None:
+            raise _not_found(f"Branch {branch} not found in {owner}/{repo}")
+        sha = (ref.get("target") or {}).get("oid")
+        return sha if isinstance(sha, str) else None
+
+
+@lru_cache(maxsize=1)
+def default_graphql_metadata() -> GitHubGraphQLMetadata:
+    """Return the shared adapter, so every caller feeds the same coalescer."""
+    return GitHubGraphQLMetadata()
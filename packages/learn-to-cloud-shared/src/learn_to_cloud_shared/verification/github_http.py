@@ -10,15 +10,39 @@ retry and error handling.
 SCALABILITY:
 - Retry with exponential backoff + jitter for transient failures (3 attempts).
 - Connection pooling via the shared ``httpx.AsyncClient``.
+- Rate-limit pacing: every API call leases a credential from the
+  process-wide token pool in :mod:`.github_rate_limit` and reports its
+  headers back, so load spreads over every configured token and a low
+  budget spaces calls out instead of ending in 403/429 retry storms. A call
+  whose token hits its primary limit is resent once on another token.
+- Conditional requests: ``github_api_get`` remembers each response's
+  ``ETag``/``Last-Modified`` and revalidates with ``If-None-Match`` /
+  ``If-Modified-Since``. GitHub does not count a 304 against the rate limit,
+  so repeated identical lookups (a learner retrying a failed verification)
+  stop spending quota.
+- Single flight: concurrent identical ``github_api_get`` calls share one
+  in-flight request, so a cache expiry under load costs one call, not N.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Protocol
+from urllib.parse import urlencode
+
 import httpx
+from cachetools import LRUCache
+from opentelemetry import trace
 from tenacity import (
     RetryCallState,
     retry,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     stop_after_attempt,
     wait_exponential_jitter,
 )
@@ -27,11 +51,26 @@ from learn_to_cloud_shared.core.config import get_worker_settings
 from learn_to_cloud_shared.core.github_client import (
     get_github_client as _get_github_client,
 )
-from learn_to_cloud_shared.verification.errors import GitHubServerError, make_retriable
+from learn_to_cloud_shared.verification.errors import (
+    GitHubRateLimitExhaustedError,
+    GitHubServerError,
+    make_retriable,
+)
+from learn_to_cloud_shared.verification.github_rate_limit import (
+    get_github_token_pool,
+    rate_limit_resource,
+)
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
 # Exceptions that should trigger retry.
 RETRIABLE_EXCEPTIONS: tuple[type[Exception], ...] = make_retriable(GitHubServerError)
 
+# An exhausted budget will not recover within the retry window; fail fast.
+_retry_transient = retry_if_exception_type(
+    RETRIABLE_EXCEPTIONS
+) & retry_if_not_exception_type(GitHubRateLimitExhaustedError)
+
 
 def _parse_retry_after(header_value: str | None) -> float | None:
     """Parse a ``Retry-After`` header into seconds."""
@@ -51,17 +90,38 @@ def _wait_with_retry_after(retry_state: RetryCallState) -> float:
     return wait_exponential_jitter(initial=0.5, max=10)(retry_state)
 
 
-def get_github_headers() -> dict[str, str]:
-    """Get headers for GitHub API requests, including the auth token if set."""
+def get_github_headers(token: str | None = None) -> dict[str, str]:
+    """Get headers for GitHub API requests, including the auth token if set.
+
+    ``token`` overrides the configured ``github.token`` (``""`` for none).
+    """
     headers = {"Accept": "application/vnd.github.v3+json"}
-    settings = get_worker_settings()
-    if settings.github.token:
-        headers["Authorization"] = f"Bearer {settings.github.token}"
+    if token is None:
+        token = get_worker_settings().github.token
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
     return headers
 
 
+def _is_primary_rate_limit(response: httpx.Response) -> bool:
+    return (
+        response.status_code == 403
+        and response.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
 def raise_for_server_error(response: httpx.Response) -> None:
-    """Map a 5xx or 429 response to the retriable :class:`GitHubServerError`."""
+    """Map a 5xx or 429 response to the retriable :class:`GitHubServerError`.
+
+    A 403 with ``X-RateLimit-Remaining: 0`` is GitHub's primary rate limit;
+    it raises :class:`GitHubRateLimitExhaustedError` until the reset.
+    """
+    if _is_primary_rate_limit(response):
+        reset_at = _parse_retry_after(response.headers.get("X-RateLimit-Reset"))
+        raise GitHubRateLimitExhaustedError(
+            "GitHub rate limit exhausted (403)",
+            retry_after=max(reset_at - time.time(), 0.0) if reset_at else None,
+        )
     if response.status_code >= 500:
         raise GitHubServerError(f"GitHub returned {response.status_code}")
     if response.status_code == 429:
@@ -69,47 +129,311 @@ def raise_for_server_error(response: httpx.Response) -> None:
         raise GitHubServerError("GitHub rate limited (429)", retry_after=retry_after)
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=_wait_with_retry_after,
-    retry=retry_if_exception_type(RETRIABLE_EXCEPTIONS),
-    reraise=True,
+async def _send_pooled(
+    url: str, send: Callable[[str], Awaitable[httpx.Response]]
+) -> httpx.Response:
+    """Send one API request with a leased pool credential's token.
+
+    A credential that hits its primary rate limit cools down until its
+    reset; the request is then sent once more on another credential that is
+    still ready, so one spent token does not fail a call the pool can serve.
+    """
+    pool = get_github_token_pool()
+    async with pool.lease(url) as credential:
+        response = await send(credential.token)
+        credential.observe(response)
+    if _is_primary_rate_limit(response) and pool.has_ready_credential():
+        async with pool.lease(url) as credential:
+            response = await send(credential.token)
+            credential.observe(response)
+    return response
+
+
+@dataclass(frozen=True, slots=True)
+class CachedGitHubResponse:
+    """A validated 200 response kept for conditional revalidation."""
+
+    etag: str | None
+    last_modified: str | None
+    headers: tuple[tuple[str, str], ...]
+    content: bytes
+
+
+class GitHubResponseCache(Protocol):
+    """Storage for :class:`CachedGitHubResponse` entries.
+
+    The in-process LRU is the default; a shared backend (for example one
+    keyed store for every Functions worker) can be installed with
+    :func:`set_github_response_cache`.
+    """
+
+    async def get(self, key: str) -> CachedGitHubResponse | None: ...
+
+    async def set(self, key: str, entry: CachedGitHubResponse) -> None: ...
+
+
+def _entry_size(entry: CachedGitHubResponse) -> int:
+    """Approximate bytes held by one entry: body plus stored headers."""
+    return len(entry.content) + sum(len(k) + len(v) for k, v in entry.headers)
+
+
+class InMemoryGitHubResponseCache:
+    """Bounded per-process LRU of conditional-request entries.
+
+    Bounded by both ``maxsize`` entries and ``max_bytes`` of stored bodies
+    and headers. A response larger than a sixteenth of the byte budget is
+    not cached, so one large body cannot evict everything else.
+    """
+
+    def __init__(self, maxsize: int, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self._maxsize = maxsize
+        self._max_entry_bytes = max_bytes // 16
+        self._entries: LRUCache[str, CachedGitHubResponse] = LRUCache(
+            maxsize=max_bytes, getsizeof=_entry_size
+        )
+
+    async def get(self, key: str) -> CachedGitHubResponse | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, entry: CachedGitHubResponse) -> None:
+        if _entry_size(entry) > self._max_entry_bytes:
+            # The old entry's validators no longer match this response.
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = entry
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem()
+
+
+_response_cache_override: GitHubResponseCache | None = None
+
+
+@lru_cache(maxsize=1)
+def _default_response_cache() -> GitHubResponseCache | None:
+    github = get_worker_settings().github
+    if github.response_cache_size <= 0 or github.response_cache_max_bytes <= 0:
+        return None
+    return InMemoryGitHubResponseCache(
+        github.response_cache_size, max_bytes=github.response_cache_max_bytes
+    )
+
+
+def get_github_response_cache() -> GitHubResponseCache | None:
+    """Return the active response cache, or ``None`` when disabled."""
+    return _response_cache_override or _default_response_cache()
+
+
+def set_github_response_cache(cache: GitHubResponseCache | None) -> None:
+    """Install a shared cache backend; ``None`` restores the default."""
+    global _response_cache_override
+    _response_cache_override = cache
+
+
+def clear_github_response_cache() -> None:
+    """Drop the override and the default in-process cache (for tests)."""
+    set_github_response_cache(None)
+    _default_response_cache.cache_clear()
+
+
+# Describe the body as transferred, not the decoded bytes we keep.
+_TRANSFER_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
 )
+
+
+def _response_cache_key(
+    url: str,
+    params: Mapping[str, str | int] | None,
+    headers: Mapping[str, str],
+) -> str:
+    """Key on the request plus a digest of its headers.
+
+    Headers carry the token and ``Accept`` media type, both of which change
+    what GitHub returns, so they are part of the key without being stored.
+    """
+    query = urlencode(sorted((params or {}).items()))
+    header_digest = hashlib.sha256(
+        repr(sorted((k.lower(), v) for k, v in headers.items())).encode()
+    ).hexdigest()
+    return f"{url}?{query}#{header_digest}"
+
+
+def _replay_cached(
+    cached: CachedGitHubResponse, not_modified: httpx.Response
+) -> httpx.Response:
+    """Rebuild a 200 from the cached body, with the 304's fresh headers."""
+    headers = dict(cached.headers)
+    headers.update(
+        (k, v)
+        for k, v in not_modified.headers.items()
+        if k.lower() not in _TRANSFER_HEADERS
+    )
+    return httpx.Response(
+        200,
+        headers=headers,
+        content=cached.content,
+        request=not_modified.request,
+    )
+
+
+def _to_cached(response: httpx.Response) -> CachedGitHubResponse | None:
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag is None and last_modified is None:
+        return None
+    return CachedGitHubResponse(
+        etag=etag,
+        last_modified=last_modified,
+        headers=tuple(
+            (k, v)
+            for k, v in response.headers.items()
+            if k.lower() not in _TRANSFER_HEADERS
+        ),
+        content=response.content,
+    )
+
+
+_inflight_gets: dict[str, asyncio.Task[httpx.Response]] = {}
+
+
 async def github_api_get(
     url: str,
     *,
     extra_headers: dict[str, str] | None = None,
     params: dict[str, str | int] | None = None,
 ) -> httpx.Response:
-    """Resilient GitHub API GET with retry and 5xx/429 mapping.
+    """Resilient GitHub API GET with retry, 5xx/429 mapping, and revalidation.
+
+    A previously seen response is revalidated with its validators; on 304
+    the cached body is returned as a 200 so callers never see the 304.
+    Identical calls made while one is in flight await that call's outcome
+    (response or exception) instead of sending their own.
 
     Raises:
         GitHubServerError: On 5xx or 429 (triggers retry).
         httpx.HTTPStatusError: On non-retriable HTTP errors (4xx).
     """
+    extra_headers = extra_headers or {}
+    # Keyed on the configured token, so every pooled token shares an entry.
+    key = _response_cache_key(url, params, {**get_github_headers(), **extra_headers})
+    task = _inflight_gets.get(key)
+    if task is None:
+        task = asyncio.create_task(_github_api_get(url, key, extra_headers, params))
+        _inflight_gets[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(key, done))
+    else:
+        trace.get_current_span().add_event("github_request_coalesced")
+    # Shielded: a cancelled caller must not cancel the call others await.
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(key: str, task: asyncio.Task[httpx.Response]) -> None:
+    if _inflight_gets.get(key) is task:
+        del _inflight_gets[key]
+    if not task.cancelled():
+        task.exception()  # Mark retrieved even if every caller went away.
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=_wait_with_retry_after,
+    retry=_retry_transient,
+    reraise=True,
+)
+async def _github_api_get(
+    url: str,
+    cache_key: str,
+    extra_headers: dict[str, str],
+    params: dict[str, str | int] | None,
+) -> httpx.Response:
     client = await _get_github_client()
-    headers = get_github_headers()
-    if extra_headers:
-        headers.update(extra_headers)
-    response = await client.get(url, headers=headers, params=params)
+    cache = get_github_response_cache()
+    cached = await cache.get(cache_key) if cache is not None else None
+    validators: dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            validators["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            validators["If-Modified-Since"] = cached.last_modified
+
+    response = await _send_pooled(
+        url,
+        lambda token: client.get(
+            url,
+            headers={**get_github_headers(token), **extra_headers, **validators},
+            params=params,
+        ),
+    )
+    if cached is not None and response.status_code == 304:
+        trace.get_current_span().add_event("github_response_revalidated")
+        return _replay_cached(cached, response)
+
     raise_for_server_error(response)
     response.raise_for_status()
+    if cache is not None and response.status_code == 200:
+        entry = _to_cached(response)
+        if entry is not None:
+            await cache.set(cache_key, entry)
     return response
 
 
 @retry(
     stop=stop_after_attempt(3),
     wait=_wait_with_retry_after,
-    retry=retry_if_exception_type(RETRIABLE_EXCEPTIONS),
+    retry=_retry_transient,
     reraise=True,
 )
 async def github_head_status(url: str) -> int:
     """Resilient GitHub HEAD returning the status code, with 5xx/429 retry.
 
+    Only ``api.github.com`` requests use a pooled token. Web hosts are sent
+    unauthenticated and are not metered, so their 429s leave the pool alone.
+
     Raises:
         GitHubServerError: On 5xx or 429 (triggers retry).
     """
     client = await _get_github_client()
-    response = await client.head(url)
+    if rate_limit_resource(url) is None:
+        response = await client.head(url)
+    else:
+        response = await _send_pooled(
+            url, lambda token: client.head(url, headers=get_github_headers(token))
+        )
     raise_for_server_error(response)
     return response.status_code
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=_wait_with_retry_after,
+    retry=_retry_transient,
+    reraise=True,
+)
+async def github_graphql(query: str) -> dict[str, Any]:
+    """Resilient GitHub GraphQL POST returning the decoded payload.
+
+    Per-field ``errors`` (for example ``NOT_FOUND``) are left in the payload
+    for the caller to map; only a request-wide rate limit is raised.
+
+    Raises:
+        GitHubServerError: On 5xx, 429 or a ``RATE_LIMITED`` payload.
+        httpx.HTTPStatusError: On non-retriable HTTP errors (4xx).
+    """
+    client = await _get_github_client()
+    response = await _send_pooled(
+        GITHUB_GRAPHQL_URL,
+        lambda token: client.post(
+            GITHUB_GRAPHQL_URL,
+            headers=get_github_headers(token),
+            json={"query": query},
+        ),
+    )
+    raise_for_server_error(response)
+    response.raise_for_status()
+    payload: dict[str, Any] = response.json()
+    if payload.get("data") is None and any(
+        error.get("type") == "RATE_LIMITED" for error in payload.get("errors") or []
+    ):
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        raise GitHubServerError("GitHub GraphQL rate limited", retry_after=retry_after)
+    return payload
@@ -17,6 +17,8 @@ from typing import Any, Protocol, runtime_checkable
 
 import httpx
 
+from learn_to_cloud_shared.core.config import get_worker_settings
+from learn_to_cloud_shared.verification.github_graphql import default_graphql_metadata
 from learn_to_cloud_shared.verification.github_http import (
     github_api_get,
     github_head_status,
@@ -97,5 +99,12 @@ _DEFAULT_GITHUB_METADATA = GitHubApiMetadata()
 
 
 def default_github_metadata() -> GitHubMetadata:
-    """Return the shared production adapter used when no port is injected."""
+    """Return the shared production adapter used when no port is injected.
+
+    With ``github.graphql_metadata`` on and a token configured, this is the batched
+    GraphQL adapter instead of the REST one.
+    """
+    github = get_worker_settings().github
+    if github.graphql_metadata and github.token_list():
+        return default_graphql_metadata()
     return _DEFAULT_GITHUB_METADATA
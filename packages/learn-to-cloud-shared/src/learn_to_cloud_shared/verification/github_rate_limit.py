@@ -0,0 +1,297 @@
+"""Process-wide GitHub rate-limit budgets, pacing and token pooling.
+
+Every GitHub API response carries ``X-RateLimit-Remaining`` /
+``X-RateLimit-Reset`` for its resource (``core``, ``graphql``, ...).
+:class:`GitHubRateLimitBudget` keeps the latest window per resource and,
+once the remaining budget drops below a low watermark, spaces outgoing calls
+evenly over the time left until the reset, or over ``max_wait`` when the
+reset is further off. The spacing grows as the budget shrinks, so during a
+submission spike verifications slow down gradually instead of running into
+403/429s and then sleeping through retries.
+
+No call is held longer than ``max_wait``. Only once the window is spent and
+its reset lies beyond ``max_wait`` does a call raise
+:class:`GitHubRateLimitExhaustedError`, before anything is sent, so the
+activity reports an incomplete result promptly.
+
+:class:`GitHubTokenPool` holds one budget per configured token and routes
+each call to the least-loaded one, so peak throughput scales with the number
+of credentials. The remaining budgets are exported as the
+``github.rate_limit.remaining`` gauge.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+import httpx
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from learn_to_cloud_shared.core.config import get_worker_settings
+from learn_to_cloud_shared.verification.errors import GitHubRateLimitExhaustedError
+
+_API_HOST = "api.github.com"
+# Cool-down for a rate-limited response that names no reset time.
+_DEFAULT_COOLDOWN = 60.0
+
+
+@dataclass(slots=True)
+class _Window:
+    limit: int
+    remaining: int
+    reset_at: float
+    next_slot: float = 0.0
+
+
+def rate_limit_resource(url: str) -> str | None:
+    """Return the budget a request to ``url`` is charged to, if any.
+
+    Only ``api.github.com`` is metered; web and raw-content hosts are not.
+    """
+    parts = urlsplit(url)
+    if parts.hostname != _API_HOST:
+        return None
+    if parts.path == "/graphql":
+        return "graphql"
+    if parts.path.startswith("/search/"):
+        return "search"
+    return "core"
+
+
+class GitHubRateLimitBudget:
+    """Latest rate-limit window per resource, and the pacing derived from it."""
+
+    def __init__(
+        self,
+        *,
+        low_watermark: float = 0.1,
+        max_wait: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._low_watermark = low_watermark
+        self._max_wait = max_wait
+        self.clock = clock
+        self._windows: dict[str, _Window] = {}
+
+    def observe(self, response: httpx.Response) -> None:
+        """Record the rate-limit headers of ``response``, if it has them."""
+        headers = response.headers
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        resource = headers.get("X-RateLimit-Resource", "core")
+        window = self._windows.get(resource)
+        if window is None or reset_at > window.reset_at:
+            self._windows[resource] = _Window(limit, remaining, reset_at)
+        elif reset_at == window.reset_at:
+            # Responses can arrive out of order; the lowest count is newest.
+            window.remaining = min(window.remaining, remaining)
+
+    def reserve(self, resource: str) -> float:
+        """Claim one call against ``resource`` and return the seconds to wait.
+
+        Below the watermark each call is queued ``min(until_reset, max_wait)
+        / remaining`` after the previous one, and never more than
+        ``max_wait`` from now, so pacing alone does not fail a call.
+
+        Raises:
+            GitHubRateLimitExhaustedError: When the window is spent and resets
+                more than ``max_wait`` from now.
+        """
+        window = self._windows.get(resource)
+        now = self.clock()
+        if window is None or now >= window.reset_at:
+            return 0.0
+        if window.remaining > window.limit * self._low_watermark:
+            window.remaining -= 1
+            return 0.0
+
+        until_reset = window.reset_at - now
+        if window.remaining <= 0:
+            if until_reset > self._max_wait:
+                raise GitHubRateLimitExhaustedError(
+                    f"GitHub {resource} rate limit budget exhausted",
+                    retry_after=until_reset,
+                )
+            slot = window.reset_at
+        else:
+            interval = min(until_reset, self._max_wait) / window.remaining
+            slot = min(
+                max(now, window.next_slot) + interval,
+                now + self._max_wait,
+                window.reset_at,
+            )
+        delay = slot - now
+        window.next_slot = slot
+        window.remaining = max(window.remaining - 1, 0)
+        return delay
+
+    def remaining_for(self, resource: str) -> float:
+        """Calls left for ``resource``; ``inf`` when no window is known."""
+        window = self._windows.get(resource)
+        if window is None or self.clock() >= window.reset_at:
+            return float("inf")
+        return window.remaining
+
+    def remaining(self) -> dict[str, int]:
+        """Remaining calls per resource in the current (unexpired) windows."""
+        now = self.clock()
+        return {
+            resource: window.remaining
+            for resource, window in self._windows.items()
+            if now < window.reset_at
+        }
+
+
+class GitHubCredential:
+    """One pooled token with its own budget, cool-down and in-flight count.
+
+    ``token`` is ``""`` for the anonymous credential used when none is set.
+    """
+
+    def __init__(self, token: str, budget: GitHubRateLimitBudget) -> None:
+        self.token = token
+        self.budget = budget
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+
+    def observe(self, response: httpx.Response) -> None:
+        """Record rate-limit headers and cool down on a 403/429 rate limit."""
+        self.budget.observe(response)
+        headers = response.headers
+        status = response.status_code
+        limited = status == 429 or (
+            status == 403
+            and (
+                headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers
+            )
+        )
+        if not limited:
+            return
+        now = self.budget.clock()
+        try:
+            until = now + float(headers["Retry-After"])
+        except (KeyError, ValueError):
+            try:
+                until = float(headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                until = now + _DEFAULT_COOLDOWN
+        self.cooldown_until = max(self.cooldown_until, until)
+
+
+class GitHubTokenPool:
+    """Spread GitHub calls over several tokens, least-loaded first.
+
+    Each token keeps its own :class:`GitHubRateLimitBudget`. A call goes to
+    the credential with the most remaining budget for its resource (unknown
+    counts as full), breaking ties by fewest calls in flight. A credential
+    that hits a 403/429 rate limit cools down until its ``Retry-After`` or
+    reset; when every credential is cooling down, the call waits for the
+    first one back, or fails fast past ``max_wait``.
+    """
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        *,
+        low_watermark: float = 0.1,
+        max_wait: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_wait = max_wait
+        self._clock = clock
+        self.credentials = [
+            GitHubCredential(
+                token,
+                GitHubRateLimitBudget(
+                    low_watermark=low_watermark, max_wait=max_wait, clock=clock
+                ),
+            )
+            for token in (tokens or [""])
+        ]
+
+    def _pick(self, resource: str | None) -> GitHubCredential:
+        now = self._clock()
+        ready = [c for c in self.credentials if c.cooldown_until <= now]
+        if not ready:
+            credential = min(self.credentials, key=lambda c: c.cooldown_until)
+            wait = credential.cooldown_until - now
+            if wait > self._max_wait:
+                raise GitHubRateLimitExhaustedError(
+                    "Every GitHub credential is rate limited", retry_after=wait
+                )
+            return credential
+        if resource is None:
+            return min(ready, key=lambda c: c.in_flight)
+        return max(
+            ready,
+            key=lambda c: (c.budget.remaining_for(resource), -c.in_flight),
+        )
+
+    def has_ready_credential(self) -> bool:
+        """Whether any credential is out of its cool-down."""
+        now = self._clock()
+        return any(c.cooldown_until <= now for c in self.credentials)
+
+    @asynccontextmanager
+    async def lease(self, url: str) -> AsyncIterator[GitHubCredential]:
+        """Hold a credential for one request to ``url``, after pacing it."""
+        resource = rate_limit_resource(url)
+        credential = self._pick(resource)
+        delay = max(credential.cooldown_until - self._clock(), 0.0)
+        if resource is not None:
+            delay = max(delay, credential.budget.reserve(resource))
+        credential.in_flight += 1
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield credential
+        finally:
+            credential.in_flight -= 1
+
+    def remaining(self) -> list[tuple[int, str, int]]:
+        """``(credential index, resource, remaining)`` for every known window."""
+        return [
+            (index, resource, remaining)
+            for index, credential in enumerate(self.credentials)
+            for resource, remaining in credential.budget.remaining().items()
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_github_token_pool() -> GitHubTokenPool:
+    """Return the process-wide pool shared by every GitHub call."""
+    github = get_worker_settings().github
+    return GitHubTokenPool(
+        github.token_list(),
+        low_watermark=github.rate_limit_low_watermark,
+        max_wait=github.rate_limit_max_wait_seconds,
+    )
+
+
+def _observe_remaining(options: CallbackOptions) -> Iterable[Observation]:
+    if get_github_token_pool.cache_info().currsize == 0:
+        return []
+    return [
+        Observation(remaining, {"resource": resource, "credential": index})
+        for index, resource, remaining in get_github_token_pool().remaining()
+    ]
+
+
+_meter = metrics.get_meter("learn_to_cloud")
+_meter.create_observable_gauge(
+    name="github.rate_limit.remaining",
+    callbacks=[_observe_remaining],
+    description="GitHub API calls left in the current rate-limit window",
+    unit="{request}",
+)
@@ -0,0 +1,106 @@
+"""Durable cache of LLM grading decisions.
+
+Regrading the same evidence against the same rubric with the same model
+deployment should give the same answer, so ``run_llm_grading`` looks the
+decision up here before calling the model. The key covers the task id, the
+rubric hash (criteria, rubric id, prompt version, passing score), every
+evidence item's ``(path, sha256)``, the model deployment name and a hash of
+everything the model reads: the grader's system prompt and the rendered
+request message. The message names the repository and carries the
+deterministic result, so learners with byte-identical evidence never share a
+decision, and a prompt change misses instead of reusing stale decisions. A
+request with no hashed evidence is never cached.
+
+Decisions live in Postgres (``llm_grading_decisions``) so every Functions
+worker shares them and they survive restarts. ``GRADING_CACHE__TTL_SECONDS``
+bounds their lifetime and ``GRADING_CACHE__BYPASS`` forces a fresh grade
+while still recording it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import timedelta
+
+from opentelemetry import trace
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from learn_to_cloud_shared.core.config import get_worker_settings
+from learn_to_cloud_shared.models import utcnow
+from learn_to_cloud_shared.repositories.llm_grading_decision_repository import (
+    LLMGradingDecisionRepository,
+)
+from learn_to_cloud_shared.verification.grading_requests import (
+    LLMGradingRequest,
+    rubric_hash,
+)
+from learn_to_cloud_shared.verification.tasks import LLMGradingDecision
+
+
+def grading_cache_key(
+    request: LLMGradingRequest, *, model_deployment: str, system_prompt: str
+) -> str | None:
+    """Return the decision cache key, or ``None`` when nothing is hashed."""
+    if not request.evidence_hashes:
+        return None
+    conversation = json.dumps([system_prompt, request.message])
+    parts = [
+        request.task.id,
+        rubric_hash(request.task),
+        [list(item) for item in request.evidence_hashes],
+        model_deployment,
+        hashlib.sha256(conversation.encode("utf-8")).hexdigest(),
+    ]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+async def get_cached_grading_decision(
+    request: LLMGradingRequest,
+    *,
+    model_deployment: str,
+    system_prompt: str,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> LLMGradingDecision | None:
+    """Return a live cached decision for ``request``, unless disabled."""
+    config = get_worker_settings().grading_cache
+    key = grading_cache_key(
+        request, model_deployment=model_deployment, system_prompt=system_prompt
+    )
+    if key is None or config.ttl_seconds == 0 or config.bypass:
+        return None
+    async with session_maker() as db:
+        stored = await LLMGradingDecisionRepository(db).get_unexpired(key)
+    trace.get_current_span().set_attribute(
+        "verification.llm_grading_cache_hit", stored is not None
+    )
+    if stored is None:
+        return None
+    return LLMGradingDecision.model_validate(stored)
+
+
+async def store_grading_decision(
+    request: LLMGradingRequest,
+    decision: LLMGradingDecision,
+    *,
+    model_deployment: str,
+    system_prompt: str,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    """Record ``decision`` for reuse by identical grading requests."""
+    config = get_worker_settings().grading_cache
+    key = grading_cache_key(
+        request, model_deployment=model_deployment, system_prompt=system_prompt
+    )
+    if key is None or config.ttl_seconds == 0:
+        return
+    async with session_maker() as db:
+        await LLMGradingDecisionRepository(db).upsert(
+            cache_key=key,
+            task_id=request.task.id,
+            rubric_hash=rubric_hash(request.task),
+            model_deployment=model_deployment,
+            decision=decision.model_dump(mode="json"),
+            expires_at=utcnow() + timedelta(seconds=config.ttl_seconds),
+        )
+        await db.commit()
@@ -9,8 +9,11 @@ and keeps prompt construction shared with the grading activity.
 
 from __future__ import annotations
 
+import hashlib
 import json
 
+from pydantic import Field
+
 from learn_to_cloud_shared.schemas import FrozenModel, ValidationResult
 from learn_to_cloud_shared.verification.tasks import (
     LLMGradingDecision,
@@ -20,11 +23,16 @@ from learn_to_cloud_shared.verification.tasks import (
 
 
 class LLMGradingRequest(FrozenModel):
-    """One durable agent grading request."""
+    """One durable agent grading request.
+
+    ``evidence_hashes`` lists the ``(path, sha256)`` of every evidence item in
+    the prompt; it keys the grading decision cache.
+    """
 
     task: VerificationTask
     message: str
     thread_id: str
+    evidence_hashes: list[tuple[str, str]] = Field(default_factory=list)
 
 
 class LLMGradingDecisionPayload(FrozenModel):
@@ -46,6 +54,12 @@ def _task_payload(task: VerificationTask) -> dict[str, object]:
     }
 
 
+def rubric_hash(task: VerificationTask) -> str:
+    """Return a stable hash of the rubric a task is graded against."""
+    canonical = json.dumps(_task_payload(task), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def build_repo_rubric_message(
     *,
     requirement_slug: str,
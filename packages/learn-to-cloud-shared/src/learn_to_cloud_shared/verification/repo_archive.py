@@ -0,0 +1,288 @@
+"""Tarball-backed ``RepoFiles`` adapter for pattern-discovered evidence.
+
+:class:`GitHubRepoFiles` costs one Trees API call plus one raw GET per
+evidence path. For profiles that discover evidence by path pattern
+(Phase 5), :class:`GitHubArchiveRepoFiles` instead downloads a single
+tarball of the ref and answers every ``tree``/``file`` read from it.
+
+The archive is streamed: gzip is inflated in bounded pieces and tar members
+are parsed as they arrive, so a large repository is never buffered whole.
+Only members matching the configured path patterns are retained, each cut
+at ``max_file_size_bytes`` (plus one byte, so the evidence cap still sees
+it as oversized) and all of them within ``max_total_bytes``. Anything not
+retained is read through the ``fallback`` adapter on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tarfile
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+
+import httpx
+from opentelemetry import trace
+
+from learn_to_cloud_shared.core.github_client import get_github_client
+from learn_to_cloud_shared.verification.github_http import (
+    RETRIABLE_EXCEPTIONS,
+    get_github_headers,
+    raise_for_server_error,
+)
+from learn_to_cloud_shared.verification.github_rate_limit import (
+    get_github_token_pool,
+)
+from learn_to_cloud_shared.verification.repo_files import RefResolver, RepoFiles
+
+_BLOCK = 512
+# Upper bound on inflated bytes produced per decompress call.
+_INFLATE_PIECE = 64 * 1024
+
+
+class _InflatedStream:
+    """Exact-size reads over a gzip byte stream, inflating incrementally."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._inflate = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        self._buffer = bytearray()
+        self._exhausted = False
+
+    async def _fill(self) -> bool:
+        if self._inflate.unconsumed_tail:
+            data = self._inflate.unconsumed_tail
+        elif self._exhausted:
+            return False
+        else:
+            try:
+                data = await anext(self._chunks)
+            except StopAsyncIteration:
+                self._exhausted = True
+                self._buffer += self._inflate.flush()
+                if not self._inflate.eof:
+                    # A cut-off download would otherwise read as a complete
+                    # archive missing its later files.
+                    raise zlib.error("gzip stream ended before its end marker")
+                return bool(self._buffer)
+        self._buffer += self._inflate.decompress(data, _INFLATE_PIECE)
+        return True
+
+    async def read(self, size: int) -> bytes | None:
+        """Return exactly ``size`` bytes, or ``None`` at end of stream."""
+        while len(self._buffer) < size:
+            if not await self._fill():
+                return None
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    async def skip(self, size: int) -> None:
+        """Discard ``size`` bytes without holding them."""
+        while size > 0:
+            if not self._buffer and not await self._fill():
+                return
+            dropped = min(size, len(self._buffer))
+            del self._buffer[:dropped]
+            size -= dropped
+
+
+def _pax_path(payload: bytes) -> str | None:
+    """Return the ``path`` record of a pax extended header, if any.
+
+    Raises:
+        tarfile.HeaderError: A record length is malformed.
+    """
+    offset = 0
+    while offset < len(payload):
+        space = payload.find(b" ", offset)
+        if space < 0:
+            break
+        try:
+            length = int(payload[offset:space])
+        except ValueError:
+            length = 0
+        # A record must span past its own length field, or ``offset`` would
+        # never advance.
+        if length <= space - offset + 1:
+            raise tarfile.HeaderError("invalid pax extended header record")
+        key, _, value = payload[space + 1 : offset + length - 1].partition(b"=")
+        if key == b"path":
+            return value.decode("utf-8", "surrogateescape")
+        offset += length
+    return None
+
+
+async def _iter_tar_members(
+    stream: _InflatedStream,
+    keep: Callable[[str, int], int],
+) -> AsyncIterator[tuple[str, tarfile.TarInfo, bytes | None]]:
+    """Yield ``(name, info, content)`` for each member of a tar stream.
+
+    ``keep(name, size)`` returns how many leading bytes of a regular file to
+    retain (``0`` to skip it); the rest of the member is discarded.
+    """
+    long_name: str | None = None
+    while True:
+        block = await stream.read(_BLOCK)
+        if block is None or block == bytes(_BLOCK):
+            return
+        info = tarfile.TarInfo.frombuf(block, "utf-8", "surrogateescape")
+        padded = -(-info.size // _BLOCK) * _BLOCK
+        if info.type in (tarfile.XHDTYPE, tarfile.XGLTYPE, tarfile.GNUTYPE_LONGNAME):
+            payload = (await stream.read(padded) or b"")[: info.size]
+            if info.type == tarfile.GNUTYPE_LONGNAME:
+                long_name = payload.rstrip(b"\0").decode("utf-8", "surrogateescape")
+            elif info.type == tarfile.XHDTYPE:
+                long_name = _pax_path(payload) or long_name
+            continue
+
+        name = long_name or info.name
+        long_name = None
+        content: bytes | None = None
+        remaining = padded
+        if info.isreg():
+            retain = min(keep(name, info.size), info.size)
+            if retain > 0:
+                content = await stream.read(retain)
+                remaining -= retain
+        await stream.skip(remaining)
+        yield name, info, content
+
+
+@dataclass(frozen=True, slots=True)
+class _Archive:
+    paths: list[str]
+    known: frozenset[str]
+    contents: dict[str, bytes]
+
+
+class GitHubArchiveRepoFiles:
+    """Serve ``tree``/``file`` reads from one tarball download per ref.
+
+    ``path_patterns`` use the same exact-path / ``dir/`` prefix rules as
+    :func:`~learn_to_cloud_shared.verification.evidence.select_repo_paths`.
+    ``tree`` raises ``httpx.HTTPStatusError`` and the retriable GitHub errors
+    like the API adapter. ``file`` never raises: a path missing from the
+    archive is ``None``, and a path that exists but was not retained (or an
+    archive that could not be read) goes to ``fallback``.
+    """
+
+    def __init__(
+        self,
+        path_patterns: Iterable[str],
+        *,
+        max_file_size_bytes: int,
+        max_total_bytes: int,
+        fallback: RepoFiles,
+    ) -> None:
+        patterns = [pattern.casefold() for pattern in path_patterns]
+        self._exact = {p for p in patterns if not p.endswith("/")}
+        self._prefixes = tuple(p for p in patterns if p.endswith("/"))
+        self._max_file_size_bytes = max_file_size_bytes
+        self._max_total_bytes = max_total_bytes
+        self._fallback = fallback
+        self._archives: dict[tuple[str, str, str], _Archive] = {}
+        self._unreadable: set[tuple[str, str, str]] = set()
+        self._locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+
+    def _matches(self, path: str) -> bool:
+        normalized = path.casefold()
+        return normalized in self._exact or normalized.startswith(self._prefixes)
+
+    async def resolve_ref(self, owner: str, repo: str, branch: str) -> str:
+        if isinstance(self._fallback, RefResolver):
+            return await self._fallback.resolve_ref(owner, repo, branch)
+        return branch
+
+    async def _archive(self, owner: str, repo: str, ref: str) -> _Archive | None:
+        """Return the ref's archive, or ``None`` if it is not a readable tarball.
+
+        Reads of one ref share its single download; other refs do not wait.
+        """
+        key = (owner, repo, ref)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            if key in self._unreadable:
+                return None
+            archive = self._archives.get(key)
+            if archive is None:
+                try:
+                    archive = await self._download(owner, repo, ref)
+                except (tarfile.TarError, zlib.error):
+                    self._unreadable.add(key)
+                    return None
+                self._archives[key] = archive
+            return archive
+
+    async def _download(self, owner: str, repo: str, ref: str) -> _Archive:
+        budget = self._max_total_bytes
+
+        def keep(path: str, size: int) -> int:
+            nonlocal budget
+            if not self._matches(path):
+                return 0
+            # One byte past the per-file cap lets the evidence cap mark it
+            # truncated exactly as it would for a raw fetch.
+            wanted = min(size, self._max_file_size_bytes + 1)
+            if wanted > budget:
+                return 0
+            budget -= wanted
+            return wanted
+
+        client = await get_github_client()
+        url = f"https://api.github.com/repos/{owner}/{repo}/tarball/{ref}"
+        paths: list[str] = []
+        contents: dict[str, bytes] = {}
+        async with (
+            get_github_token_pool().lease(url) as credential,
+            client.stream(
+                "GET", url, headers=get_github_headers(credential.token)
+            ) as resp,
+        ):
+            credential.observe(resp)
+            raise_for_server_error(resp)
+            resp.raise_for_status()
+            stream = _InflatedStream(resp.aiter_bytes())
+            # Every member sits under one "<owner>-<repo>-<sha>/" directory.
+            async for name, info, content in _iter_tar_members(
+                stream, lambda n, s: keep(n.partition("/")[2], s)
+            ):
+                path = name.partition("/")[2]
+                if not path or not (info.isreg() or info.issym()):
+                    continue
+                paths.append(path)
+                if content is not None:
+                    contents[path] = content
+
+        trace.get_current_span().add_event(
+            "repo_archive_fetched",
+            {
+                "owner": owner,
+                "repo": repo,
+                "archive.files": len(paths),
+                "archive.retained_files": len(contents),
+            },
+        )
+        return _Archive(paths=paths, known=frozenset(paths), contents=contents)
+
+    async def tree(self, owner: str, repo: str, branch: str = "main") -> list[str]:
+        archive = await self._archive(owner, repo, branch)
+        if archive is None:
+            return await self._fallback.tree(owner, repo, branch)
+        return list(archive.paths)
+
+    async def file(
+        self, owner: str, repo: str, path: str, branch: str = "main"
+    ) -> str | None:
+        try:
+            archive = await self._archive(owner, repo, branch)
+        except (httpx.HTTPError, *RETRIABLE_EXCEPTIONS):
+            archive = None
+        if archive is None:
+            return await self._fallback.file(owner, repo, path, branch)
+        if path not in archive.known:
+            return None
+        content = archive.contents.get(path)
+        if content is None:
+            return await self._fallback.file(owner, repo, path, branch)
+        return content.decode("utf-8", errors="replace")
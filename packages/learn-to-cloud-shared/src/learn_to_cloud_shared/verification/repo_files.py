@@ -8,10 +8,15 @@ Two adapters justify the seam: live GitHub in production, an in-memory
 mapping in tests. Graders accept an optional ``RepoFiles`` and fall back to
 :func:`default_repo_files` when none is supplied, so callers that do not
 care about the seam keep working while tests can swap in a fake.
+
+:class:`CachingRepoFiles` wraps either adapter for the length of one
+verification run so gate and review steps share a single fetch of each
+tree and file.
 """
 
 from __future__ import annotations
 
+import asyncio
 from typing import Protocol, runtime_checkable
 
 import httpx
@@ -19,6 +24,7 @@ from opentelemetry import trace
 
 from learn_to_cloud_shared.core.github_client import get_github_client
 from learn_to_cloud_shared.verification.github_http import (
+    RETRIABLE_EXCEPTIONS,
     get_github_headers,
     github_api_get,
 )
@@ -41,9 +47,24 @@ class RepoFiles(Protocol):
     ) -> str | None: ...
 
 
+@runtime_checkable
+class RefResolver(Protocol):
+    """Optional adapter capability: resolve a branch to its HEAD commit sha."""
+
+    async def resolve_ref(self, owner: str, repo: str, branch: str) -> str: ...
+
+
 class GitHubRepoFiles:
     """Production adapter backed by the GitHub HTTP API."""
 
+    async def resolve_ref(self, owner: str, repo: str, branch: str) -> str:
+        """Return the commit sha ``branch`` currently points at."""
+        url = f"https://api.github.com/repos/{owner}/{repo}/commits/{branch}"
+        response = await github_api_get(
+            url, extra_headers={"Accept": "application/vnd.github.sha"}
+        )
+        return response.text.strip()
+
     async def tree(self, owner: str, repo: str, branch: str = "main") -> list[str]:
         """Return every blob path in the repository via the Git Trees API."""
         url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}"
@@ -106,6 +127,86 @@ class InMemoryRepoFiles:
         return self._files.get(path)
 
 
+class CachingRepoFiles:
+    """Memoize another adapter's reads for the length of one verification run.
+
+    Each ``(owner, repo, branch)`` is pinned to its HEAD sha on first use when
+    the wrapped adapter can resolve refs, so every step of a run reads the
+    same commit even if the learner pushes mid-run. Trees and files are then
+    fetched at most once; unreadable files (``None``) are cached too, while a
+    read error is re-raised and not cached. Reads are single-flight, so
+    steps running concurrently share one in-flight fetch. ``hits`` and
+    ``misses`` count cache lookups for telemetry.
+    """
+
+    def __init__(self, inner: RepoFiles) -> None:
+        self._inner = inner
+        self._refs: dict[tuple[str, str, str], asyncio.Future[str]] = {}
+        self._trees: dict[tuple[str, str, str], asyncio.Future[list[str]]] = {}
+        self._files: dict[tuple[str, str, str, str], asyncio.Future[str | None]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve_ref(self, owner: str, repo: str, branch: str) -> str:
+        """Return the sha this run reads ``branch`` at (the branch if unpinned)."""
+        return await self._pinned_ref(owner, repo, branch)
+
+    async def _pinned_ref(self, owner: str, repo: str, branch: str) -> str:
+        key = (owner, repo, branch)
+        pending = self._refs.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._resolve_ref(owner, repo, branch))
+            self._refs[key] = pending
+        return await asyncio.shield(pending)
+
+    async def _resolve_ref(self, owner: str, repo: str, branch: str) -> str:
+        if not isinstance(self._inner, RefResolver):
+            return branch
+        try:
+            return await self._inner.resolve_ref(owner, repo, branch) or branch
+        except (httpx.HTTPStatusError, *RETRIABLE_EXCEPTIONS):
+            # Let the unpinned read surface the error through the callers'
+            # existing handling.
+            return branch
+
+    async def tree(self, owner: str, repo: str, branch: str = "main") -> list[str]:
+        ref = await self._pinned_ref(owner, repo, branch)
+        key = (owner, repo, ref)
+        pending = self._trees.get(key)
+        if pending is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._inner.tree(owner, repo, ref))
+            self._trees[key] = pending
+        try:
+            paths = await asyncio.shield(pending)
+        except Exception:
+            if self._trees.get(key) is pending:
+                del self._trees[key]
+            raise
+        return list(paths)
+
+    async def file(
+        self, owner: str, repo: str, path: str, branch: str = "main"
+    ) -> str | None:
+        ref = await self._pinned_ref(owner, repo, branch)
+        key = (owner, repo, ref, path)
+        pending = self._files.get(key)
+        if pending is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            pending = asyncio.ensure_future(self._inner.file(owner, repo, path, ref))
+            self._files[key] = pending
+        try:
+            return await asyncio.shield(pending)
+        except Exception:
+            if self._files.get(key) is pending:
+                del self._files[key]
+            raise
+
+
 _DEFAULT_REPO_FILES = GitHubRepoFiles()
 
 
@@ -15,6 +15,8 @@ from __future__ import annotations
 
 from typing import Any, Protocol, runtime_checkable
 
+from learn_to_cloud_shared.core.config import get_worker_settings
+from learn_to_cloud_shared.verification.github_graphql import default_graphql_metadata
 from learn_to_cloud_shared.verification.github_http import github_api_get
 
 
@@ -76,5 +78,12 @@ _DEFAULT_REPO_REF = GitHubApiRepoRef()
 
 
 def default_repo_ref() -> RepoRef:
-    """Return the shared production adapter used when no port is injected."""
+    """Return the shared production adapter used when no port is injected.
+
+    With ``github.graphql_metadata`` on and a token configured, this is the batched
+    GraphQL adapter instead of the REST one.
+    """
+    github = get_worker_settings().github
+    if github.graphql_metadata and github.token_list():
+        return default_graphql_metadata()
     return _DEFAULT_REPO_REF
@@ -0,0 +1,139 @@
+"""Memoized verification runs for unchanged resubmissions.
+
+Learners often resubmit a repository without pushing anything new. For a
+profile that opts in (``VerificationProfile.memoize``), :func:`run_profile`
+keys its result on everything the run depends on: the requirement snapshot
+hash, the submitted value, the GitHub username, the repository's resolved
+HEAD sha and the profile ``version``. An identical resubmission is answered
+from the cache instead of re-running every step.
+
+Only profiles whose outcome depends on nothing outside that key opt in;
+gates that read CI runs, package visibility or code-scanning alerts do not.
+Passed and failed runs expire on separate TTLs (failures sooner). Incomplete
+runs are never stored. The in-process TTL cache is the default; a shared
+backend can be installed with :func:`set_verification_result_cache`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Protocol
+
+from cachetools import TLRUCache
+
+from learn_to_cloud_shared.core.config import get_worker_settings
+from learn_to_cloud_shared.verification_attempt_snapshot import (
+    build_requirement_snapshot,
+    compute_snapshot_hash,
+)
+from learn_to_cloud_shared.verification_workflow import (
+    PreparedVerificationAttempt,
+    VerificationRunResult,
+)
+
+
+class VerificationResultCache(Protocol):
+    """Storage for memoized :class:`VerificationRunResult` values."""
+
+    async def get(self, key: str) -> VerificationRunResult | None: ...
+
+    async def set(self, key: str, result: VerificationRunResult) -> None: ...
+
+
+class InMemoryVerificationResultCache:
+    """Bounded per-process cache with separate pass and fail TTLs."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        success_ttl: float,
+        failure_ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        def ttu(_key: str, result: VerificationRunResult, now: float) -> float:
+            valid = result.validation_result.is_valid
+            return now + (success_ttl if valid else failure_ttl)
+
+        self._entries: TLRUCache[str, VerificationRunResult] = TLRUCache(
+            maxsize=maxsize, ttu=ttu, timer=timer
+        )
+
+    async def get(self, key: str) -> VerificationRunResult | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, result: VerificationRunResult) -> None:
+        self._entries[key] = result
+
+
+_result_cache_override: VerificationResultCache | None = None
+
+
+@lru_cache(maxsize=1)
+def _default_result_cache() -> VerificationResultCache | None:
+    config = get_worker_settings().result_cache
+    if config.maxsize == 0:
+        return None
+    return InMemoryVerificationResultCache(
+        config.maxsize,
+        success_ttl=config.success_ttl_seconds,
+        failure_ttl=config.failure_ttl_seconds,
+    )
+
+
+def get_verification_result_cache() -> VerificationResultCache | None:
+    """Return the active result cache, or ``None`` when disabled."""
+    return _result_cache_override or _default_result_cache()
+
+
+def set_verification_result_cache(cache: VerificationResultCache | None) -> None:
+    """Install a shared cache backend; ``None`` restores the default."""
+    global _result_cache_override
+    _result_cache_override = cache
+
+
+def clear_verification_result_cache() -> None:
+    """Drop the override and the default in-process cache (for tests)."""
+    set_verification_result_cache(None)
+    _default_result_cache.cache_clear()
+
+
+def result_cache_key(
+    job: PreparedVerificationAttempt,
+    *,
+    head_sha: str | None,
+    profile_version: int,
+) -> str:
+    """Digest of everything a memoizable run's outcome depends on."""
+    snapshot_hash = compute_snapshot_hash(build_requirement_snapshot(job.requirement))
+    parts = [
+        snapshot_hash,
+        job.submitted_value.as_text,
+        job.github_username,
+        head_sha,
+        profile_version,
+    ]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def rebind_result(
+    result: VerificationRunResult, job: PreparedVerificationAttempt
+) -> VerificationRunResult:
+    """Re-home a memoized run onto ``job``, including its grading threads."""
+    grading_requests = result.grading_requests
+    if grading_requests:
+        grading_requests = [
+            request.model_copy(update={"thread_id": f"{job.id}-{request.task.id}"})
+            for request in grading_requests
+        ]
+    return VerificationRunResult(
+        attempt=job,
+        validation_result=result.validation_result,
+        evidence=result.evidence,
+        grading_requests=grading_requests,
+        grading_disposition=result.grading_disposition,
+    )
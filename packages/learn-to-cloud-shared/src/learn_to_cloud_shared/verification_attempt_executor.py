@@ -17,6 +17,10 @@ Trust boundary and idempotency:
 3. :func:`terminalize_verification_attempt` is the authoritative failure path
    (orchestrator/activity exception, or the stale-attempt reconciler): it
    compare-and-sets a ``server_error`` / ``cancelled`` outcome.
+
+:func:`run_verification_attempt_inline` chains the same three steps in-process
+for profiles marked ``inline`` (local token checks), so the API can verify
+them in the submit request without a Durable orchestration.
 """
 
 from __future__ import annotations
@@ -36,6 +40,7 @@ from learn_to_cloud_shared.submission_values import (
     SubmittedValue,
     value_kind_for_submission_type,
 )
+from learn_to_cloud_shared.verification.engine import run_profile
 from learn_to_cloud_shared.verification.execution import (
     persisted_validation_message,
 )
@@ -55,6 +60,8 @@ tracer = trace.get_tracer(__name__)
 
 _SNAPSHOT_SOURCE_SUBMITTED = "submitted"
 _ORCHESTRATOR_TERMINAL_SOURCE = "orchestrator"
+_INLINE_TERMINAL_SOURCE = "inline"
+_INLINE_EXCEPTION_TERMINAL_SOURCE = "inline_exception"
 
 
 class AttemptPreparationError(Exception):
@@ -162,6 +169,7 @@ async def finalize_verification_attempt(
     run_result: VerificationRunResult,
     *,
     session_maker: async_sessionmaker[AsyncSession],
+    terminal_source: str = _ORCHESTRATOR_TERMINAL_SOURCE,
 ) -> AttemptTerminalState:
     """Persist an attempt's real verification outcome via compare-and-set."""
     run_result = run_result.without_transport_data()
@@ -186,7 +194,7 @@ async def finalize_verification_attempt(
         outcome=VerificationAttemptOutcome(outcome),
         error_code=error_code,
         validation_message=validation_message,
-        terminal_source=_ORCHESTRATOR_TERMINAL_SOURCE,
+        terminal_source=terminal_source,
         feedback_json=feedback_json,
     )
 
@@ -221,6 +229,46 @@ async def terminalize_verification_attempt(
     )
 
 
+async def run_verification_attempt_inline(
+    attempt_id: UUID,
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AttemptTerminalState:
+    """Prepare, verify, and finalize an attempt in the calling process.
+
+    Only for profiles marked ``inline``: they make no network calls and need
+    no grading, so the run takes microseconds. The attempt goes through the
+    same trust checks and compare-and-set finalize as the orchestrated path,
+    so its audit trail is identical apart from ``terminal_source``. A failure
+    before finalize terminalizes the attempt as ``server_error``, as the
+    orchestrator would.
+    """
+    with tracer.start_as_current_span(
+        "run_verification_attempt_inline",
+        attributes={"verification.attempt.id": str(attempt_id)},
+    ) as span:
+        try:
+            preparation = await prepare_verification_attempt(
+                attempt_id, session_maker=session_maker
+            )
+            run_result = await run_profile(preparation.attempt)
+        except Exception as exc:
+            span.record_exception(exc)
+            return await terminalize_verification_attempt(
+                attempt_id,
+                outcome=VerificationAttemptOutcome.SERVER_ERROR,
+                error_code="server_error",
+                validation_message="Verification could not be completed.",
+                terminal_source=_INLINE_EXCEPTION_TERMINAL_SOURCE,
+                session_maker=session_maker,
+            )
+        return await finalize_verification_attempt(
+            run_result,
+            session_maker=session_maker,
+            terminal_source=_INLINE_TERMINAL_SOURCE,
+        )
+
+
 async def _finalize(
     attempt_id: UUID,
     *,
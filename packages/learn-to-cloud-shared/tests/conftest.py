@@ -41,6 +41,9 @@ from learn_to_cloud_shared.core.config import (
     WebSettings,
 )
 from learn_to_cloud_shared.core.database import Base
+from learn_to_cloud_shared.verification.result_cache import (
+    clear_verification_result_cache,
+)
 
 
 def _build_test_database_url() -> tuple[str, str, int]:
@@ -167,6 +170,14 @@ def _quote_table_name(name: str) -> str:
     return ".".join(f'"{part}"' for part in name.split("."))
 
 
+@pytest.fixture(autouse=True)
+def _fresh_verification_result_cache():
+    """Keep memoized verification runs from leaking between tests."""
+    clear_verification_result_cache()
+    yield
+    clear_verification_result_cache()
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def cleanup_database(request: pytest.FixtureRequest):
     """Truncate tables after integration tests."""
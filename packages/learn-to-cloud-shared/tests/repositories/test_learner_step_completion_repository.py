@@ -89,6 +89,94 @@ class TestDelete:
         assert deleted == 0
 
 
+class TestCreateManyReturningCompleted:
+    async def test_inserts_and_returns_completed_candidates(
+        self, db_session: AsyncSession, user
+    ):
+        existing, new, untouched = uuid4(), uuid4(), uuid4()
+        repo = LearnerStepCompletionRepository(db_session)
+        await repo.create_if_not_exists(user_id=USER_ID, step_uuid=existing)
+        await db_session.flush()
+
+        write = await repo.create_many_returning_completed(
+            user_id=USER_ID,
+            step_uuids=[existing, new, new],
+            candidate_step_uuids=[existing, new, untouched],
+        )
+
+        assert write.changed == {new}
+        assert write.completed == {existing, new}
+        assert await repo.get_completed_step_uuids(
+            USER_ID, [existing, new, untouched]
+        ) == {existing, new}
+
+    async def test_completed_set_is_scoped_to_candidates(
+        self, db_session: AsyncSession, user
+    ):
+        outside, inside = uuid4(), uuid4()
+        repo = LearnerStepCompletionRepository(db_session)
+        await repo.create_if_not_exists(user_id=USER_ID, step_uuid=outside)
+        await db_session.flush()
+
+        write = await repo.create_many_returning_completed(
+            user_id=USER_ID, step_uuids=[inside], candidate_step_uuids=[inside]
+        )
+
+        assert write.completed == {inside}
+
+    async def test_empty_input_only_reads(self, db_session: AsyncSession, user):
+        step_uuid = uuid4()
+        repo = LearnerStepCompletionRepository(db_session)
+        await repo.create_if_not_exists(user_id=USER_ID, step_uuid=step_uuid)
+        await db_session.flush()
+
+        write = await repo.create_many_returning_completed(
+            user_id=USER_ID, step_uuids=[], candidate_step_uuids=[step_uuid]
+        )
+
+        assert write.changed == set()
+        assert write.completed == {step_uuid}
+
+
+class TestDeleteManyReturningCompleted:
+    async def test_deletes_and_returns_remaining_candidates(
+        self, db_session: AsyncSession, user
+    ):
+        step_a, step_b, step_c = uuid4(), uuid4(), uuid4()
+        repo = LearnerStepCompletionRepository(db_session)
+        await repo.create_many_returning_completed(
+            user_id=USER_ID,
+            step_uuids=[step_a, step_b, step_c],
+            candidate_step_uuids=[],
+        )
+        await db_session.flush()
+
+        write = await repo.delete_many_returning_completed(
+            user_id=USER_ID,
+            step_uuids=[step_a, step_b],
+            candidate_step_uuids=[step_a, step_b, step_c],
+        )
+
+        assert write.changed == {step_a, step_b}
+        assert write.completed == {step_c}
+        assert await repo.get_completed_step_uuids(
+            USER_ID, [step_a, step_b, step_c]
+        ) == {step_c}
+
+    async def test_missing_rows_are_not_reported_changed(
+        self, db_session: AsyncSession, user
+    ):
+        repo = LearnerStepCompletionRepository(db_session)
+        step_uuid = uuid4()
+
+        write = await repo.delete_many_returning_completed(
+            user_id=USER_ID, step_uuids=[step_uuid], candidate_step_uuids=[step_uuid]
+        )
+
+        assert write.changed == set()
+        assert write.completed == set()
+
+
 class TestGetCompletedStepUuids:
     async def test_returns_only_completed_and_requested(
         self, db_session: AsyncSession, user
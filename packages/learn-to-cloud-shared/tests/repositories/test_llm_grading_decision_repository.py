@@ -0,0 +1,54 @@
+"""Integration tests for cached LLM grading decisions."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from learn_to_cloud_shared.models import utcnow
+from learn_to_cloud_shared.repositories.llm_grading_decision_repository import (
+    LLMGradingDecisionRepository,
+)
+
+pytestmark = pytest.mark.integration
+
+
+async def _store(repo, cache_key: str, *, expires_in: timedelta, passed=True):
+    await repo.upsert(
+        cache_key=cache_key,
+        task_id="journal-api-final-rubric",
+        rubric_hash="rubric",
+        model_deployment="gpt",
+        decision={"passed": passed},
+        expires_at=utcnow() + expires_in,
+    )
+
+
+class TestLLMGradingDecisionRepository:
+    async def test_returns_unexpired_decision(self, db_session: AsyncSession):
+        repo = LLMGradingDecisionRepository(db_session)
+        await _store(repo, "live", expires_in=timedelta(hours=1))
+
+        assert await repo.get_unexpired("live") == {"passed": True}
+        assert await repo.get_unexpired("missing") is None
+
+    async def test_expired_decision_is_ignored(self, db_session: AsyncSession):
+        repo = LLMGradingDecisionRepository(db_session)
+        await _store(repo, "stale", expires_in=timedelta(seconds=-1))
+
+        assert await repo.get_unexpired("stale") is None
+
+    async def test_upsert_replaces_existing_decision(self, db_session: AsyncSession):
+        repo = LLMGradingDecisionRepository(db_session)
+        await _store(repo, "key", expires_in=timedelta(seconds=-1))
+        await _store(repo, "key", expires_in=timedelta(hours=1), passed=False)
+
+        assert await repo.get_unexpired("key") == {"passed": False}
+
+    async def test_delete_expired_keeps_live_rows(self, db_session: AsyncSession):
+        repo = LLMGradingDecisionRepository(db_session)
+        await _store(repo, "live", expires_in=timedelta(hours=1))
+        await _store(repo, "stale", expires_in=timedelta(seconds=-1))
+
+        assert await repo.delete_expired() == 1
+        assert await repo.get_unexpired("live") == {"passed": True}
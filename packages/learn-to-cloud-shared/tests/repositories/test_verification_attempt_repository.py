@@ -7,7 +7,7 @@ from datetime import timedelta
 from uuid import UUID, uuid4
 
 import pytest
-from sqlalchemy import func, select
+from sqlalchemy import event, func, select, text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from learn_to_cloud_shared.models import (
@@ -20,6 +20,7 @@ from learn_to_cloud_shared.repositories.user_repository import UserRepository
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     AttemptAlreadyValidatedError,
     VerificationAttemptRepository,
+    _latest_terminal_cards_query,
 )
 from learn_to_cloud_shared.submission_values import SubmittedValue
 
@@ -133,6 +134,53 @@ async def test_finalize_is_compare_and_set(
     assert second.state.terminal_source == "orchestrator"
 
 
+async def test_finalize_writes_feedback_only_when_it_wins(
+    session_maker: async_sessionmaker[AsyncSession], user: int
+) -> None:
+    req = uuid4()
+    attempt_id = await _insert_attempt(session_maker, requirement_uuid=req)
+    for feedback in ([{"task": "a"}], [{"task": "late"}]):
+        async with session_maker() as db:
+            await VerificationAttemptRepository(db).finalize(
+                attempt_id,
+                outcome=VerificationAttemptOutcome.FAILED,
+                error_code="verification_failed",
+                validation_message="no",
+                terminal_source="orchestrator",
+                feedback_json=feedback,
+            )
+            await db.commit()
+
+    async with session_maker() as db:
+        [card] = await VerificationAttemptRepository(
+            db
+        ).get_latest_terminal_for_requirements(USER_ID, [req])
+    assert card.feedback_json == [{"task": "a"}]
+
+
+async def test_finalize_keeps_feedback_readable_by_the_previous_release(
+    session_maker: async_sessionmaker[AsyncSession], user: int
+) -> None:
+    attempt_id = await _insert_attempt(session_maker)
+    async with session_maker() as db:
+        await VerificationAttemptRepository(db).finalize(
+            attempt_id,
+            outcome=VerificationAttemptOutcome.FAILED,
+            error_code="verification_failed",
+            validation_message="no",
+            terminal_source="orchestrator",
+            feedback_json=[{"task": "a"}],
+        )
+        await db.commit()
+
+    async with session_maker() as db:
+        inline = await db.scalar(
+            text("SELECT feedback_json FROM verification_attempts WHERE id = :id"),
+            {"id": attempt_id},
+        )
+    assert inline == [{"task": "a"}]
+
+
 async def test_get_prepare_state_and_status(
     session_maker: async_sessionmaker[AsyncSession], user: int
 ) -> None:
@@ -209,6 +257,19 @@ async def test_list_active_older_than_uses_started_at_when_present(
     assert attempt_id not in {row.id for row in rows}
 
 
+async def test_count_active_ignores_terminal_attempts(
+    session_maker: async_sessionmaker[AsyncSession], user: int
+) -> None:
+    async with session_maker() as db:
+        before = await VerificationAttemptRepository(db).count_active()
+    await _insert_attempt(session_maker)
+    await _insert_attempt(session_maker)
+    await _insert_attempt(session_maker, outcome="succeeded")
+
+    async with session_maker() as db:
+        assert await VerificationAttemptRepository(db).count_active() == before + 2
+
+
 def _create_kwargs(
     *,
     id: UUID,
@@ -257,6 +318,45 @@ async def test_create_or_get_active_creates_new_attempt(
     assert attempt.snapshot_source == "submitted"
     assert attempt.submitted_value == "https://github.com/attemptrepo/repo"
 
+    async with session_maker() as db:
+        prepare = await VerificationAttemptRepository(db).get_prepare_state(attempt_id)
+        legacy_snapshot = await db.scalar(
+            select(VerificationAttempt.legacy_requirement_snapshot).where(
+                VerificationAttempt.id == attempt_id
+            )
+        )
+    assert prepare is not None
+    assert prepare.requirement_snapshot == {"slug": "test-requirement"}
+    assert legacy_snapshot is None
+
+
+async def test_create_or_get_active_creates_in_one_statement(
+    session_maker: async_sessionmaker[AsyncSession],
+    test_engine: AsyncEngine,
+    user: int,
+) -> None:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with session_maker() as db:
+            _, created = await VerificationAttemptRepository(db).create_or_get_active(
+                **_create_kwargs(
+                    id=uuid4(),
+                    requirement_uuid=uuid4(),
+                    submitted_value=_submitted_value(),
+                )
+            )
+            await db.commit()
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert created is True
+    assert len(statements) == 1
+
 
 async def test_create_or_get_active_returns_existing_active_attempt(
     session_maker: async_sessionmaker[AsyncSession], user: int
@@ -326,14 +426,72 @@ async def test_create_or_get_active_raises_for_succeeded_attempt(
             )
 
 
+async def test_create_or_get_active_rejects_submit_racing_a_success(
+    session_maker: async_sessionmaker[AsyncSession], user: int
+) -> None:
+    """A submit whose insert waits on an active attempt that is being
+    finalized to succeeded must not leave a new active attempt behind once
+    that finalize commits."""
+    requirement_uuid = uuid4()
+    active_id = await _insert_attempt(session_maker, requirement_uuid=requirement_uuid)
+    racing_id = uuid4()
+
+    async def _submit() -> None:
+        async with session_maker() as db:
+            await VerificationAttemptRepository(db).create_or_get_active(
+                **_create_kwargs(
+                    id=racing_id,
+                    requirement_uuid=requirement_uuid,
+                    submitted_value=_submitted_value(),
+                )
+            )
+            await db.commit()
+
+    async with session_maker() as finalizer:
+        await VerificationAttemptRepository(finalizer).finalize(
+            active_id,
+            outcome=VerificationAttemptOutcome.SUCCEEDED,
+            error_code="verification_succeeded",
+            validation_message=None,
+            terminal_source="orchestrator",
+            feedback_json=None,
+        )
+        submit = asyncio.create_task(_submit())
+        # Hold the finalize open until the submit's insert is blocked on it.
+        async with session_maker() as probe:
+            for _ in range(200):
+                waiting = await probe.scalar(
+                    text(
+                        "SELECT count(*) FROM pg_stat_activity "
+                        "WHERE wait_event_type = 'Lock' "
+                        "AND datname = current_database()"
+                    )
+                )
+                if waiting or submit.done():
+                    break
+                await asyncio.sleep(0.01)
+        assert not submit.done()
+        await finalizer.commit()
+
+    with pytest.raises(AttemptAlreadyValidatedError):
+        await submit
+
+    async with session_maker() as db:
+        leftover = await db.scalar(
+            select(func.count())
+            .select_from(VerificationAttempt)
+            .where(VerificationAttempt.id == racing_id)
+        )
+    assert leftover == 0
+
+
 async def test_create_or_get_active_serializes_concurrent_submits(
     session_maker: async_sessionmaker[AsyncSession], user: int
 ) -> None:
     """Two concurrent submits for the same (user, requirement) must not
-    both create an active attempt. The transaction-scoped advisory lock in
-    ``create_or_get_active`` serializes them: the second caller blocks until
-    the first commits, then sees the first's row under the lock and reuses
-    it instead of creating a second active attempt."""
+    both create an active attempt. The active-attempt partial unique index
+    makes the second insert wait on the first and then do nothing; the
+    second caller re-reads and reuses the first's row."""
     requirement_uuid = uuid4()
 
     async def _submit(value: str) -> tuple[UUID, bool]:
@@ -369,6 +527,47 @@ async def test_create_or_get_active_serializes_concurrent_submits(
     assert count == 1
 
 
+async def test_create_or_get_active_stress_parallel_submits(
+    session_maker: async_sessionmaker[AsyncSession], user: int
+) -> None:
+    """Many parallel submits, each holding its transaction open briefly
+    after the write, still converge on exactly one active attempt."""
+    requirement_uuid = uuid4()
+    submit_count = 16
+
+    async def _submit(index: int) -> tuple[UUID, bool]:
+        async with session_maker() as db:
+            attempt, created = await VerificationAttemptRepository(
+                db
+            ).create_or_get_active(
+                **_create_kwargs(
+                    id=uuid4(),
+                    requirement_uuid=requirement_uuid,
+                    submitted_value=_submitted_value(
+                        f"https://github.com/attemptrepo/repo-{index}"
+                    ),
+                )
+            )
+            # Widen the window in which losers must wait on the winner's
+            # uncommitted row.
+            await asyncio.sleep(0.01)
+            await db.commit()
+        return attempt.id, created
+
+    results = await asyncio.gather(*(_submit(i) for i in range(submit_count)))
+
+    assert [created for _, created in results].count(True) == 1
+    assert len({attempt_id for attempt_id, _ in results}) == 1
+
+    async with session_maker() as db:
+        count = await db.scalar(
+            select(func.count())
+            .select_from(VerificationAttempt)
+            .where(VerificationAttempt.requirement_uuid == requirement_uuid)
+        )
+    assert count == 1
+
+
 async def test_delete_active_removes_non_terminal_attempt(
     session_maker: async_sessionmaker[AsyncSession], user: int
 ) -> None:
@@ -495,6 +694,50 @@ async def test_are_all_requirements_succeeded_empty_list_is_true(
         )
 
 
+async def test_get_submission_gate_answers_all_checks_in_one_read(
+    session_maker: async_sessionmaker[AsyncSession], user: int
+) -> None:
+    requirement = uuid4()
+    prereq_done, prereq_missing = uuid4(), uuid4()
+    active_id = await _insert_attempt(session_maker, requirement_uuid=requirement)
+    await _insert_attempt(
+        session_maker, requirement_uuid=prereq_done, outcome="succeeded"
+    )
+    await _insert_attempt(
+        session_maker, requirement_uuid=prereq_missing, outcome="failed"
+    )
+
+    async with session_maker() as db:
+        repo = VerificationAttemptRepository(db)
+        blocked = await repo.get_submission_gate(
+            USER_ID, requirement, [prereq_done, prereq_missing]
+        )
+        unblocked = await repo.get_submission_gate(USER_ID, requirement, [prereq_done])
+
+    assert blocked.already_succeeded is False
+    assert blocked.active_attempt_id == active_id
+    assert blocked.prerequisites_met is False
+    assert unblocked.prerequisites_met is True
+
+
+async def test_get_submission_gate_reports_already_succeeded(
+    session_maker: async_sessionmaker[AsyncSession], user: int
+) -> None:
+    requirement = uuid4()
+    await _insert_attempt(
+        session_maker, requirement_uuid=requirement, outcome="succeeded"
+    )
+
+    async with session_maker() as db:
+        gate = await VerificationAttemptRepository(db).get_submission_gate(
+            USER_ID, requirement
+        )
+
+    assert gate.already_succeeded is True
+    assert gate.active_attempt_id is None
+    assert gate.prerequisites_met is True
+
+
 async def test_get_active_for_requirements_excludes_terminal(
     session_maker: async_sessionmaker[AsyncSession], user: int
 ) -> None:
@@ -543,6 +786,63 @@ async def test_get_latest_terminal_for_requirements_returns_newest_and_skips_act
     assert rows[0].outcome == "succeeded"
 
 
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def test_get_latest_terminal_for_requirements_probes_one_row_per_requirement(
+    test_engine: AsyncEngine,
+    session_maker: async_sessionmaker[AsyncSession],
+    user: int,
+) -> None:
+    reqs = [uuid4() for _ in range(3)]
+    now = utcnow()
+    async with session_maker() as db:
+        db.add_all(
+            VerificationAttempt(
+                user_id=USER_ID,
+                requirement_uuid=req,
+                snapshot_source="reconstructed",
+                submission_value_kind="github_url",
+                submitted_value="https://github.com/attemptrepo/repo",
+                outcome="failed",
+                completed_at=now,
+                created_at=now - timedelta(minutes=retry),
+            )
+            for req in reqs
+            for retry in range(200)
+        )
+        await db.commit()
+    # Settle the visibility map as autovacuum would, so the planner can
+    # answer each probe from the covering index alone.
+    async with test_engine.connect() as conn:
+        autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await autocommit.execute(text("VACUUM ANALYZE verification_attempts"))
+
+    async with session_maker() as db:
+        conn = await db.connection()
+        compiled = _latest_terminal_cards_query(USER_ID, reqs).compile(
+            dialect=conn.dialect
+        )
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, FORMAT JSON) {compiled.string}",
+            tuple(compiled.params[name] for name in compiled.positiontup or ()),
+        )
+        [explained] = result.scalar_one()
+
+    probes = [
+        node
+        for node in _plan_nodes(explained["Plan"])
+        if node.get("Index Name") == "ix_verification_attempts_terminal_latest"
+    ]
+    assert len(probes) == 1
+    assert probes[0]["Node Type"] == "Index Only Scan"
+    assert probes[0]["Actual Loops"] == len(reqs)
+    assert probes[0]["Actual Rows"] == 1
+
+
 async def test_get_latest_terminal_for_requirements_empty_input(
     session_maker: async_sessionmaker[AsyncSession], user: int
 ) -> None:
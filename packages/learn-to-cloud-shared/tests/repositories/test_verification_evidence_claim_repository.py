@@ -0,0 +1,64 @@
+"""Integration tests for claim-checked verification transport data."""
+
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from learn_to_cloud_shared.models import User, VerificationAttempt, utcnow
+from learn_to_cloud_shared.repositories.verification_evidence_claim_repository import (
+    EvidenceClaim,
+    VerificationEvidenceClaimRepository,
+)
+
+pytestmark = pytest.mark.integration
+
+USER_ID = 85001
+
+
+async def _attempt(db: AsyncSession, *, completed: bool = False) -> UUID:
+    if await db.get(User, USER_ID) is None:
+        db.add(User(id=USER_ID, github_username="claimrepo"))
+    attempt = VerificationAttempt(
+        id=uuid4(),
+        user_id=USER_ID,
+        requirement_uuid=uuid4(),
+        snapshot_source="reconstructed",
+        submission_value_kind="github_url",
+        submitted_value="https://github.com/claimrepo/repo",
+        outcome="succeeded" if completed else None,
+        completed_at=utcnow() if completed else None,
+    )
+    db.add(attempt)
+    await db.flush()
+    return attempt.id
+
+
+def _claim(content_hash: str, payload: dict) -> EvidenceClaim:
+    return EvidenceClaim(content_hash=content_hash, kind="evidence", payload=payload)
+
+
+class TestVerificationEvidenceClaimRepository:
+    async def test_put_many_is_idempotent_per_hash(self, db_session: AsyncSession):
+        repo = VerificationEvidenceClaimRepository(db_session)
+        attempt_id = await _attempt(db_session)
+
+        await repo.put_many(attempt_id, [_claim("a", {"n": 1}), _claim("a", {"n": 1})])
+        await repo.put_many(attempt_id, [_claim("a", {"n": 2})])
+
+        assert await repo.get(attempt_id, "a") == {"n": 1}
+        assert await repo.get(attempt_id, "missing") is None
+        assert await repo.get(uuid4(), "a") is None
+
+    async def test_delete_for_completed_attempts_keeps_active_claims(
+        self, db_session: AsyncSession
+    ):
+        repo = VerificationEvidenceClaimRepository(db_session)
+        active_id = await _attempt(db_session)
+        completed_id = await _attempt(db_session, completed=True)
+        await repo.put_many(active_id, [_claim("a", {"n": 1})])
+        await repo.put_many(completed_id, [_claim("a", {"n": 1})])
+
+        assert await repo.delete_for_completed_attempts() == 1
+        assert await repo.get(active_id, "a") == {"n": 1}
+        assert await repo.get(completed_id, "a") is None
@@ -9,6 +9,7 @@ from learn_to_cloud_shared.requirements import (
     get_prerequisite_phase,
     get_requirement_by_slug,
     is_phase_verification_locked,
+    load_requirement_index,
 )
 from learn_to_cloud_shared.schemas import HandsOnRequirement
 from learn_to_cloud_shared.testing.requirement_factories import (
@@ -16,6 +17,14 @@ from learn_to_cloud_shared.testing.requirement_factories import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_requirement_index():
+    """Tests patch the catalog lookup, so drop the process-wide index."""
+    load_requirement_index.cache_clear()
+    yield
+    load_requirement_index.cache_clear()
+
+
 def _make_requirement(slug: str = "req-1") -> HandsOnRequirement:
     return journal_api_verifier_requirement(
         slug=slug,
@@ -77,6 +86,25 @@ class TestRequirementIndex:
         assert index.requirements_for_phase(99) == []
         assert index.requirement_slugs_for_phase(99) == []
 
+    def test_gate_for_phase_resolves_prerequisite_requirements(self):
+        by_phase_order = _make_requirements_by_phase_order(3, ["req-a", "req-b"])
+        by_phase_order.update(_make_requirements_by_phase_order(4, ["req-c"]))
+
+        index = RequirementIndex.from_requirements_by_phase_order(by_phase_order)
+
+        gate = index.gate_for_phase(4)
+        assert gate is not None
+        assert gate.prerequisite_phase == 3
+        assert gate.requirement_uuids == tuple(req.uuid for req in by_phase_order[3])
+        assert index.gate_for_phase(5) is not None
+        assert index.gate_for_phase(3) is None
+
+    def test_gate_for_phase_is_none_when_prerequisite_has_no_requirements(self):
+        index = RequirementIndex.from_requirements_by_phase_order(
+            _make_requirements_by_phase_order(4, ["req-c"])
+        )
+        assert index.gate_for_phase(4) is None
+
 
 @pytest.mark.unit
 class TestSyncRequirementLookups:
@@ -97,6 +125,17 @@ class TestSyncRequirementLookups:
         ):
             assert get_requirement_by_slug("nonexistent") is None
 
+    def test_index_is_built_once_per_process(self):
+        by_phase_order = _make_requirements_by_phase_order(3, ["req-a"])
+        with patch(
+            "learn_to_cloud_shared.requirements.get_requirements_by_phase_order",
+            return_value=by_phase_order,
+        ) as get_requirements:
+            first = load_requirement_index()
+            assert get_requirement_by_slug("req-a") is not None
+            assert load_requirement_index() is first
+        get_requirements.assert_called_once_with()
+
 
 @pytest.mark.unit
 class TestIsPhaseVerificationLocked:
@@ -6,7 +6,13 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from learn_to_cloud_shared.content_catalog import get_curriculum_catalog
-from learn_to_cloud_shared.models import SubmissionValueKind, User, VerificationAttempt
+from learn_to_cloud_shared.models import (
+    SubmissionType,
+    SubmissionValueKind,
+    User,
+    VerificationAttempt,
+    VerificationAttemptPayload,
+)
 from learn_to_cloud_shared.repositories.verification_attempt_repository import (
     VerificationAttemptRepository,
 )
@@ -16,6 +22,7 @@ from learn_to_cloud_shared.verification_attempt_executor import (
     AttemptNotRunnableError,
     finalize_verification_attempt,
     prepare_verification_attempt,
+    run_verification_attempt_inline,
     terminalize_verification_attempt,
 )
 from learn_to_cloud_shared.verification_attempt_snapshot import (
@@ -38,16 +45,22 @@ def session_maker(test_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     )
 
 
-def _requirement():
-    return next(iter(get_curriculum_catalog().requirements_by_uuid.values()))
+def _requirement(submission_type: SubmissionType | None = None):
+    requirements = get_curriculum_catalog().requirements_by_uuid.values()
+    return next(
+        requirement
+        for requirement in requirements
+        if submission_type is None or requirement.submission_type == submission_type
+    )
 
 
 async def _create_attempt(
     session_maker: async_sessionmaker[AsyncSession],
     *,
     reconstructed: bool = False,
+    submission_type: SubmissionType | None = None,
 ) -> VerificationAttempt:
-    requirement = _requirement()
+    requirement = _requirement(submission_type)
     value_kind = value_kind_for_submission_type(requirement.submission_type)
     submitted_value = {
         SubmissionValueKind.GITHUB_URL: "https://github.com/octocat/repo",
@@ -63,7 +76,6 @@ async def _create_attempt(
         artifact_schema_version=None if reconstructed else 1,
         curriculum_version=None if reconstructed else 1,
         content_hash=None if reconstructed else "content",
-        requirement_snapshot=None if reconstructed else snapshot,
         requirement_snapshot_hash=(
             None if reconstructed else compute_snapshot_hash(snapshot)
         ),
@@ -77,6 +89,12 @@ async def _create_attempt(
         if await db.get(User, 82001) is None:
             db.add(User(id=82001, github_username="octocat"))
         db.add(attempt)
+        if not reconstructed:
+            db.add(
+                VerificationAttemptPayload(
+                    attempt_id=attempt.id, requirement_snapshot=snapshot
+                )
+            )
         await db.commit()
     return attempt
 
@@ -148,3 +166,34 @@ async def test_terminalize_records_cancelled_outcome(
 
     assert state.outcome == "cancelled"
     assert state.error_code == "cancelled"
+
+
+async def test_inline_run_finalizes_token_attempt(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    attempt = await _create_attempt(
+        session_maker, submission_type=SubmissionType.CTF_TOKEN
+    )
+
+    state = await run_verification_attempt_inline(
+        attempt.id, session_maker=session_maker
+    )
+
+    assert state.outcome == "failed"
+    assert state.terminal_source == "inline"
+    assert state.completed_at is not None
+
+
+async def test_inline_run_terminalizes_unrunnable_attempt(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    attempt = await _create_attempt(
+        session_maker, reconstructed=True, submission_type=SubmissionType.CTF_TOKEN
+    )
+
+    state = await run_verification_attempt_inline(
+        attempt.id, session_maker=session_maker
+    )
+
+    assert state.outcome == "server_error"
+    assert state.terminal_source == "inline_exception"
@@ -85,6 +85,7 @@ def _grading_request():
         task=JOURNAL_API_FINAL_RUBRIC_TASK,
         message="grade this",
         thread_id="job-task",
+        evidence_hashes=[("app/main.py", "a" * 64)],
     )
 
 
@@ -2,19 +2,22 @@
 
 Covers the module-specific logic that isn't exercised by integration tests:
 - Azure credential locking and singleton behavior
-- Azure token acquisition (get_token delegates to SDK)
+- Azure token acquisition (get_token caches and refreshes ahead of expiry)
 - Credential shutdown cleanup (close_credential)
 - Pool checkout event (transaction state cleanup + safety net)
 - Health check timeout behavior
+- Pool warm-up (connections left idle, optional statement preparation)
+- JSON codecs (JSONB round-trips under every ``json_codec`` option)
 - get_db / get_db_readonly commit/rollback semantics
 """
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from learn_to_cloud_shared.core.config import DatabaseConfig
+from learn_to_cloud_shared.core.config import DatabaseConfig, JsonCodec
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -75,6 +78,7 @@ class TestAzureGetToken:
         """get_token should return the token string from credential.get_token."""
         fake_token = MagicMock()
         fake_token.token = "test-token-123"
+        fake_token.expires_on = time.time() + 3600
 
         fake_credential = AsyncMock()
         fake_credential.get_token = AsyncMock(return_value=fake_token)
@@ -92,6 +96,70 @@ class TestAzureGetToken:
         assert token == "test-token-123"
         fake_credential.get_token.assert_awaited_once()
 
+    async def test_concurrent_callers_share_one_acquisition(self):
+        """Cold callers wait on one IMDS call, then reuse the cached token."""
+        from learn_to_cloud_shared.core.azure_auth import get_token
+
+        fake_credential = _credential_returning(("token-1", 3600))
+
+        with patch(
+            "learn_to_cloud_shared.core.azure_auth.ManagedIdentityCredential",
+            autospec=True,
+            return_value=fake_credential,
+        ):
+            tokens = await asyncio.gather(get_token(), get_token(), get_token())
+            cached = await get_token()
+
+        assert tokens == ["token-1"] * 3
+        assert cached == "token-1"
+        fake_credential.get_token.assert_awaited_once()
+
+    async def test_token_near_expiry_is_refreshed_in_background(self):
+        """A token due for refresh is still returned while a new one is fetched."""
+        import learn_to_cloud_shared.core.azure_auth as auth_mod
+
+        fake_credential = _credential_returning(("token-1", 60), ("token-2", 3600))
+
+        with patch(
+            "learn_to_cloud_shared.core.azure_auth.ManagedIdentityCredential",
+            autospec=True,
+            return_value=fake_credential,
+        ):
+            first = await auth_mod.get_token()
+            second = await auth_mod.get_token()
+            await asyncio.gather(*auth_mod._refreshes.values())
+            third = await auth_mod.get_token()
+
+        assert (first, second, third) == ("token-1", "token-1", "token-2")
+        assert fake_credential.get_token.await_count == 2
+
+    async def test_expired_token_waits_for_a_new_one(self):
+        """A token inside the expiry margin is never handed out."""
+        from learn_to_cloud_shared.core.azure_auth import get_token
+
+        fake_credential = _credential_returning(("token-1", 5), ("token-2", 3600))
+
+        with patch(
+            "learn_to_cloud_shared.core.azure_auth.ManagedIdentityCredential",
+            autospec=True,
+            return_value=fake_credential,
+        ):
+            assert await get_token() == "token-1"
+            assert await get_token() == "token-2"
+
+
+def _credential_returning(*tokens: tuple[str, int]) -> AsyncMock:
+    """Build a credential whose get_token yields ``(token, ttl_seconds)`` pairs."""
+    fake_credential = AsyncMock()
+    fake_credential.get_token = AsyncMock(
+        side_effect=[
+            MagicMock(token=token, expires_on=time.time() + ttl)
+            for token, ttl in tokens
+        ]
+    )
+    fake_credential.close = AsyncMock()
+    return fake_credential
+
 
 # ===========================================================================
 # Credential shutdown cleanup
@@ -192,6 +260,121 @@ class TestCheckDbConnection:
         mock_conn.rollback.assert_awaited_once()
 
 
+# ===========================================================================
+# Pool warm-up
+# ===========================================================================
+
+
+class TestWarmPool:
+    """Verify warm_pool leaves pool_size connections idle in the pool."""
+
+    @pytest.mark.integration
+    async def test_connections_are_left_idle_and_prepared(self, test_engine):
+        from sqlalchemy import text
+
+        from learn_to_cloud_shared.core.database import create_engine, warm_pool
+
+        settings = DatabaseConfig(
+            url=test_engine.url.render_as_string(hide_password=False), pool_size=3
+        )
+        engine = create_engine(settings)
+        prepared = []
+
+        async def prepare(db):
+            prepared.append(await db.scalar(text("SELECT pg_backend_pid()")))
+
+        try:
+            warmed = await warm_pool(engine, settings, prepare=prepare)
+
+            assert warmed == 3
+            assert engine.sync_engine.pool.checkedin() == 3
+            assert len(set(prepared)) == 3
+        finally:
+            await engine.dispose()
+
+    async def test_failed_connections_are_logged_not_raised(self, caplog):
+        from learn_to_cloud_shared.core.database import warm_pool
+
+        mock_engine = MagicMock()
+        mock_engine.connect.return_value.start = AsyncMock(
+            side_effect=OSError("refused")
+        )
+
+        warmed = await warm_pool(
+            mock_engine, DatabaseConfig(url="postgresql+asyncpg://localhost/test")
+        )
+
+        assert warmed == 0
+        assert "db.pool.warmup_incomplete" in caplog.text
+
+    async def test_cancelled_warmup_closes_every_connection(self):
+        from learn_to_cloud_shared.core.database import warm_pool
+
+        conn = AsyncMock()
+        pending_cancelled = asyncio.Event()
+        opened = 0
+
+        async def start():
+            nonlocal opened
+            opened += 1
+            if opened == 1:
+                return conn
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                pending_cancelled.set()
+                raise
+
+        mock_engine = MagicMock()
+        mock_engine.connect.return_value.start = start
+        settings = DatabaseConfig(
+            url="postgresql+asyncpg://localhost/test", pool_size=2, timeout=30
+        )
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await warm_pool(mock_engine, settings)
+
+        assert pending_cancelled.is_set()
+        conn.close.assert_awaited_once()
+
+
+# ===========================================================================
+# JSON codecs and statement cache
+# ===========================================================================
+
+
+@pytest.mark.integration
+class TestJsonCodecs:
+    """Verify every configured JSON codec round-trips JSONB values."""
+
+    @pytest.mark.parametrize("codec", list(JsonCodec))
+    async def test_jsonb_round_trip(self, test_engine, codec):
+        from sqlalchemy import bindparam, text
+        from sqlalchemy.dialects.postgresql import JSONB
+
+        from learn_to_cloud_shared.core.database import create_engine
+
+        settings = DatabaseConfig(
+            url=test_engine.url.render_as_string(hide_password=False),
+            json_codec=codec,
+            prepared_statement_cache_size=0,
+        )
+        engine = create_engine(settings)
+        value = [{"task": "a", "passed": True, "score": 1.5, "tags": ["x", None]}]
+        stmt = (
+            text("SELECT CAST(:value AS jsonb) AS value")
+            .bindparams(bindparam("value", type_=JSONB))
+            .columns(value=JSONB)
+        )
+
+        try:
+            async with engine.connect() as conn:
+                assert await conn.scalar(stmt, {"value": value}) == value
+        finally:
+            await engine.dispose()
+
+
 # ===========================================================================
 # get_db / get_db_readonly commit / rollback
 # ===========================================================================
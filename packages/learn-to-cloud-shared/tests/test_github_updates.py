@@ -1,5 +1,6 @@
 """Unit tests for the community curriculum-update helper."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -87,3 +88,23 @@ async def test_successful_lookups_are_cached():
 
     # Second call served entirely from cache — no further HTTP calls.
     assert mock_get.await_count == first_call_count
+
+
+async def test_cache_misses_are_fetched_concurrently():
+    in_flight = 0
+    peak = 0
+
+    async def slow_get(url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _mock_response(_commit_payload())
+
+    with patch.object(github_updates, "github_api_get", new=slow_get):
+        updates = await github_updates.get_latest_curriculum_commits()
+
+    assert peak == len(github_updates.CURRICULUM_REPOS)
+    # Display order is preserved.
+    assert [u.name for u in updates] == [r for _, r in github_updates.CURRICULUM_REPOS]
@@ -13,6 +13,7 @@ from learn_to_cloud_shared.models import (
 )
 from learn_to_cloud_shared.progress_reads import (
     are_all_requirements_succeeded,
+    prepare_progress_reads,
     resolve_completed_step_uuids,
     resolve_succeeded_requirement_uuids,
 )
@@ -111,3 +112,9 @@ async def test_all_requirements_succeeded_handles_empty_and_incomplete_sets(
         await are_all_requirements_succeeded(db_session, user_id, [succeeded, missing])
         is False
     )
+
+
+async def test_prepare_progress_reads_runs_against_an_empty_user(
+    db_session: AsyncSession,
+) -> None:
+    await prepare_progress_reads(db_session)
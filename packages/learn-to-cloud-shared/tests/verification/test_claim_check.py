@@ -0,0 +1,165 @@
+"""Tests for claim-checked verification transport data."""
+
+from dataclasses import replace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from learn_to_cloud_shared.core.config import ClaimCheckConfig
+from learn_to_cloud_shared.models import User, VerificationAttempt
+from learn_to_cloud_shared.schemas import ValidationResult
+from learn_to_cloud_shared.submission_values import SubmittedValue
+from learn_to_cloud_shared.testing.requirement_factories import (
+    repo_fork_requirement,
+)
+from learn_to_cloud_shared.verification import claim_check
+from learn_to_cloud_shared.verification.claim_check import (
+    ClaimNotFoundError,
+    check_in_run_result,
+    claim_hash,
+    is_claim_reference,
+    load_grading_request,
+)
+from learn_to_cloud_shared.verification.grading_requests import LLMGradingRequest
+from learn_to_cloud_shared.verification.tasks.base import (
+    EvidenceBundle,
+    EvidenceItem,
+)
+from learn_to_cloud_shared.verification.tasks.phase3 import (
+    JOURNAL_API_FINAL_RUBRIC_TASK,
+)
+from learn_to_cloud_shared.verification_workflow import (
+    PreparedVerificationAttempt,
+    VerificationRunResult,
+)
+
+USER_ID = 85101
+REQUEST = LLMGradingRequest(
+    task=JOURNAL_API_FINAL_RUBRIC_TASK,
+    message="grade this",
+    thread_id="attempt-task",
+)
+
+
+def _run_result() -> VerificationRunResult:
+    requirement = repo_fork_requirement(required_repo="owner/repo")
+    return VerificationRunResult(
+        attempt=PreparedVerificationAttempt(
+            id=uuid4(),
+            user_id=USER_ID,
+            github_username="alice",
+            requirement=requirement,
+            submitted_value=SubmittedValue.from_raw(
+                requirement, "https://github.com/alice/repo"
+            ),
+        ),
+        validation_result=ValidationResult(is_valid=True, message="ok"),
+        evidence=[
+            EvidenceBundle(
+                task_id="t1",
+                source="repo_files",
+                items=[EvidenceItem(path="app.py", content="x" * 64, sha256="a")],
+                total_bytes=64,
+            )
+        ],
+        grading_requests=[REQUEST],
+    )
+
+
+def _use_config(monkeypatch, **kwargs) -> None:
+    settings = type("Settings", (), {"claim_check": ClaimCheckConfig(**kwargs)})
+    monkeypatch.setattr(claim_check, "get_worker_settings", lambda: settings)
+
+
+@pytest.mark.unit
+class TestClaimReferences:
+    def test_hash_ignores_key_order(self):
+        assert claim_hash({"a": 1, "b": [2]}) == claim_hash({"b": [2], "a": 1})
+        assert claim_hash({"a": 1}) != claim_hash({"a": 2})
+
+    def test_only_bare_references_are_claims(self):
+        assert is_claim_reference({"attempt_id": "a", "content_hash": "h"})
+        assert not is_claim_reference({"attempt_id": "a"})
+        assert not is_claim_reference(
+            {"attempt_id": "a", "content_hash": "h", "message": "inline"}
+        )
+
+    async def test_disabled_claim_check_keeps_payload_inline(self, monkeypatch):
+        _use_config(monkeypatch, enabled=False)
+        result = _run_result()
+        session_maker = MagicMock()
+
+        payload = await check_in_run_result(result, session_maker=session_maker)
+
+        assert payload == result.to_payload()
+        session_maker.assert_not_called()
+
+    async def test_small_transport_data_stays_inline(self, monkeypatch):
+        _use_config(monkeypatch, enabled=True, min_bytes=1024 * 1024)
+        result = _run_result()
+
+        payload = await check_in_run_result(result, session_maker=MagicMock())
+
+        assert payload == result.to_payload()
+
+    async def test_inline_request_is_loaded_without_a_lookup(self):
+        session_maker = MagicMock()
+
+        loaded = await load_grading_request(
+            REQUEST.model_dump(mode="json"), session_maker=session_maker
+        )
+
+        assert loaded == REQUEST
+        session_maker.assert_not_called()
+
+
+@pytest.mark.integration
+class TestClaimCheckRoundTrip:
+    async def test_payload_carries_references_that_resolve(
+        self, test_engine: AsyncEngine, monkeypatch
+    ):
+        session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+        _use_config(monkeypatch, enabled=True, min_bytes=0)
+        result = _run_result()
+        async with session_maker() as db:
+            db.add(User(id=USER_ID, github_username="alice"))
+            db.add(
+                VerificationAttempt(
+                    id=result.attempt.id,
+                    user_id=USER_ID,
+                    requirement_uuid=result.attempt.requirement.uuid,
+                    snapshot_source="reconstructed",
+                    submission_value_kind="github_url",
+                    submitted_value="https://github.com/alice/repo",
+                )
+            )
+            await db.commit()
+
+        payload = await check_in_run_result(result, session_maker=session_maker)
+
+        assert payload["evidence"] is None
+        assert payload["grading_requests"] is None
+        assert payload["evidence_claims"] == [
+            {
+                "attempt_id": str(result.attempt.id),
+                "content_hash": claim_hash(evidence.model_dump(mode="json")),
+            }
+            for evidence in result.evidence or []
+        ]
+        [reference] = payload["grading_request_claims"]
+        loaded = await load_grading_request(reference, session_maker=session_maker)
+        assert loaded == REQUEST
+
+        restored = VerificationRunResult.from_payload(payload)
+        assert restored == replace(result, evidence=None, grading_requests=None)
+
+    async def test_unknown_reference_raises(self, test_engine: AsyncEngine):
+        session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+
+        with pytest.raises(ClaimNotFoundError):
+            await load_grading_request(
+                {"attempt_id": str(uuid4()), "content_hash": "missing"},
+                session_maker=session_maker,
+            )
@@ -1,5 +1,7 @@
 """Tests for the declarative verification engine."""
 
+import asyncio
+from dataclasses import replace
 from uuid import uuid4
 
 import pytest
@@ -63,6 +65,22 @@ class UnknownCheckParams(CheckParams):
     check_name = "does-not-exist"
 
 
+class WaitForPeerParams(CheckParams):
+    check_name = "wait_for_peer"
+
+
+class ReleasePeerParams(CheckParams):
+    check_name = "release_peer"
+
+
+class SlowHardFailParams(CheckParams):
+    check_name = "slow_hard_fail"
+
+
+class ConcurrentErrorParams(CheckParams):
+    check_name = "concurrent_error"
+
+
 def _job(requirement=None) -> PreparedVerificationAttempt:
     requirement = requirement or repo_fork_requirement()
     return PreparedVerificationAttempt(
@@ -76,8 +94,10 @@ def _job(requirement=None) -> PreparedVerificationAttempt:
     )
 
 
-def _step(params: CheckParams, task_id: str) -> Step:
-    return Step(params=params, task_id=task_id)
+def _step(
+    params: CheckParams, task_id: str, needs: tuple[str, ...] | None = None
+) -> Step:
+    return Step(params=params, task_id=task_id, needs=needs)
 
 
 def _profile(*steps: Step) -> VerificationProfile:
@@ -173,6 +193,85 @@ async def test_stop_on_fail_false_continues(monkeypatch):
     assert result.validation_result.is_valid is False
 
 
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently(monkeypatch):
+    released = asyncio.Event()
+
+    @register_check(WaitForPeerParams)
+    async def _waiter(context: StepContext, params) -> StepResult:
+        await asyncio.wait_for(released.wait(), timeout=1)
+        return StepResult(
+            passed=True,
+            task_result=TaskResult(task_name="Waiter", passed=True, feedback="ok"),
+        )
+
+    @register_check(ReleasePeerParams)
+    async def _releaser(context: StepContext, params) -> StepResult:
+        released.set()
+        return StepResult(
+            passed=True,
+            task_result=TaskResult(task_name="Releaser", passed=True, feedback="ok"),
+        )
+
+    monkeypatch.setattr(
+        engine_module,
+        "profile_for",
+        lambda _t: _profile(
+            _step(WaitForPeerParams(), "a"),
+            _step(ReleasePeerParams(), "b", needs=()),
+        ),
+    )
+
+    result = await run_profile(_job())
+
+    assert result.validation_result.is_valid is True
+    assert [t.task_name for t in result.validation_result.task_results or []] == [
+        "Waiter",
+        "Releaser",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_step_after_a_failed_gate_is_discarded(monkeypatch):
+    started = asyncio.Event()
+
+    @register_check(SlowHardFailParams)
+    async def _gate(context: StepContext, params) -> StepResult:
+        await started.wait()
+        return StepResult(passed=False, stop_on_fail=True)
+
+    @register_check(ConcurrentErrorParams)
+    async def _peer(context: StepContext, params) -> StepResult:
+        started.set()
+        raise RuntimeError("a sequential run would never have called this")
+
+    monkeypatch.setattr(
+        engine_module,
+        "profile_for",
+        lambda _t: _profile(
+            _step(SlowHardFailParams(), "gate"),
+            _step(ConcurrentErrorParams(), "peer", needs=()),
+        ),
+    )
+
+    result = await run_profile(_job())
+
+    assert result.validation_result.is_valid is False
+
+
+def test_register_profile_rejects_needs_on_a_later_step():
+    from learn_to_cloud_shared.models import SubmissionType
+    from learn_to_cloud_shared.verification.engine import register_profile
+
+    profile = _profile(
+        _step(PassingCheckParams(), "a", needs=("b",)),
+        _step(PassingCheckParams(), "b"),
+    )
+
+    with pytest.raises(ValueError, match="not earlier steps"):
+        register_profile(SubmissionType.REPO_FORK, profile)
+
+
 def test_multiple_authoritative_results_keep_latest_message_and_all_feedback():
     first_task = TaskResult(task_name="Files", passed=True, feedback="present")
     second_task = TaskResult(task_name="Image", passed=True, feedback="pullable")
@@ -440,6 +539,49 @@ async def test_deployment_profile_gate_fails_when_deploy_script_missing():
     assert result.grading_requests == []
 
 
+@pytest.mark.asyncio
+async def test_deployment_resubmission_at_same_head_reuses_the_memoized_run():
+    from learn_to_cloud_shared.verification.repo_files import InMemoryRepoFiles
+
+    class PinnedRepoFiles(InMemoryRepoFiles):
+        head = "sha-1"
+        file_reads = 0
+
+        async def resolve_ref(self, owner, repo, branch):
+            return self.head
+
+        async def file(self, owner, repo, path, branch="main"):
+            self.file_reads += 1
+            return await super().file(owner, repo, path, branch)
+
+    description = (
+        "My two-tier deployment provisions a public API tier and a private "
+        "database tier in an isolated subnet, all created idempotently by "
+        "deploy.sh with restricted inbound rules and TLS termination for the "
+        "API. Traffic flows from the internet to the load balancer, then to "
+        "the API compute, and only the API can reach the private database."
+    )
+    repo_files = PinnedRepoFiles({"deploy.sh": "#!/bin/bash\naz group create\n"})
+
+    job = _deployment_job(description)
+    first = await run_profile(job, repo_files=repo_files)
+    reads = repo_files.file_reads
+    resubmitted = replace(job, id=uuid4())
+    second = await run_profile(resubmitted, repo_files=repo_files)
+
+    assert reads > 0
+    assert repo_files.file_reads == reads
+    assert second.attempt is resubmitted
+    assert second.validation_result == first.validation_result
+    assert second.grading_requests is not None
+    assert second.grading_requests[0].thread_id.startswith(str(resubmitted.id))
+
+    repo_files.head = "sha-2"
+    await run_profile(replace(job, id=uuid4()), repo_files=repo_files)
+
+    assert repo_files.file_reads > reads
+
+
 # ---------------------------------------------------------------------------
 # Phase 4/5 deterministic profiles: deployed API probe and DevOps workflow.
 # ---------------------------------------------------------------------------
@@ -573,23 +715,142 @@ async def test_devops_profile_runs_files_then_ghcr_gates(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_devops_profile_skips_ghcr_when_files_gate_fails(monkeypatch):
-    calls: list[str] = []
+async def test_devops_profile_fetches_tree_once_across_gate_and_review(monkeypatch):
+    from learn_to_cloud_shared.verification.repo_files import InMemoryRepoFiles
+
+    class CountingRepoFiles(InMemoryRepoFiles):
+        tree_calls = 0
+
+        async def tree(self, owner, repo, branch="main"):
+            self.tree_calls += 1
+            return await super().tree(owner, repo, branch)
+
+    async def fake_image(owner):
+        return ValidationResult(is_valid=True, message="Container image is pullable")
+
+    monkeypatch.setattr(engine_module, "verify_public_ghcr_image", fake_image)
+    repo_files = CountingRepoFiles(
+        {
+            "Dockerfile": "FROM python:3.12-slim",
+            ".github/workflows/deploy.yml": "jobs: {}",
+            "infra/main.tf": 'resource "azurerm_kubernetes_cluster" "main" {}',
+            "k8s/deployment.yaml": "kind: Deployment",
+            "k8s/service.yaml": "kind: Service",
+        }
+    )
+
+    result = await run_profile(_devops_job(), repo_files=repo_files)
+
+    assert result.validation_result.is_valid is True
+    assert result.grading_disposition == GradingDisposition.REQUESTED
+    assert repo_files.tree_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_devops_resubmission_at_same_head_rechecks_the_image(monkeypatch):
+    """The GHCR gate reads package visibility, which can change without a
+    commit, so the DevOps profile is not memoized."""
+    from learn_to_cloud_shared.verification.repo_files import InMemoryRepoFiles
+
+    class PinnedRepoFiles(InMemoryRepoFiles):
+        async def resolve_ref(self, owner, repo, branch):
+            return "sha-1"
+
+    image_calls = 0
+
+    async def fake_image(owner):
+        nonlocal image_calls
+        image_calls += 1
+        return ValidationResult(is_valid=True, message="Container image is pullable")
+
+    monkeypatch.setattr(engine_module, "verify_public_ghcr_image", fake_image)
+    repo_files = PinnedRepoFiles(
+        {
+            "Dockerfile": "FROM python:3.12-slim",
+            ".github/workflows/deploy.yml": "jobs: {}",
+            "infra/main.tf": 'resource "azurerm_kubernetes_cluster" "main" {}',
+            "k8s/deployment.yaml": "kind: Deployment",
+            "k8s/service.yaml": "kind: Service",
+        }
+    )
+
+    job = _devops_job()
+    await run_profile(job, repo_files=repo_files)
+    await run_profile(replace(job, id=uuid4()), repo_files=repo_files)
+
+    assert image_calls == 2
+
+
+@pytest.mark.parametrize("archive_evidence", [True, False])
+def test_production_repo_files_uses_archive_only_when_enabled(
+    monkeypatch, archive_evidence
+):
+    from learn_to_cloud_shared.core.config import GitHubConfig
+    from learn_to_cloud_shared.models import SubmissionType
+    from learn_to_cloud_shared.verification.repo_archive import (
+        GitHubArchiveRepoFiles,
+    )
+
+    settings = type(
+        "Settings", (), {"github": GitHubConfig(archive_evidence=archive_evidence)}
+    )
+    monkeypatch.setattr(engine_module, "get_worker_settings", lambda: settings)
+
+    devops = engine_module.profile_for(SubmissionType.DEVOPS_ANALYSIS)
+    journal = engine_module.profile_for(SubmissionType.JOURNAL_API_VERIFIER)
+    assert devops is not None and journal is not None
+
+    assert (
+        isinstance(engine_module._production_repo_files(devops), GitHubArchiveRepoFiles)
+        is archive_evidence
+    )
+    assert not isinstance(
+        engine_module._production_repo_files(journal), GitHubArchiveRepoFiles
+    )
+
+
+@pytest.mark.asyncio
+async def test_devops_profile_runs_files_and_ghcr_gates_together(monkeypatch):
+    from learn_to_cloud_shared.verification.repo_files import InMemoryRepoFiles
+
+    files_started = asyncio.Event()
+    image_started = asyncio.Event()
+    finished: list[str] = []
 
     async def fake_files(owner, repo, repo_files=None):
-        calls.append("files")
+        files_started.set()
+        await asyncio.wait_for(image_started.wait(), timeout=1)
+        finished.append("files")
+        return ValidationResult(is_valid=True, message="Required files exist")
+
+    async def fake_image(owner):
+        image_started.set()
+        await asyncio.wait_for(files_started.wait(), timeout=1)
+        finished.append("image")
+        return ValidationResult(is_valid=True, message="Container image is pullable")
+
+    monkeypatch.setattr(engine_module, "verify_required_devops_files", fake_files)
+    monkeypatch.setattr(engine_module, "verify_public_ghcr_image", fake_image)
+
+    await run_profile(_devops_job(), repo_files=InMemoryRepoFiles({}))
+
+    assert sorted(finished) == ["files", "image"]
+
+
+@pytest.mark.asyncio
+async def test_devops_profile_reports_files_failure_over_ghcr(monkeypatch):
+    async def fake_files(owner, repo, repo_files=None):
+        await asyncio.sleep(0)
         return ValidationResult(is_valid=False, message="Missing workflow file")
 
     async def fake_image(owner):
-        calls.append("image")
-        return ValidationResult(is_valid=True, message="unexpected")
+        return ValidationResult(is_valid=False, message="Image is private")
 
     monkeypatch.setattr(engine_module, "verify_required_devops_files", fake_files)
     monkeypatch.setattr(engine_module, "verify_public_ghcr_image", fake_image)
 
     result = await run_profile(_devops_job())
 
-    assert calls == ["files"]
     assert result.validation_result.is_valid is False
     assert result.validation_result.message == "Missing workflow file"
     assert result.grading_requests == []
@@ -695,6 +956,39 @@ async def test_security_profile_skips_grading_when_gate_fails(monkeypatch):
     assert result.evidence is None
 
 
+@pytest.mark.asyncio
+async def test_security_profile_fetches_evidence_alongside_the_gate(monkeypatch):
+    from learn_to_cloud_shared.verification.repo_files import InMemoryRepoFiles
+
+    gate_started = asyncio.Event()
+    fetch_started = asyncio.Event()
+    collect = engine_module.collect_security_scanning_evidence
+
+    async def fake_gate(owner, repo):
+        gate_started.set()
+        await asyncio.wait_for(fetch_started.wait(), timeout=1)
+        return ValidationResult(is_valid=True, message="CodeQL green on main")
+
+    async def fake_collect(*args, **kwargs):
+        fetch_started.set()
+        await asyncio.wait_for(gate_started.wait(), timeout=1)
+        return await collect(*args, **kwargs)
+
+    monkeypatch.setattr(engine_module, "verify_codeql_status", fake_gate)
+    monkeypatch.setattr(
+        engine_module, "collect_security_scanning_evidence", fake_collect
+    )
+    repo_files = InMemoryRepoFiles(
+        {".github/workflows/codeql.yml": "name: CodeQL\non: [push]\n"}
+    )
+
+    result = await run_profile(_security_job(), repo_files=repo_files)
+
+    assert result.validation_result.is_valid is True
+    assert result.grading_requests is not None
+    assert len(result.grading_requests) == 1
+
+
 @pytest.mark.asyncio
 async def test_career_profile_records_text_grading_request_when_gate_passes():
     from learn_to_cloud_shared.verification.tasks.phase7 import (
@@ -711,6 +1005,10 @@ async def test_career_profile_records_text_grading_request_when_gate_passes():
     assert request.task.id == CAREER_REFLECTION_RUBRIC_TASK.id
     assert request.task.evidence.source == "submitted_text"
     assert text in request.message
+    assert result.evidence is not None
+    assert [path for path, _ in request.evidence_hashes] == [
+        item.path for item in result.evidence[0].items
+    ]
 
 
 @pytest.mark.asyncio
@@ -876,3 +1174,59 @@ def test_every_registered_profile_step_is_valid():
             assert params_type in _CHECK_REGISTRY, (
                 f"{submission_type}: check '{params_type.check_name}' is not registered"
             )
+
+
+# ---------------------------------------------------------------------------
+# Only local token checks may run in-request: no network, no grading.
+# ---------------------------------------------------------------------------
+
+
+def test_rubric_review_steps_wait_only_for_their_gates():
+    from learn_to_cloud_shared.models import SubmissionType
+    from learn_to_cloud_shared.verification.engine import profile_for
+
+    def needs(submission_type):
+        profile = profile_for(submission_type)
+        assert profile is not None
+        return {step.task_id: step.needs for step in profile.steps}
+
+    assert needs(SubmissionType.DEVOPS_ANALYSIS) == {
+        "devops-required-files": None,
+        "public-ghcr-image": (),
+        "devops-implementation-rubric": (
+            "devops-required-files",
+            "public-ghcr-image",
+        ),
+    }
+    journal = needs(SubmissionType.JOURNAL_API_VERIFIER)
+    assert list(journal.values())[-1] == ("journal-api-implementation-ci",)
+    security = needs(SubmissionType.SECURITY_SCANNING)
+    assert list(security.values()) == [None, ()]
+
+
+def test_only_commit_content_profiles_are_memoized():
+    from learn_to_cloud_shared.models import SubmissionType
+    from learn_to_cloud_shared.verification.engine import profile_for
+
+    memoized = {
+        t for t in SubmissionType if (profile := profile_for(t)) and profile.memoize
+    }
+
+    assert memoized == {
+        SubmissionType.DEPLOYMENT_ARCHITECTURE,
+        SubmissionType.CAREER_REFLECTION,
+    }
+
+
+def test_only_token_profiles_run_inline():
+    from learn_to_cloud_shared.models import SubmissionType
+    from learn_to_cloud_shared.verification.engine import profile_for, runs_inline
+
+    inline = {t for t in SubmissionType if runs_inline(t)}
+
+    assert inline == {SubmissionType.CTF_TOKEN, SubmissionType.NETWORKING_TOKEN}
+    for submission_type in inline:
+        profile = profile_for(submission_type)
+        assert profile is not None
+        assert not profile.memoize
+        assert profile.rubric is None
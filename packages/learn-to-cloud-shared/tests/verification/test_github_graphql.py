@@ -0,0 +1,255 @@
+"""Tests for the coalescing GraphQL GitHubMetadata/RepoRef adapter."""
+
+import asyncio
+import json
+import re
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from learn_to_cloud_shared.core.config import GitHubConfig
+from learn_to_cloud_shared.verification import github_metadata, repo_ref
+from learn_to_cloud_shared.verification.errors import GitHubServerError
+from learn_to_cloud_shared.verification.github_graphql import (
+    GitHubGraphQLMetadata,
+    GraphQLCoalescer,
+)
+from learn_to_cloud_shared.verification.github_metadata import (
+    GitHubMetadata,
+    default_github_metadata,
+)
+from learn_to_cloud_shared.verification.github_profile import check_repo_is_fork_of
+from learn_to_cloud_shared.verification.repo_ref import RepoRef, default_repo_ref
+
+_ALIAS = re.compile(r"^\s*(q\d+): (\w+)\(owner: \"([^\"]+)\", name: \"([^\"]+)\"")
+
+REPOS = {
+    "learner/journal": {
+        "nameWithOwner": "learner/journal",
+        "isFork": True,
+        "parent": {"nameWithOwner": "learntocloud/journal-starter"},
+        "defaultBranchRef": {"name": "main", "target": {"oid": "abc123"}},
+        "ref": {"target": {"oid": "abc123"}},
+    },
+    "learner/plain": {
+        "nameWithOwner": "learner/plain",
+        "isFork": False,
+        "parent": None,
+        "defaultBranchRef": {"name": "main", "target": {"oid": "def456"}},
+        "ref": None,
+    },
+}
+
+
+def _graphql_handler(queries: list[str]):
+    """Answer aliased ``repository`` fields from ``REPOS``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        queries.append(query)
+        data, errors = {}, []
+        for line in query.splitlines():
+            match = _ALIAS.match(line)
+            if match is None:
+                continue
+            alias, _, owner, name = match.groups()
+            node = REPOS.get(f"{owner}/{name}")
+            data[alias] = node
+            if node is None:
+                errors.append({"type": "NOT_FOUND", "path": [alias], "message": "x"})
+        return httpx.Response(200, json={"data": data, "errors": errors})
+
+    return handler
+
+
+def _patched_client(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch(
+        "learn_to_cloud_shared.verification.github_http._get_github_client",
+        return_value=client,
+    )
+
+
+@pytest.mark.unit
+class TestGitHubGraphQLMetadata:
+    def test_implements_both_seams(self):
+        adapter = GitHubGraphQLMetadata()
+        assert isinstance(adapter, GitHubMetadata)
+        assert isinstance(adapter, RepoRef)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_sent_as_one_query(self):
+        queries: list[str] = []
+        adapter = GitHubGraphQLMetadata()
+
+        with _patched_client(_graphql_handler(queries)):
+            fork, sha, exists, missing = await asyncio.gather(
+                adapter.repo_metadata("learner", "journal"),
+                adapter.head_sha("learner", "journal"),
+                adapter.url_exists("https://github.com/learner/journal"),
+                adapter.repo_metadata("learner", "gone"),
+            )
+
+        assert len(queries) == 1
+        # Fork check, HEAD lookup and URL check share one repository alias.
+        assert queries[0].count("repository(") == 2
+        assert fork == {
+            "full_name": "learner/journal",
+            "fork": True,
+            "default_branch": "main",
+            "parent": {"full_name": "learntocloud/journal-starter"},
+        }
+        assert sha == "abc123"
+        assert exists is True
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_missing_branch_raises_404_like_rest(self):
+        adapter = GitHubGraphQLMetadata()
+
+        with _patched_client(_graphql_handler([])):
+            with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                await adapter.head_sha("learner", "plain")
+
+        assert exc_info.value.response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_fork_validator_reads_graphql_metadata(self):
+        adapter = GitHubGraphQLMetadata()
+
+        with _patched_client(_graphql_handler([])):
+            fork = await check_repo_is_fork_of(
+                "learner", "journal", "learntocloud/journal-starter", adapter
+            )
+            plain = await check_repo_is_fork_of(
+                "learner", "plain", "learntocloud/journal-starter", adapter
+            )
+
+        assert fork.is_valid is True
+        assert plain.is_valid is False
+        assert plain.message == "Repository is not a fork"
+
+    @pytest.mark.asyncio
+    async def test_non_repository_urls_fall_back_to_head(self):
+        methods: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200)
+
+        with _patched_client(handler):
+            assert await GitHubGraphQLMetadata().url_exists(
+                "https://example.com/learner"
+            )
+
+        assert methods == ["HEAD"]
+
+    @pytest.mark.asyncio
+    async def test_blob_url_segments_are_percent_decoded(self):
+        queries: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            queries.append(json.loads(request.content)["query"])
+            return httpx.Response(
+                200, json={"data": {"q0": {"object": {"oid": "f00"}}}}
+            )
+
+        with _patched_client(handler):
+            assert await GitHubGraphQLMetadata().url_exists(
+                "https://github.com/learner/journal/blob/main/docs/my%20notes.md"
+            )
+
+        assert '"main:docs/my notes.md"' in queries[0]
+
+    @pytest.mark.asyncio
+    async def test_null_object_falls_back_to_head(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.method == "HEAD":
+                return httpx.Response(200)
+            return httpx.Response(200, json={"data": {"q0": {"object": None}}})
+
+        url = "https://github.com/learner/journal/blob/feature/login/app.py"
+        with _patched_client(handler):
+            assert await GitHubGraphQLMetadata().url_exists(url)
+
+        # The ref "feature/login" was split as "feature"; the HEAD settles it.
+        assert '"feature:login/app.py"' in json.loads(requests[0].content)["query"]
+        assert [r.method for r in requests] == ["POST", "HEAD"]
+        assert str(requests[1].url) == url
+
+
+@pytest.mark.unit
+class TestGraphQLCoalescer:
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting_for_the_window(self):
+        queries: list[str] = []
+        coalescer = GraphQLCoalescer(window=60, max_batch=2)
+
+        with _patched_client(_graphql_handler(queries)):
+            nodes = await asyncio.wait_for(
+                asyncio.gather(
+                    coalescer.fetch('repository(owner: "learner", name: "journal") {}'),
+                    coalescer.fetch('repository(owner: "learner", name: "plain") {}'),
+                ),
+                timeout=5,
+            )
+
+        assert len(queries) == 1
+        assert [node["nameWithOwner"] for node in nodes] == [
+            "learner/journal",
+            "learner/plain",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_other_field_errors_are_retriable(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "data": {"q0": None},
+                    "errors": [{"type": "FORBIDDEN", "path": ["q0"], "message": "no"}],
+                },
+            )
+
+        with _patched_client(handler):
+            with pytest.raises(GitHubServerError):
+                await GraphQLCoalescer().fetch("viewer { login }")
+
+    @pytest.mark.asyncio
+    async def test_http_errors_reach_every_waiter(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(401)
+
+        coalescer = GraphQLCoalescer()
+        with _patched_client(handler):
+            results = await asyncio.gather(
+                coalescer.fetch("viewer { login }"),
+                coalescer.fetch("rateLimit { remaining }"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("graphql_metadata", "token", "expected"),
+    [(True, "ghp_x", True), (True, "", False), (False, "ghp_x", False)],
+)
+def test_default_adapters_select_graphql_only_with_flag_and_token(
+    monkeypatch, graphql_metadata, token, expected
+):
+    settings = type(
+        "Settings",
+        (),
+        {"github": GitHubConfig(graphql_metadata=graphql_metadata, token=token)},
+    )
+    for module in (github_metadata, repo_ref):
+        monkeypatch.setattr(module, "get_worker_settings", lambda: settings)
+
+    assert isinstance(default_github_metadata(), GitHubGraphQLMetadata) is expected
+    assert isinstance(default_repo_ref(), GitHubGraphQLMetadata) is expected
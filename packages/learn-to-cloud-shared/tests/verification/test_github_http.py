@@ -0,0 +1,195 @@
+"""Tests for conditional-request caching and single flight in ``github_api_get``."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from learn_to_cloud_shared.verification.github_http import (
+    CachedGitHubResponse,
+    InMemoryGitHubResponseCache,
+    clear_github_response_cache,
+    github_api_get,
+    set_github_response_cache,
+)
+
+URL = "https://api.github.com/repos/learner/repo"
+
+
+@pytest.fixture(autouse=True)
+def _response_cache():
+    set_github_response_cache(InMemoryGitHubResponseCache(maxsize=8))
+    yield
+    clear_github_response_cache()
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def _get(client: httpx.AsyncClient, **kwargs) -> httpx.Response:
+    with patch(
+        "learn_to_cloud_shared.verification.github_http._get_github_client",
+        return_value=client,
+    ):
+        return await github_api_get(URL, **kwargs)
+
+
+@pytest.mark.unit
+class TestConditionalRequests:
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag_and_replays_body_on_304(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"X-RateLimit-Remaining": "41"})
+            return httpx.Response(
+                200,
+                json={"full_name": "learner/repo"},
+                headers={"ETag": '"v1"', "X-RateLimit-Remaining": "42"},
+            )
+
+        async with _client(handler) as client:
+            first = await _get(client)
+            second = await _get(client)
+
+        assert "If-None-Match" not in seen[0].headers
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+        assert second.status_code == 200
+        assert second.json() == first.json() == {"full_name": "learner/repo"}
+        assert second.headers["X-RateLimit-Remaining"] == "41"
+
+    @pytest.mark.asyncio
+    async def test_last_modified_is_sent_as_if_modified_since(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(
+                200,
+                json={},
+                headers={"Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+            )
+
+        async with _client(handler) as client:
+            await _get(client)
+            await _get(client)
+
+        assert seen[1].headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_params_are_part_of_the_key(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={}, headers={"ETag": '"v1"'})
+
+        async with _client(handler) as client:
+            await _get(client, params={"page": 1})
+            await _get(client, params={"page": 2})
+
+        assert "If-None-Match" not in seen[1].headers
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(404, headers={"ETag": '"missing"'})
+
+        async with _client(handler) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await _get(client)
+
+        assert "If-None-Match" not in seen[1].headers
+
+
+def _entry(size: int) -> CachedGitHubResponse:
+    return CachedGitHubResponse(
+        etag='"v1"', last_modified=None, headers=(), content=b"x" * size
+    )
+
+
+@pytest.mark.unit
+class TestInMemoryResponseCache:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_past_the_byte_budget(self):
+        cache = InMemoryGitHubResponseCache(maxsize=100, max_bytes=1600)
+        for key in ("a", "b", "c"):
+            await cache.set(key, _entry(100))
+        await cache.get("a")
+        for key in range(14):
+            await cache.set(f"filler-{key}", _entry(100))
+
+        assert await cache.get("a") is not None
+        assert await cache.get("b") is None
+
+    @pytest.mark.asyncio
+    async def test_skips_bodies_above_the_entry_threshold(self):
+        cache = InMemoryGitHubResponseCache(maxsize=100, max_bytes=1600)
+        await cache.set("big", _entry(50))
+        await cache.set("big", _entry(101))
+
+        assert await cache.get("big") is None
+
+    @pytest.mark.asyncio
+    async def test_entry_count_is_still_bounded(self):
+        cache = InMemoryGitHubResponseCache(maxsize=2, max_bytes=1600)
+        for key in ("a", "b", "c"):
+            await cache.set(key, _entry(1))
+
+        assert await cache.get("a") is None
+        assert await cache.get("c") is not None
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self):
+        seen: list[httpx.Request] = []
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            await release.wait()
+            return httpx.Response(200, json={"full_name": "learner/repo"})
+
+        async with _client(handler) as client:
+            with patch(
+                "learn_to_cloud_shared.verification.github_http._get_github_client",
+                return_value=client,
+            ):
+                calls = [asyncio.create_task(github_api_get(URL)) for _ in range(5)]
+                other = asyncio.create_task(github_api_get(URL, params={"page": 2}))
+                await asyncio.sleep(0.01)
+                release.set()
+                responses = await asyncio.gather(*calls, other)
+
+        assert len(seen) == 2
+        assert {r.json()["full_name"] for r in responses} == {"learner/repo"}
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller_and_are_not_pinned(self):
+        statuses = iter([404, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={})
+
+        async with _client(handler) as client:
+            with patch(
+                "learn_to_cloud_shared.verification.github_http._get_github_client",
+                return_value=client,
+            ):
+                results = await asyncio.gather(
+                    github_api_get(URL), github_api_get(URL), return_exceptions=True
+                )
+                retried = await github_api_get(URL)
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert retried.status_code == 200
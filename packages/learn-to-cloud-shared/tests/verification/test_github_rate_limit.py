@@ -0,0 +1,304 @@
+"""Tests for GitHub rate-limit budgets, pacing and the token pool."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from learn_to_cloud_shared.core.config import GitHubConfig
+from learn_to_cloud_shared.verification import github_rate_limit
+from learn_to_cloud_shared.verification.errors import GitHubRateLimitExhaustedError
+from learn_to_cloud_shared.verification.github_http import github_api_get
+from learn_to_cloud_shared.verification.github_rate_limit import (
+    GitHubRateLimitBudget,
+    GitHubTokenPool,
+    get_github_token_pool,
+    rate_limit_resource,
+)
+
+NOW = 1_000_000.0
+
+
+def _limited(remaining: int, *, limit: int = 100, reset_in: float = 60):
+    headers = {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(NOW + reset_in)),
+    }
+    return httpx.Response(200, headers=headers)
+
+
+def _budget(**kwargs) -> GitHubRateLimitBudget:
+    return GitHubRateLimitBudget(clock=lambda: NOW, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    get_github_token_pool.cache_clear()
+    yield
+    get_github_token_pool.cache_clear()
+
+
+@pytest.mark.unit
+class TestGitHubRateLimitBudget:
+    def test_unknown_or_healthy_budget_does_not_wait(self):
+        budget = _budget()
+        assert budget.reserve("core") == 0
+
+        budget.observe(_limited(50))
+        assert budget.reserve("core") == 0
+        assert budget.remaining() == {"core": 49}
+
+    def test_low_budget_spaces_calls_until_the_reset(self):
+        budget = _budget(max_wait=60)
+        budget.observe(_limited(4, reset_in=60))
+
+        # 60s over 4 calls, then 3, then 2; never past the reset.
+        assert [budget.reserve("core") for _ in range(3)] == [15, 35, 60]
+
+    def test_just_below_the_watermark_paces_without_failing(self):
+        budget = _budget()
+        budget.observe(_limited(499, limit=5000, reset_in=3000))
+
+        delays = [budget.reserve("core") for _ in range(3)]
+
+        # 5s of max_wait shared by the 499, then 498, then 497 calls left.
+        steps = [5 / 499, 5 / 498, 5 / 497]
+        assert delays == pytest.approx([sum(steps[: n + 1]) for n in range(3)])
+
+    def test_queued_calls_wait_at_most_max_wait(self):
+        budget = _budget(max_wait=5)
+        budget.observe(_limited(3, reset_in=600))
+
+        delays = [budget.reserve("core") for _ in range(3)]
+
+        assert delays == pytest.approx([5 / 3, 5 / 3 + 5 / 2, 5])
+
+    def test_wait_past_max_wait_fails_fast(self):
+        budget = _budget(max_wait=5)
+        budget.observe(_limited(0, reset_in=600))
+
+        with pytest.raises(GitHubRateLimitExhaustedError) as exc_info:
+            budget.reserve("core")
+        assert exc_info.value.retry_after == 600
+
+    def test_out_of_order_responses_keep_the_lowest_count(self):
+        budget = _budget()
+        budget.observe(_limited(40))
+        budget.observe(_limited(45))
+        assert budget.remaining() == {"core": 40}
+
+        budget.observe(_limited(90, reset_in=3600 + 60))
+        assert budget.remaining() == {"core": 90}
+
+    def test_resources_are_tracked_separately(self):
+        budget = _budget()
+        budget.observe(
+            httpx.Response(
+                200,
+                headers={
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "3",
+                    "X-RateLimit-Reset": str(int(NOW + 60)),
+                    "X-RateLimit-Resource": "graphql",
+                },
+            )
+        )
+        budget.observe(_limited(90))
+
+        assert budget.remaining() == {"graphql": 3, "core": 90}
+
+    def test_expired_window_is_ignored(self):
+        budget = _budget()
+        budget.observe(_limited(0, reset_in=-1))
+
+        assert budget.reserve("core") == 0
+        assert budget.remaining() == {}
+
+    @pytest.mark.parametrize(
+        ("url", "resource"),
+        [
+            ("https://api.github.com/repos/o/r", "core"),
+            ("https://api.github.com/graphql", "graphql"),
+            ("https://api.github.com/search/code", "search"),
+            ("https://github.com/o/r", None),
+            ("https://raw.githubusercontent.com/o/r/main/a.py", None),
+        ],
+    )
+    def test_only_the_api_host_is_metered(self, url, resource):
+        assert rate_limit_resource(url) == resource
+
+    def test_gauge_reports_remaining_per_resource(self):
+        get_github_token_pool().credentials[0].observe(
+            httpx.Response(
+                200,
+                headers={
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "4999",
+                    "X-RateLimit-Reset": "9999999999",
+                },
+            )
+        )
+
+        [observation] = github_rate_limit._observe_remaining(None)  # type: ignore[arg-type]
+
+        assert observation.value == 4999
+        assert observation.attributes == {"resource": "core", "credential": 0}
+
+
+@pytest.mark.unit
+class TestGitHubApiGetPacing:
+    @pytest.mark.asyncio
+    async def test_primary_rate_limit_403_is_not_retried(self):
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(
+                403,
+                headers={
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": "9999999999",
+                },
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch(
+            "learn_to_cloud_shared.verification.github_http._get_github_client",
+            return_value=client,
+        ):
+            with pytest.raises(GitHubRateLimitExhaustedError):
+                await github_api_get("https://api.github.com/repos/o/r")
+            # The budget now knows it is empty, so nothing more is sent.
+            with pytest.raises(GitHubRateLimitExhaustedError):
+                await github_api_get("https://api.github.com/repos/o/r")
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_primary_rate_limit_moves_to_another_credential(self, monkeypatch):
+        settings = type("Settings", (), {"github": GitHubConfig(tokens="a,b")})
+        monkeypatch.setattr(github_rate_limit, "get_worker_settings", lambda: settings)
+        stub = _StubGitHub(quota=5)
+        stub.used["a"] = 5  # Spent before this process saw its headers.
+        client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+
+        with patch(
+            "learn_to_cloud_shared.verification.github_http._get_github_client",
+            return_value=client,
+        ):
+            response = await github_api_get("https://api.github.com/repos/o/r")
+
+        assert response.json() == {"token": "b"}
+        assert stub.used == {"a": 6, "b": 1}
+        assert get_github_token_pool().credentials[0].cooldown_until > NOW
+
+    @pytest.mark.asyncio
+    async def test_web_head_requests_do_not_touch_the_pool(self):
+        from learn_to_cloud_shared.verification.github_http import (
+            github_head_status,
+        )
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(404)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        pool = get_github_token_pool()
+        with (
+            patch(
+                "learn_to_cloud_shared.verification.github_http._get_github_client",
+                return_value=client,
+            ),
+            patch.object(pool, "lease", side_effect=AssertionError("leased")),
+        ):
+            status = await github_head_status("https://github.com/o/r/blob/main/x")
+
+        assert status == 404
+        assert "Authorization" not in requests[0].headers
+
+
+class _StubGitHub:
+    """Local stand-in for api.github.com enforcing a per-token hourly quota."""
+
+    def __init__(self, quota: int) -> None:
+        self.quota = quota
+        self.used: dict[str, int] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        used = self.used[token] = self.used.get(token, 0) + 1
+        remaining = self.quota - used
+        headers = {
+            "X-RateLimit-Limit": str(self.quota),
+            "X-RateLimit-Remaining": str(max(remaining, 0)),
+            "X-RateLimit-Reset": "9999999999",
+        }
+        if remaining < 0:
+            return httpx.Response(403, headers=headers)
+        return httpx.Response(200, json={"token": token}, headers=headers)
+
+
+@pytest.mark.unit
+class TestGitHubTokenPool:
+    def test_tokens_are_parsed_from_config(self):
+        config = GitHubConfig(token="a", tokens="b, a,,c")
+        assert config.token_list() == ["a", "b", "c"]
+        assert GitHubConfig().token_list() == []
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_credential_is_leased(self):
+        pool = GitHubTokenPool(["a", "b"], clock=lambda: NOW)
+        pool.credentials[0].observe(_limited(20))
+        pool.credentials[1].observe(_limited(80))
+
+        async with pool.lease("https://api.github.com/repos/o/r") as credential:
+            assert credential.token == "b"
+
+    @pytest.mark.asyncio
+    async def test_ties_go_to_the_credential_with_fewer_calls_in_flight(self):
+        pool = GitHubTokenPool(["a", "b"], clock=lambda: NOW)
+        url = "https://api.github.com/repos/o/r"
+
+        async with pool.lease(url) as first, pool.lease(url) as second:
+            assert {first.token, second.token} == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_credential_cools_down(self):
+        pool = GitHubTokenPool(["a", "b"], clock=lambda: NOW)
+        pool.credentials[0].observe(httpx.Response(429, headers={"Retry-After": "30"}))
+
+        assert pool.credentials[0].cooldown_until == NOW + 30
+        for _ in range(3):
+            async with pool.lease("https://api.github.com/graphql") as credential:
+                assert credential.token == "b"
+
+    def test_all_cooling_down_past_max_wait_fails_fast(self):
+        pool = GitHubTokenPool(["a"], max_wait=5, clock=lambda: NOW)
+        pool.credentials[0].observe(httpx.Response(429, headers={"Retry-After": "90"}))
+
+        with pytest.raises(GitHubRateLimitExhaustedError) as exc_info:
+            pool._pick("core")
+        assert exc_info.value.retry_after == 90
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_credentials(self, monkeypatch):
+        settings = type("Settings", (), {"github": GitHubConfig(tokens="a,b,c")})
+        monkeypatch.setattr(github_rate_limit, "get_worker_settings", lambda: settings)
+        stub = _StubGitHub(quota=4)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+
+        with patch(
+            "learn_to_cloud_shared.verification.github_http._get_github_client",
+            return_value=client,
+        ):
+            # Three tokens with a quota of four each serve twelve calls.
+            for i in range(12):
+                await github_api_get(f"https://api.github.com/repos/o/r{i}")
+            with pytest.raises(GitHubRateLimitExhaustedError):
+                await github_api_get("https://api.github.com/repos/o/extra")
+
+        assert stub.used == {"a": 4, "b": 4, "c": 4}
@@ -0,0 +1,148 @@
+"""Tests for the durable LLM grading decision cache."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from learn_to_cloud_shared.core.config import GradingCacheConfig
+from learn_to_cloud_shared.verification import grading_cache
+from learn_to_cloud_shared.verification.grading_cache import (
+    get_cached_grading_decision,
+    grading_cache_key,
+    store_grading_decision,
+)
+from learn_to_cloud_shared.verification.grading_requests import LLMGradingRequest
+from learn_to_cloud_shared.verification.tasks import LLMGradingDecision
+from learn_to_cloud_shared.verification.tasks.phase3 import (
+    JOURNAL_API_FINAL_RUBRIC_TASK,
+)
+
+HASHES = [("app/main.py", "a" * 64), ("README.md", "b" * 64)]
+SYSTEM_PROMPT = "You are the grader."
+
+
+def _request(evidence_hashes=HASHES, task=JOURNAL_API_FINAL_RUBRIC_TASK):
+    return LLMGradingRequest(
+        task=task,
+        message="grade this",
+        thread_id="attempt-task",
+        evidence_hashes=evidence_hashes,
+    )
+
+
+def _key(request, model_deployment="gpt", system_prompt=SYSTEM_PROMPT):
+    return grading_cache_key(
+        request, model_deployment=model_deployment, system_prompt=system_prompt
+    )
+
+
+def _with_prompt_version(version: str):
+    grader = JOURNAL_API_FINAL_RUBRIC_TASK.grader.model_copy(
+        update={"prompt_version": version}
+    )
+    return JOURNAL_API_FINAL_RUBRIC_TASK.model_copy(update={"grader": grader})
+
+
+@pytest.mark.unit
+class TestGradingCacheKey:
+    def test_requests_without_hashed_evidence_are_not_cached(self):
+        assert _key(_request([])) is None
+
+    def test_thread_does_not_affect_the_key(self):
+        other = _request().model_copy(update={"thread_id": "another-attempt"})
+        assert _key(other) == _key(_request())
+
+    @pytest.mark.parametrize(
+        ("request_", "model_deployment"),
+        [
+            (_request([("app/main.py", "c" * 64), ("README.md", "b" * 64)]), "gpt"),
+            (_request([("app/api.py", "a" * 64), ("README.md", "b" * 64)]), "gpt"),
+            (_request(task=_with_prompt_version("v-next")), "gpt"),
+            (_request(), "gpt-mini"),
+        ],
+    )
+    def test_evidence_rubric_and_model_changes_miss(self, request_, model_deployment):
+        assert _key(request_, model_deployment) != _key(_request())
+
+    def test_another_repository_with_identical_evidence_misses(self):
+        other = _request().model_copy(
+            update={"message": 'grade this {"repository": "someone-else/api"}'}
+        )
+        assert _key(other) != _key(_request())
+
+    def test_system_prompt_changes_miss(self):
+        assert _key(_request(), system_prompt="A new persona.") != _key(_request())
+
+
+def _decision() -> LLMGradingDecision:
+    return LLMGradingDecision(
+        passed=True,
+        score=0.9,
+        confidence=0.8,
+        feedback="Solid API implementation.",
+        evidence_refs=["app/main.py"],
+    )
+
+
+def _use_config(monkeypatch, **kwargs) -> None:
+    settings = type("Settings", (), {"grading_cache": GradingCacheConfig(**kwargs)})
+    monkeypatch.setattr(grading_cache, "get_worker_settings", lambda: settings)
+
+
+@pytest.mark.integration
+class TestGradingDecisionRoundTrip:
+    async def test_stored_decision_is_returned_for_identical_evidence(
+        self, test_engine: AsyncEngine
+    ):
+        session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+        kwargs = {
+            "model_deployment": "gpt",
+            "system_prompt": SYSTEM_PROMPT,
+            "session_maker": session_maker,
+        }
+
+        assert await get_cached_grading_decision(_request(), **kwargs) is None
+        await store_grading_decision(_request(), _decision(), **kwargs)
+
+        assert await get_cached_grading_decision(_request(), **kwargs) == _decision()
+        assert (
+            await get_cached_grading_decision(
+                _request(),
+                model_deployment="gpt-mini",
+                system_prompt=SYSTEM_PROMPT,
+                session_maker=session_maker,
+            )
+            is None
+        )
+
+    async def test_bypass_skips_lookup_but_still_stores(
+        self, test_engine: AsyncEngine, monkeypatch
+    ):
+        session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+        kwargs = {
+            "model_deployment": "gpt",
+            "system_prompt": SYSTEM_PROMPT,
+            "session_maker": session_maker,
+        }
+        _use_config(monkeypatch, bypass=True)
+
+        await store_grading_decision(_request(), _decision(), **kwargs)
+        assert await get_cached_grading_decision(_request(), **kwargs) is None
+
+        _use_config(monkeypatch)
+        assert await get_cached_grading_decision(_request(), **kwargs) == _decision()
+
+    async def test_zero_ttl_disables_the_cache(
+        self, test_engine: AsyncEngine, monkeypatch
+    ):
+        session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+        kwargs = {
+            "model_deployment": "gpt",
+            "system_prompt": SYSTEM_PROMPT,
+            "session_maker": session_maker,
+        }
+        _use_config(monkeypatch, ttl_seconds=0)
+
+        await store_grading_decision(_request(), _decision(), **kwargs)
+        _use_config(monkeypatch)
+
+        assert await get_cached_grading_decision(_request(), **kwargs) is None
@@ -0,0 +1,278 @@
+"""Tests for the tarball-backed RepoFiles adapter."""
+
+import asyncio
+import gzip
+import io
+import random
+import tarfile
+
+import httpx
+import pytest
+
+from learn_to_cloud_shared.verification import repo_archive
+from learn_to_cloud_shared.verification.evidence import collect_repo_pattern_evidence
+from learn_to_cloud_shared.verification.repo_archive import GitHubArchiveRepoFiles
+from learn_to_cloud_shared.verification.repo_files import InMemoryRepoFiles
+from learn_to_cloud_shared.verification.tasks.base import (
+    EvidencePolicy,
+    FilePresenceGraderConfig,
+    VerificationTask,
+)
+
+PREFIX = "learner-devops-repo-abc123"
+
+
+def _tarball(files: dict[str, bytes], *, fmt: int = tarfile.PAX_FORMAT) -> bytes:
+    """Build a GitHub-style gzipped tarball with one top-level directory."""
+    raw = io.BytesIO()
+    with tarfile.open(fileobj=raw, mode="w", format=fmt) as archive:
+        top = tarfile.TarInfo(PREFIX)
+        top.type = tarfile.DIRTYPE
+        archive.addfile(top)
+        for path, content in files.items():
+            info = tarfile.TarInfo(f"{PREFIX}/{path}")
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return gzip.compress(raw.getvalue())
+
+
+class _Fallback(InMemoryRepoFiles):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.file_reads: list[str] = []
+
+    async def file(self, owner, repo, path, branch="main"):
+        self.file_reads.append(path)
+        return await super().file(owner, repo, path, branch)
+
+
+def _adapter(
+    monkeypatch: pytest.MonkeyPatch,
+    payload: bytes,
+    *,
+    fallback: InMemoryRepoFiles | None = None,
+    patterns: tuple[str, ...] = ("Dockerfile", "k8s/"),
+    max_file_size_bytes: int = 1024,
+    max_total_bytes: int = 4096,
+    status_code: int = 200,
+) -> tuple[GitHubArchiveRepoFiles, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        async def chunks():
+            # Small chunks exercise incremental inflation across reads.
+            for i in range(0, len(payload), 97):
+                yield payload[i : i + 97]
+
+        return httpx.Response(status_code, content=chunks())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def get_client() -> httpx.AsyncClient:
+        return client
+
+    monkeypatch.setattr(repo_archive, "get_github_client", get_client)
+    adapter = GitHubArchiveRepoFiles(
+        patterns,
+        max_file_size_bytes=max_file_size_bytes,
+        max_total_bytes=max_total_bytes,
+        fallback=fallback or _Fallback(),
+    )
+    return adapter, requests
+
+
+@pytest.mark.asyncio
+async def test_tree_and_matching_files_come_from_one_download(monkeypatch):
+    payload = _tarball(
+        {
+            "Dockerfile": b"FROM python:3.12-slim",
+            "k8s/deployment.yaml": b"kind: Deployment",
+            "README.md": b"# readme",
+        }
+    )
+    fallback = _Fallback()
+    adapter, requests = _adapter(monkeypatch, payload, fallback=fallback)
+
+    assert await adapter.tree("learner", "devops-repo", "abc123") == [
+        "Dockerfile",
+        "k8s/deployment.yaml",
+        "README.md",
+    ]
+    assert await adapter.file("learner", "devops-repo", "Dockerfile", "abc123") == (
+        "FROM python:3.12-slim"
+    )
+    assert (
+        await adapter.file("learner", "devops-repo", "k8s/deployment.yaml", "abc123")
+        == "kind: Deployment"
+    )
+    assert await adapter.file("learner", "devops-repo", "nope.txt", "abc123") is None
+
+    assert len(requests) == 1
+    assert requests[0].url.path == "/repos/learner/devops-repo/tarball/abc123"
+    assert fallback.file_reads == []
+
+
+@pytest.mark.asyncio
+async def test_unretained_members_are_read_through_the_fallback(monkeypatch):
+    payload = _tarball({"README.md": b"# readme", "k8s/a.yaml": b"a" * 300})
+    fallback = _Fallback({"README.md": "# from fallback", "k8s/a.yaml": "fallback"})
+    adapter, _ = _adapter(monkeypatch, payload, fallback=fallback, max_total_bytes=100)
+
+    # Not matched by a pattern, and over the retained-bytes budget.
+    assert await adapter.file("o", "r", "README.md") == "# from fallback"
+    assert await adapter.file("o", "r", "k8s/a.yaml") == "fallback"
+    assert fallback.file_reads == ["README.md", "k8s/a.yaml"]
+
+
+@pytest.mark.asyncio
+async def test_oversized_member_is_cut_one_byte_past_the_file_cap(monkeypatch):
+    payload = _tarball({"Dockerfile": b"x" * 5000})
+    adapter, _ = _adapter(monkeypatch, payload, max_file_size_bytes=10)
+
+    assert await adapter.file("o", "r", "Dockerfile") == "x" * 11
+
+
+@pytest.mark.asyncio
+async def test_long_gnu_names_are_resolved(monkeypatch):
+    long_path = "k8s/" + "nested/" * 20 + "service.yaml"
+    payload = _tarball({long_path: b"kind: Service"}, fmt=tarfile.GNU_FORMAT)
+    adapter, _ = _adapter(monkeypatch, payload)
+
+    assert await adapter.tree("o", "r") == [long_path]
+    assert await adapter.file("o", "r", long_path) == "kind: Service"
+
+
+@pytest.mark.asyncio
+async def test_missing_repository_raises_from_tree_and_falls_back_for_files(
+    monkeypatch,
+):
+    fallback = _Fallback({"Dockerfile": "FROM scratch"})
+    adapter, _ = _adapter(monkeypatch, b"", fallback=fallback, status_code=404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await adapter.tree("o", "r")
+    assert await adapter.file("o", "r", "Dockerfile") == "FROM scratch"
+
+
+@pytest.mark.asyncio
+async def test_corrupt_archive_falls_back_once(monkeypatch):
+    fallback = _Fallback(tree=["Dockerfile"])
+    adapter, requests = _adapter(monkeypatch, b"not a gzip stream", fallback=fallback)
+
+    assert await adapter.tree("o", "r") == ["Dockerfile"]
+    assert await adapter.tree("o", "r") == ["Dockerfile"]
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("record", [b"1x path=Dockerfile\n", b"0 path=Dockerfile\n"])
+async def test_malformed_pax_header_falls_back(monkeypatch, record):
+    raw = io.BytesIO()
+    with tarfile.open(fileobj=raw, mode="w", format=tarfile.GNU_FORMAT) as archive:
+        header = tarfile.TarInfo("././@PaxHeader")
+        header.type = tarfile.XHDTYPE
+        header.size = len(record)
+        archive.addfile(header, io.BytesIO(record))
+        info = tarfile.TarInfo(f"{PREFIX}/Dockerfile")
+        info.size = 4
+        archive.addfile(info, io.BytesIO(b"FROM"))
+    fallback = _Fallback({"Dockerfile": "FROM scratch"}, tree=["Dockerfile"])
+    adapter, requests = _adapter(
+        monkeypatch, gzip.compress(raw.getvalue()), fallback=fallback
+    )
+
+    assert await adapter.tree("o", "r") == ["Dockerfile"]
+    assert await adapter.file("o", "r", "Dockerfile") == "FROM scratch"
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_truncated_archive_falls_back(monkeypatch):
+    payload = _tarball(
+        {
+            "Dockerfile": b"FROM python:3.12-slim",
+            "README.md": random.Random(0).randbytes(20_000),
+            "k8s/service.yaml": b"kind: Service",
+        }
+    )
+    fallback = _Fallback(
+        {"k8s/service.yaml": "kind: Service"},
+        tree=["Dockerfile", "README.md", "k8s/service.yaml"],
+    )
+    adapter, _ = _adapter(monkeypatch, payload[: len(payload) // 2], fallback=fallback)
+
+    assert await adapter.tree("o", "r") == [
+        "Dockerfile",
+        "README.md",
+        "k8s/service.yaml",
+    ]
+    assert await adapter.file("o", "r", "k8s/service.yaml") == "kind: Service"
+    assert fallback.file_reads == ["k8s/service.yaml"]
+
+
+@pytest.mark.asyncio
+async def test_downloads_of_different_refs_do_not_wait_on_each_other(monkeypatch):
+    release_slow = asyncio.Event()
+    payload = _tarball({"Dockerfile": b"FROM scratch"})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        async def chunks():
+            if request.url.path.endswith("/slow"):
+                await release_slow.wait()
+            yield payload
+
+        return httpx.Response(200, content=chunks())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def get_client() -> httpx.AsyncClient:
+        return client
+
+    monkeypatch.setattr(repo_archive, "get_github_client", get_client)
+    adapter = GitHubArchiveRepoFiles(
+        ("Dockerfile",),
+        max_file_size_bytes=1024,
+        max_total_bytes=4096,
+        fallback=_Fallback(),
+    )
+
+    slow = asyncio.create_task(adapter.tree("o", "r", "slow"))
+    await asyncio.sleep(0)
+    assert await asyncio.wait_for(adapter.tree("o", "r", "fast"), 1) == ["Dockerfile"]
+    assert not slow.done()
+    release_slow.set()
+    assert await slow == ["Dockerfile"]
+
+
+@pytest.mark.asyncio
+async def test_pattern_evidence_collects_from_the_archive(monkeypatch):
+    payload = _tarball(
+        {
+            "Dockerfile": b"FROM python:3.12-slim",
+            "k8s/service.yaml": b"kind: Service",
+            "src/app.py": b"print('hi')",
+        }
+    )
+    fallback = _Fallback()
+    adapter, requests = _adapter(monkeypatch, payload, fallback=fallback)
+    task = VerificationTask(
+        id="task-1",
+        phase_id=5,
+        name="Test task",
+        evidence=EvidencePolicy(
+            source="repo_files",
+            path_patterns=["Dockerfile", "k8s/"],
+            max_files=10,
+            max_file_size_bytes=1024,
+            max_total_bytes=4096,
+        ),
+        grader=FilePresenceGraderConfig(),
+    )
+
+    bundle = await collect_repo_pattern_evidence(adapter, "o", "r", task)
+
+    assert [item.path for item in bundle.items] == ["Dockerfile", "k8s/service.yaml"]
+    assert len(requests) == 1
+    assert fallback.file_reads == []
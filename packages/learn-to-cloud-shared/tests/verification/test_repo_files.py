@@ -0,0 +1,104 @@
+"""Tests for the per-run memoizing RepoFiles wrapper."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from learn_to_cloud_shared.verification.repo_files import (
+    CachingRepoFiles,
+    InMemoryRepoFiles,
+)
+
+
+class _CountingRepoFiles(InMemoryRepoFiles):
+    """In-memory adapter that records the refs each read was made against."""
+
+    def __init__(self, *args, head_sha: str | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.head_sha = head_sha
+        self.tree_refs: list[str] = []
+        self.file_reads: list[tuple[str, str]] = []
+        self.resolve_calls = 0
+
+    async def resolve_ref(self, owner: str, repo: str, branch: str) -> str:
+        self.resolve_calls += 1
+        if self.head_sha is None:
+            request = httpx.Request("GET", "https://api.github.com")
+            raise httpx.HTTPStatusError(
+                "not found", request=request, response=httpx.Response(404)
+            )
+        return self.head_sha
+
+    async def tree(self, owner: str, repo: str, branch: str = "main") -> list[str]:
+        self.tree_refs.append(branch)
+        return await super().tree(owner, repo, branch)
+
+    async def file(
+        self, owner: str, repo: str, path: str, branch: str = "main"
+    ) -> str | None:
+        self.file_reads.append((path, branch))
+        return await super().file(owner, repo, path, branch)
+
+
+@pytest.mark.asyncio
+async def test_tree_and_files_are_fetched_once_against_pinned_sha():
+    inner = _CountingRepoFiles({"a.py": "a", "b.py": "b"}, head_sha="abc123")
+    cached = CachingRepoFiles(inner)
+
+    assert await cached.tree("o", "r") == ["a.py", "b.py"]
+    assert await cached.tree("o", "r", "main") == ["a.py", "b.py"]
+    assert await cached.file("o", "r", "a.py") == "a"
+    assert await cached.file("o", "r", "a.py") == "a"
+    assert await cached.file("o", "r", "missing.py") is None
+    assert await cached.file("o", "r", "missing.py") is None
+
+    assert inner.resolve_calls == 1
+    assert inner.tree_refs == ["abc123"]
+    assert inner.file_reads == [("a.py", "abc123"), ("missing.py", "abc123")]
+    assert (cached.hits, cached.misses) == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_fetch():
+    inner = _CountingRepoFiles({"a.py": "a"}, head_sha="abc123")
+    cached = CachingRepoFiles(inner)
+
+    trees = await asyncio.gather(cached.tree("o", "r"), cached.tree("o", "r"))
+    files = await asyncio.gather(
+        cached.file("o", "r", "a.py"), cached.file("o", "r", "a.py")
+    )
+
+    assert trees == [["a.py"], ["a.py"]]
+    assert files == ["a", "a"]
+    assert inner.resolve_calls == 1
+    assert inner.tree_refs == ["abc123"]
+    assert inner.file_reads == [("a.py", "abc123")]
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_ref_falls_back_to_branch_name():
+    inner = _CountingRepoFiles({"a.py": "a"})
+    cached = CachingRepoFiles(inner)
+
+    await cached.tree("o", "r")
+    await cached.file("o", "r", "a.py")
+
+    assert inner.resolve_calls == 1
+    assert inner.tree_refs == ["main"]
+    assert inner.file_reads == [("a.py", "main")]
+
+
+@pytest.mark.asyncio
+async def test_tree_errors_are_not_cached():
+    request = httpx.Request("GET", "https://api.github.com")
+    error = httpx.HTTPStatusError(
+        "not found", request=request, response=httpx.Response(404)
+    )
+    cached = CachingRepoFiles(InMemoryRepoFiles(tree_error=error))
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await cached.tree("o", "r")
+
+    assert cached.misses == 2
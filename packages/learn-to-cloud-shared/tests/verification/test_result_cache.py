@@ -0,0 +1,93 @@
+"""Tests for memoized verification run results."""
+
+from uuid import uuid4
+
+import pytest
+
+from learn_to_cloud_shared.schemas import ValidationResult
+from learn_to_cloud_shared.submission_values import SubmittedValue
+from learn_to_cloud_shared.testing.requirement_factories import (
+    career_reflection_requirement,
+)
+from learn_to_cloud_shared.verification.result_cache import (
+    InMemoryVerificationResultCache,
+    result_cache_key,
+)
+from learn_to_cloud_shared.verification_workflow import (
+    PreparedVerificationAttempt,
+    VerificationRunResult,
+)
+
+REQUIREMENT = career_reflection_requirement(slug="career-reflection")
+
+
+def _job(
+    text: str = "My reflection.",
+    username: str | None = "learner",
+    requirement=REQUIREMENT,
+):
+    return PreparedVerificationAttempt(
+        id=uuid4(),
+        user_id=1,
+        github_username=username,
+        requirement=requirement,
+        submitted_value=SubmittedValue.from_raw(requirement, text),
+    )
+
+
+def _run(is_valid: bool) -> VerificationRunResult:
+    return VerificationRunResult(
+        attempt=_job(),
+        validation_result=ValidationResult(is_valid=is_valid, message="done"),
+        evidence=None,
+    )
+
+
+@pytest.mark.unit
+class TestInMemoryVerificationResultCache:
+    @pytest.mark.asyncio
+    async def test_failures_expire_before_passes(self):
+        now = 0.0
+        cache = InMemoryVerificationResultCache(
+            10, success_ttl=100, failure_ttl=10, timer=lambda: now
+        )
+        passed, failed = _run(True), _run(False)
+        await cache.set("pass", passed)
+        await cache.set("fail", failed)
+
+        now = 5.0
+        assert await cache.get("pass") is passed
+        assert await cache.get("fail") is failed
+
+        now = 50.0
+        assert await cache.get("pass") is passed
+        assert await cache.get("fail") is None
+
+        now = 150.0
+        assert await cache.get("pass") is None
+
+
+@pytest.mark.unit
+class TestResultCacheKey:
+    def test_identical_resubmission_shares_a_key(self):
+        assert result_cache_key(
+            _job(), head_sha="abc", profile_version=1
+        ) == result_cache_key(_job(), head_sha="abc", profile_version=1)
+
+    @pytest.mark.parametrize(
+        ("job", "head_sha", "profile_version"),
+        [
+            (_job(text="Another reflection."), "abc", 1),
+            (_job(username="someone-else"), "abc", 1),
+            (_job(requirement=career_reflection_requirement()), "abc", 1),
+            (_job(), "def", 1),
+            (_job(), None, 1),
+            (_job(), "abc", 2),
+        ],
+    )
+    def test_any_input_change_misses(self, job, head_sha, profile_version):
+        baseline = result_cache_key(_job(), head_sha="abc", profile_version=1)
+        assert (
+            result_cache_key(job, head_sha=head_sha, profile_version=profile_version)
+            != baseline
+        )